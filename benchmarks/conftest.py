@@ -0,0 +1,82 @@
+"""Shared fixtures for the hot-path benchmark suite.
+
+Run with ``pytest benchmarks``; the suite is kept out of ``tests/`` so the
+functional run stays fast. Each benchmark records latency percentiles and
+allocation figures in ``extra_info``, which pytest-benchmark includes in its
+JSON output (``--benchmark-json``) and saved runs.
+"""
+
+import sys
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+from unittest.mock import patch
+
+import pytest
+
+from etsy_python.v3.resources.Session import EtsyClient
+
+# scripts/ is not a package; put it on the path so we can import the mock server.
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import mock_server  # noqa: E402
+
+PERCENTILES = (50, 95, 99)
+
+
+def _percentile(ordered, pct):
+    index = min(int(round(pct / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def record_allocations(benchmark, func: Callable[[], Any]) -> None:
+    """Run ``func`` once under tracemalloc and store block count and peak bytes."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        func()
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    benchmark.extra_info["alloc_blocks"] = sum(max(s.count_diff, 0) for s in stats)
+    benchmark.extra_info["alloc_peak_bytes"] = peak
+
+
+@pytest.fixture
+def measure(benchmark):
+    """Benchmark ``func`` and add throughput, percentiles and allocations."""
+
+    def run(func: Callable[[], Any], *, rounds: int = 200) -> Any:
+        result = benchmark.pedantic(func, rounds=rounds, iterations=1, warmup_rounds=5)
+        if benchmark.stats is None:
+            # --benchmark-disable: func ran once as a smoke test, nothing to record.
+            return result
+        data = sorted(benchmark.stats.stats.data)
+        for pct in PERCENTILES:
+            benchmark.extra_info[f"p{pct}_us"] = round(_percentile(data, pct) * 1e6, 2)
+        benchmark.extra_info["ops_per_sec"] = round(1 / benchmark.stats.stats.mean, 1)
+        record_allocations(benchmark, func)
+        return result
+
+    return run
+
+
+@pytest.fixture(scope="session")
+def stub_server():
+    with mock_server.MockEtsyServer(limit_per_second=10**9, limit_per_day=10**9) as server:
+        yield server
+
+
+@pytest.fixture
+def stub_client(stub_server):
+    with patch("etsy_python.v3.resources.Session.environment") as env:
+        env.request_url = stub_server.request_url
+        env.token_url = stub_server.token_url
+        yield EtsyClient(
+            "bench-key", "12345678.bench-token", "bench-refresh", expiry=datetime(2999, 1, 1)
+        )
@@ -0,0 +1,138 @@
+import json
+
+import requests
+
+from etsy_python.v3.common.Utils import generate_get_uri, todict
+from etsy_python.v3.enums.Listing import Includes
+from etsy_python.v3.models.Listing import UpdateListingInventoryRequest
+from etsy_python.v3.models.Product import Product
+from etsy_python.v3.resources.Listing import ListingResource
+from etsy_python.v3.resources.enums.Request import Method
+
+
+def _inventory_request(products: int = 400) -> UpdateListingInventoryRequest:
+    return UpdateListingInventoryRequest(
+        products=[
+            Product(
+                sku=f"SKU-{n}",
+                property_values=[
+                    {
+                        "property_id": 200,
+                        "value_ids": [n],
+                        "property_name": "Color",
+                        "values": [f"Color {n}"],
+                    },
+                    {
+                        "property_id": 100,
+                        "value_ids": [n % 7],
+                        "property_name": "Size",
+                        "values": [f"Size {n % 7}"],
+                    },
+                ],
+                offerings=[{"price": 12.5, "quantity": 3, "is_enabled": True}],
+            )
+            for n in range(products)
+        ],
+        price_on_property=[200],
+        quantity_on_property=[200, 100],
+        sku_on_property=[200, 100],
+    )
+
+
+def _raw_response(body: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(body).encode("utf-8")
+    response.headers.update(
+        {
+            "X-Limit-Per-Second": "10",
+            "X-Remaining-This-Second": "9",
+            "X-Limit-Per-Day": "10000",
+            "X-Remaining-Today": "9000",
+        }
+    )
+    return response
+
+
+LISTING_QUERY = {
+    "state": "active",
+    "limit": 100,
+    "offset": 2500,
+    "keywords": "handmade ceramic mug",
+    "sort_on": "updated",
+    "sort_order": "desc",
+    "is_safe": True,
+    "min_price": 10.0,
+    "max_price": None,
+    "listing_ids": ",".join(str(n) for n in range(100)),
+    "includes": "Images,Inventory",
+}
+
+
+class TestSerialization:
+    def test_get_dict_large_inventory(self, measure):
+        request = _inventory_request()
+        result = measure(request.get_dict)
+        assert len(result["products"]) == 400
+
+    def test_todict_large_inventory(self, measure):
+        request = _inventory_request()
+        measure(lambda: todict(request))
+
+
+LISTING_URL = "https://openapi.etsy.com/v3/application/listings"
+
+
+def _legacy_generate_get_uri(uri, params=None):
+    # The f-string encoder generate_get_uri replaced; kept as the baseline.
+    if not params:
+        return uri
+    formatted = "&".join(
+        f"{key}={str(value).lower() if isinstance(value, bool) else value}"
+        for key, value in params.items()
+        if value is not None
+    )
+    return f"{uri}?{formatted}" if formatted else uri
+
+
+class TestQueryString:
+    def test_generate_get_uri(self, measure):
+        measure(lambda: generate_get_uri(LISTING_URL, LISTING_QUERY), rounds=2000)
+
+    def test_legacy_generate_get_uri(self, measure):
+        measure(lambda: _legacy_generate_get_uri(LISTING_URL, LISTING_QUERY), rounds=2000)
+
+    def test_generate_get_uri_raw_values(self, measure):
+        query = dict(
+            LISTING_QUERY,
+            listing_ids=list(range(100)),
+            includes=[Includes.IMAGES, Includes.INVENTORY],
+            keywords="mugs & cups #1",
+        )
+        measure(lambda: generate_get_uri(LISTING_URL, query), rounds=2000)
+
+
+class TestDecoding:
+    def test_process_request_receipts_page(self, measure, stub_client):
+        receipt = {"receipt_id": 1, "transactions": [{"transaction_id": n} for n in range(5)]}
+        body = {"count": 100, "results": [dict(receipt, receipt_id=n) for n in range(100)]}
+
+        def decode():
+            return stub_client._process_request(_raw_response(body))
+
+        assert measure(decode).code == 200
+
+
+class TestEndToEnd:
+    def test_make_request_get_listing(self, measure, stub_client):
+        resource = ListingResource(session=stub_client)
+        assert measure(lambda: resource.get_listing(42)).code == 200
+
+    def test_make_request_update_inventory(self, measure, stub_client):
+        request = _inventory_request(products=50)
+        result = measure(
+            lambda: stub_client.make_request(
+                "/listings/42/inventory", method=Method.PUT, payload=request
+            )
+        )
+        assert result.code == 200
@@ -0,0 +1,24 @@
+"""Cold-start cost of importing the SDK, measured in a fresh interpreter."""
+
+import subprocess
+import sys
+
+import pytest
+
+IMPORTS = {
+    "package": "import etsy_python",
+    "single_resource": "from etsy_python.v3.resources import ListingResource",
+    "resource_module": "import etsy_python.v3.resources.Receipt",
+    "auth": "from etsy_python.v3.auth import EtsyOAuth",
+}
+
+
+def _run(statement: str) -> None:
+    subprocess.run([sys.executable, "-c", statement], check=True)
+
+
+@pytest.mark.parametrize("name", list(IMPORTS))
+def test_cold_import(benchmark, name):
+    statement = IMPORTS[name]
+    benchmark.extra_info["statement"] = statement
+    benchmark.pedantic(_run, args=(statement,), rounds=10, iterations=1, warmup_rounds=1)
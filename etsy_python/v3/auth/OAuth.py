@@ -1,12 +1,22 @@
 from base64 import urlsafe_b64encode
 from hashlib import sha256 as hash_sha256
 from secrets import token_urlsafe
-from typing import List, Optional, Tuple
-
-from requests_oauthlib import OAuth2Session
+from typing import Any, List, Optional, Tuple
 
 from etsy_python.v3.common.Env import environment
 
+# requests_oauthlib (and oauthlib under it) is only needed for the
+# authorisation flow, so it is imported on first use rather than with the
+# package.
+OAuth2Session: Any = None
+
+
+def _oauth2_session_class() -> Any:
+    global OAuth2Session
+    if OAuth2Session is None:
+        from requests_oauthlib import OAuth2Session
+    return OAuth2Session
+
 
 class EtsyOAuth:
     def __init__(
@@ -22,7 +32,7 @@ class EtsyOAuth:
         self.scopes = scopes
         self.code_verifier = token_urlsafe(32) if not code_verifier else ""
         self.code_challenge = EtsyOAuth._generate_challenge(self.code_verifier)
-        self.oauth = OAuth2Session(
+        self.oauth = _oauth2_session_class()(
             keystring, redirect_uri=self.redirect_url, scope=scopes
         )
         self.state = token_urlsafe(16) if state is None else state
@@ -0,0 +1,329 @@
+import argparse
+import csv
+import json
+import os
+import sys
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from enum import Enum
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from etsy_python.v3.common.Pagination import iterate_pages
+from etsy_python.v3.enums.ShopReceipt import SortOn, SortOrder
+from etsy_python.v3.resources.PaymentLedgerEntry import PaymentLedgeEntryResource
+from etsy_python.v3.resources.Receipt import ReceiptResource
+from etsy_python.v3.resources.Session import EtsyClient
+
+
+class ExportFormat(Enum):
+    CSV = "csv"
+    JSONL = "jsonl"
+    PARQUET = "parquet"
+
+
+def flatten_record(record: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested objects into ``parent_child`` columns.
+
+    Money objects become ``grandtotal_amount``/``grandtotal_divisor``/... and
+    lists (transactions, shipments, adjustments) are kept as JSON strings so
+    every row has scalar columns.
+    """
+    row: Dict[str, Any] = {}
+    for key, value in record.items():
+        column = f"{prefix}{key}"
+        if isinstance(value, dict):
+            row.update(flatten_record(value, prefix=f"{column}_"))
+        elif isinstance(value, list):
+            row[column] = json.dumps(value)
+        else:
+            row[column] = value
+    return row
+
+
+class ExportWriter(ABC):
+    """Incremental row sink; rows are written per page and never accumulated."""
+
+    def __init__(self, stream: IO, columns: Optional[Sequence[str]] = None) -> None:
+        self.stream = stream
+        self.columns = list(columns) if columns is not None else None
+        self.rows_written = 0
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        if self.columns is None:
+            self.columns = list(rows[0].keys())
+        self._write(rows)
+        self.rows_written += len(rows)
+
+    @abstractmethod
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        """Write one non-empty batch of rows."""
+
+    def close(self) -> None:
+        self.stream.flush()
+
+    def __enter__(self) -> "ExportWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class CsvExportWriter(ExportWriter):
+    """CSV writer; the header comes from ``columns`` or the first row seen.
+
+    Keys absent from the header are dropped and missing keys are left blank, so
+    the column set stays fixed for the whole file.
+    """
+
+    def __init__(self, stream: IO, columns: Optional[Sequence[str]] = None) -> None:
+        super().__init__(stream, columns)
+        self._writer: Optional[csv.DictWriter] = None
+
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        if self._writer is None:
+            self._writer = csv.DictWriter(
+                self.stream, fieldnames=self.columns, extrasaction="ignore"
+            )
+            self._writer.writeheader()
+        self._writer.writerows(rows)
+
+
+class JsonlExportWriter(ExportWriter):
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        for row in rows:
+            if self.columns is not None:
+                row = {column: row.get(column) for column in self.columns}
+            self.stream.write(json.dumps(row))
+            self.stream.write("\n")
+
+
+class ParquetExportWriter(ExportWriter):
+    """Parquet writer buffering ``batch_size`` rows per row group.
+
+    Requires the optional ``pyarrow`` dependency. Memory is bounded by the batch
+    size, not the export size. Pass ``schema`` to fix the column types;
+    otherwise they are inferred from the first batch, and columns that are
+    empty throughout it are written as strings (non-string values JSON-encoded)
+    since the file's schema cannot change once the first row group is out.
+    """
+
+    def __init__(
+        self,
+        stream: IO,
+        columns: Optional[Sequence[str]] = None,
+        batch_size: int = 10000,
+        schema: Any = None,
+    ) -> None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError(
+                "Parquet export requires pyarrow: pip install pyarrow"
+            ) from e
+        if columns is None and schema is not None:
+            columns = schema.names
+        super().__init__(stream, columns)
+        self._pyarrow = pyarrow
+        self._parquet = pyarrow.parquet
+        self.batch_size = batch_size
+        self.schema = schema
+        self._buffer: List[Dict[str, Any]] = []
+        self._writer: Any = None
+        self._stringified: Set[str] = set()
+
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        self._buffer.extend(rows)
+        if len(self._buffer) >= self.batch_size:
+            self._flush()
+
+    def _infer_schema(self, batch: List[Dict[str, Any]]) -> Any:
+        pa = self._pyarrow
+        fields = []
+        for field in pa.Table.from_pylist(batch).schema:
+            if pa.types.is_null(field.type):
+                self._stringified.add(field.name)
+                field = field.with_type(pa.string())
+            fields.append(field)
+        return pa.schema(fields)
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        batch = [{column: row.get(column) for column in self.columns} for row in self._buffer]
+        if self._writer is None:
+            schema = self.schema if self.schema is not None else self._infer_schema(batch)
+            self._writer = self._parquet.ParquetWriter(self.stream, schema)
+        for row in batch:
+            for column in self._stringified:
+                value = row[column]
+                if value is not None and not isinstance(value, str):
+                    row[column] = json.dumps(value)
+        table = self._pyarrow.Table.from_pylist(batch, schema=self._writer.schema)
+        self._writer.write_table(table)
+        self._buffer = []
+
+    def close(self) -> None:
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+        super().close()
+
+
+_WRITERS = {
+    ExportFormat.CSV: CsvExportWriter,
+    ExportFormat.JSONL: JsonlExportWriter,
+    ExportFormat.PARQUET: ParquetExportWriter,
+}
+
+
+def get_export_writer(
+    export_format: ExportFormat, stream: IO, columns: Optional[Sequence[str]] = None
+) -> ExportWriter:
+    return _WRITERS[export_format](stream, columns)
+
+
+def iterate_receipt_pages(
+    session: EtsyClient,
+    shop_id: int,
+    min_created: Optional[int] = None,
+    max_created: Optional[int] = None,
+    page_limit: int = 100,
+    **filters: Any,
+) -> Iterator[List[Dict[str, Any]]]:
+    # Oldest first, so receipts created during the export land on later pages
+    # instead of shifting the offsets of pages not yet read.
+    return iterate_pages(
+        ReceiptResource(session=session).get_shop_receipts,
+        shop_id,
+        min_created=min_created,
+        max_created=max_created,
+        limit=page_limit,
+        sort_on=SortOn.CREATED,
+        sort_order=SortOrder.ASC,
+        **filters,
+    )
+
+
+def iterate_ledger_entry_pages(
+    session: EtsyClient,
+    shop_id: int,
+    min_created: int,
+    max_created: int,
+    page_limit: int = 100,
+) -> Iterator[List[Dict[str, Any]]]:
+    return iterate_pages(
+        PaymentLedgeEntryResource(session=session).get_shop_payment_account_ledger_entries,
+        shop_id,
+        min_created=min_created,
+        max_created=max_created,
+        limit=page_limit,
+    )
+
+
+def write_pages(pages: Iterable[List[Dict[str, Any]]], writer: ExportWriter) -> int:
+    """Flatten and write each page as it arrives; returns the row count."""
+    with writer:
+        for page in pages:
+            writer.write_rows([flatten_record(record) for record in page])
+    return writer.rows_written
+
+
+def _open_output(path: str, export_format: ExportFormat) -> IO:
+    if export_format == ExportFormat.PARQUET:
+        return open(path, "wb")
+    return open(path, "w", newline="", encoding="utf-8")
+
+
+def export_receipts(
+    session: EtsyClient,
+    shop_id: int,
+    path: str,
+    export_format: ExportFormat = ExportFormat.CSV,
+    min_created: Optional[int] = None,
+    max_created: Optional[int] = None,
+    columns: Optional[Sequence[str]] = None,
+    **filters: Any,
+) -> int:
+    pages = iterate_receipt_pages(session, shop_id, min_created, max_created, **filters)
+    with _open_output(path, export_format) as stream:
+        return write_pages(pages, get_export_writer(export_format, stream, columns))
+
+
+def export_ledger_entries(
+    session: EtsyClient,
+    shop_id: int,
+    path: str,
+    min_created: int,
+    max_created: int,
+    export_format: ExportFormat = ExportFormat.CSV,
+    columns: Optional[Sequence[str]] = None,
+) -> int:
+    pages = iterate_ledger_entry_pages(session, shop_id, min_created, max_created)
+    with _open_output(path, export_format) as stream:
+        return write_pages(pages, get_export_writer(export_format, stream, columns))
+
+
+def month_bounds(month: str) -> Tuple[int, int]:
+    """``"2026-09"`` -> (first second, last second) of that UTC month as unix time."""
+    start = datetime.strptime(month, "%Y-%m").replace(tzinfo=timezone.utc)
+    if start.month == 12:
+        end = start.replace(year=start.year + 1, month=1)
+    else:
+        end = start.replace(month=start.month + 1)
+    return int(start.timestamp()), int(end.timestamp()) - 1
+
+
+def _client_from_environment() -> EtsyClient:
+    expiry = os.environ.get("ETSY_TOKEN_EXPIRY")
+    return EtsyClient(
+        keystring=os.environ["ETSY_KEYSTRING"],
+        access_token=os.environ["ETSY_ACCESS_TOKEN"],
+        refresh_token=os.environ["ETSY_REFRESH_TOKEN"],
+        expiry=datetime.fromisoformat(expiry) if expiry else datetime.now(tz=timezone.utc),
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Stream Etsy receipts or ledger entries to CSV, JSONL or Parquet. "
+        "Credentials are read from ETSY_KEYSTRING, ETSY_ACCESS_TOKEN, "
+        "ETSY_REFRESH_TOKEN and ETSY_TOKEN_EXPIRY (ISO 8601)."
+    )
+    parser.add_argument("dataset", choices=["receipts", "ledger-entries"])
+    parser.add_argument("--shop-id", type=int, required=True)
+    parser.add_argument("--output", required=True)
+    parser.add_argument(
+        "--format",
+        choices=[f.value for f in ExportFormat],
+        default=ExportFormat.CSV.value,
+    )
+    parser.add_argument("--month", help="UTC month to export, e.g. 2026-09")
+    parser.add_argument("--min-created", type=int)
+    parser.add_argument("--max-created", type=int)
+    args = parser.parse_args(argv)
+
+    min_created, max_created = args.min_created, args.max_created
+    if args.month:
+        min_created, max_created = month_bounds(args.month)
+    if args.dataset == "ledger-entries" and (min_created is None or max_created is None):
+        parser.error("ledger-entries requires --month or --min-created/--max-created")
+
+    session = _client_from_environment()
+    export_format = ExportFormat(args.format)
+    if args.dataset == "receipts":
+        count = export_receipts(
+            session, args.shop_id, args.output, export_format, min_created, max_created
+        )
+    else:
+        count = export_ledger_entries(
+            session, args.shop_id, args.output, min_created, max_created, export_format
+        )
+    print(f"Wrote {count} rows to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from etsy_python.v3.bulk.Export import iterate_ledger_entry_pages
+from etsy_python.v3.resources.Payment import PaymentResource
+from etsy_python.v3.resources.Session import EtsyClient
+
+# Etsy's id-list parameters accept at most 100 ids per call.
+MAX_BATCH_SIZE = 100
+
+
+def _reference(entry: Dict[str, Any]) -> Optional[int]:
+    try:
+        return int(entry.get("reference_id"))
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class LedgerEntryPayment:
+    entry: Dict[str, Any]
+    payment: Optional[Dict[str, Any]] = None
+    error: Optional[BaseException] = None
+
+
+class LedgerPaymentResolver:
+    """Join payment-account ledger entries to the payments behind them.
+
+    Entries are taken ``batch_size`` at a time and each batch costs one
+    ``get_payment_account_ledger_entry_payments`` call, with up to
+    ``max_workers`` batches in flight. Results are yielded in input order, so
+    a month of entries streams through with bounded memory. Payments do not
+    name their ledger entry; an entry is matched on its ``reference_id``,
+    which holds a receipt ID for ``reference_type == "receipt"`` and a
+    payment ID otherwise. Entries with no payment (fees, deposits) are
+    yielded with ``payment=None``.
+    """
+
+    def __init__(
+        self,
+        session: EtsyClient,
+        shop_id: int,
+        batch_size: int = MAX_BATCH_SIZE,
+        max_workers: int = 8,
+    ) -> None:
+        if not 0 < batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}")
+        self.session = session
+        self.shop_id = shop_id
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.payments = PaymentResource(session=session)
+
+    def _fetch(self, entry_ids: List[int]) -> List[Dict[str, Any]]:
+        response = self.payments.get_payment_account_ledger_entry_payments(
+            self.shop_id, entry_ids
+        )
+        message = response.message if isinstance(response.message, dict) else {}
+        return message.get("results") or []
+
+    @staticmethod
+    def _join(
+        batch: List[Dict[str, Any]], future: Future
+    ) -> Iterator[LedgerEntryPayment]:
+        try:
+            payments = future.result()
+        except Exception as e:
+            for entry in batch:
+                yield LedgerEntryPayment(entry, error=e)
+            return
+        by_payment = {payment.get("payment_id"): payment for payment in payments}
+        by_receipt = {payment.get("receipt_id"): payment for payment in payments}
+        for entry in batch:
+            reference = _reference(entry)
+            if entry.get("reference_type") == "receipt":
+                payment = by_receipt.get(reference)
+            else:
+                payment = by_payment.get(reference)
+            yield LedgerEntryPayment(entry, payment)
+
+    def resolve(self, entries: Iterable[Dict[str, Any]]) -> Iterator[LedgerEntryPayment]:
+        """Yield every entry of ``entries`` joined to its payment."""
+        entries = iter(entries)
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="etsy-ledger"
+        ) as executor:
+            pending: Deque[Tuple[List[Dict[str, Any]], Future]] = deque()
+            while True:
+                batch = list(islice(entries, self.batch_size))
+                if not batch:
+                    break
+                entry_ids = sorted({entry["entry_id"] for entry in batch})
+                pending.append((batch, executor.submit(self._fetch, entry_ids)))
+                if len(pending) >= self.max_workers:
+                    yield from self._join(*pending.popleft())
+            while pending:
+                yield from self._join(*pending.popleft())
+
+    def iterate(
+        self, min_created: int, max_created: int, page_limit: int = 100
+    ) -> Iterator[LedgerEntryPayment]:
+        """Stream ledger entries created in the window, joined to payments."""
+        pages = iterate_ledger_entry_pages(
+            self.session, self.shop_id, min_created, max_created, page_limit
+        )
+        return self.resolve(entry for page in pages for entry in page)
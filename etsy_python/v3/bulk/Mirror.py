@@ -0,0 +1,460 @@
+import json
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from etsy_python.v3.common.Pagination import iterate_pages
+from etsy_python.v3.enums.Listing import Includes, SortOn, SortOrder, State
+from etsy_python.v3.enums.ShopReceipt import (
+    SortOn as ReceiptSortOn,
+    SortOrder as ReceiptSortOrder,
+)
+from etsy_python.v3.resources.Listing import ListingResource
+from etsy_python.v3.resources.Receipt import ReceiptResource
+from etsy_python.v3.resources.Session import EtsyClient
+
+DEFAULT_LISTING_STATES = (
+    State.ACTIVE,
+    State.INACTIVE,
+    State.SOLD_OUT,
+    State.DRAFT,
+    State.EXPIRED,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (
+    listing_id INTEGER PRIMARY KEY,
+    state TEXT,
+    title TEXT,
+    quantity INTEGER,
+    price_amount INTEGER,
+    price_divisor INTEGER,
+    currency_code TEXT,
+    created_timestamp INTEGER,
+    updated_timestamp INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_listings_state ON listings (state);
+CREATE INDEX IF NOT EXISTS idx_listings_updated ON listings (updated_timestamp);
+
+CREATE TABLE IF NOT EXISTS inventory (
+    product_id INTEGER PRIMARY KEY,
+    listing_id INTEGER NOT NULL,
+    sku TEXT,
+    is_deleted INTEGER,
+    quantity INTEGER,
+    price_amount INTEGER,
+    price_divisor INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_inventory_listing ON inventory (listing_id);
+CREATE INDEX IF NOT EXISTS idx_inventory_sku ON inventory (sku);
+
+CREATE TABLE IF NOT EXISTS receipts (
+    receipt_id INTEGER PRIMARY KEY,
+    buyer_user_id INTEGER,
+    status TEXT,
+    is_paid INTEGER,
+    is_shipped INTEGER,
+    grandtotal_amount INTEGER,
+    grandtotal_divisor INTEGER,
+    currency_code TEXT,
+    created_timestamp INTEGER,
+    updated_timestamp INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_receipts_created ON receipts (created_timestamp);
+CREATE INDEX IF NOT EXISTS idx_receipts_updated ON receipts (updated_timestamp);
+CREATE INDEX IF NOT EXISTS idx_receipts_buyer ON receipts (buyer_user_id);
+
+CREATE TABLE IF NOT EXISTS transactions (
+    transaction_id INTEGER PRIMARY KEY,
+    receipt_id INTEGER NOT NULL,
+    listing_id INTEGER,
+    product_id INTEGER,
+    sku TEXT,
+    quantity INTEGER,
+    price_amount INTEGER,
+    price_divisor INTEGER,
+    created_timestamp INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_transactions_receipt ON transactions (receipt_id);
+CREATE INDEX IF NOT EXISTS idx_transactions_listing ON transactions (listing_id);
+CREATE INDEX IF NOT EXISTS idx_transactions_sku ON transactions (sku);
+CREATE INDEX IF NOT EXISTS idx_transactions_created ON transactions (created_timestamp);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    entity TEXT PRIMARY KEY,
+    watermark INTEGER NOT NULL
+);
+"""
+
+
+def _money(value: Optional[Dict[str, Any]]) -> Tuple[Any, Any, Any]:
+    if not isinstance(value, dict):
+        return None, None, None
+    return value.get("amount"), value.get("divisor"), value.get("currency_code")
+
+
+class ShopMirror:
+    """Local SQLite copy of a shop's listings, inventory, receipts and transactions.
+
+    The first :meth:`sync` bulk-loads everything; later calls only fetch records
+    modified since the last stored watermark. Deleted listings never show up in
+    an incremental sync; a full sync (``sync(full=True)``) drops them, so run
+    one periodically. Listings are pulled with their
+    inventory embedded (``includes=Inventory``) so no per-listing inventory calls
+    are made, and transactions are taken from the receipts that carry them.
+    Reporting then runs against the indexed local tables via the query helpers
+    or :meth:`query`.
+    """
+
+    def __init__(
+        self,
+        session: EtsyClient,
+        shop_id: int,
+        database: str = ":memory:",
+        listing_states: Sequence[State] = DEFAULT_LISTING_STATES,
+        page_limit: int = 100,
+    ) -> None:
+        self.session = session
+        self.shop_id = shop_id
+        self.listing_states = tuple(listing_states)
+        self.page_limit = page_limit
+        self.listing_resource = ListingResource(session=session)
+        self.receipt_resource = ReceiptResource(session=session)
+        self.connection = sqlite3.connect(database)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "ShopMirror":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # Sync
+
+    def sync(self, full: bool = False) -> Dict[str, int]:
+        """Refresh every table; returns the number of records written per table."""
+        listings, products = self.sync_listings(full=full)
+        receipts, transactions = self.sync_receipts(full=full)
+        return {
+            "listings": listings,
+            "inventory": products,
+            "receipts": receipts,
+            "transactions": transactions,
+        }
+
+    def sync_listings(self, full: bool = False) -> Tuple[int, int]:
+        watermark = None if full else self.get_watermark("listings")
+        newest = watermark or 0
+        listings_written = products_written = 0
+        present: Set[int] = set()
+        for state in self.listing_states:
+            pages = iterate_pages(
+                self.listing_resource.get_listings_by_shop,
+                self.shop_id,
+                state=state,
+                limit=self.page_limit,
+                sort_on=SortOn.UPDATED,
+                sort_order=SortOrder.DESC,
+                includes=[Includes.INVENTORY],
+            )
+            for page in pages:
+                # Sorted newest first: everything past the watermark is unchanged.
+                fresh = [
+                    listing
+                    for listing in page
+                    if watermark is None
+                    or (listing.get("updated_timestamp") or 0) >= watermark
+                ]
+                with self.connection:
+                    self._upsert_listings(fresh)
+                    products_written += self._replace_inventory(fresh)
+                listings_written += len(fresh)
+                for listing in fresh:
+                    present.add(listing["listing_id"])
+                    newest = max(newest, listing.get("updated_timestamp") or 0)
+                if len(fresh) < len(page):
+                    break
+        if watermark is None:
+            # Deleted listings simply stop being returned, so only a full pass
+            # can tell they are gone.
+            self._remove_listings_except(present)
+        if newest:
+            self.set_watermark("listings", newest)
+        return listings_written, products_written
+
+    def sync_receipts(self, full: bool = False) -> Tuple[int, int]:
+        # Paged by a moving ``min_last_modified`` cursor rather than by offset:
+        # a receipt updated mid-sync jumps to the tail and would shift every
+        # later record back past the current offset.
+        cursor = None if full else self.get_watermark("receipts")
+        seen: Set[int] = set()  # receipts already written at ``cursor``
+        offset = 0  # only non-zero while a run of ties fills whole pages
+        receipts_written = transactions_written = 0
+        while True:
+            response = self.receipt_resource.get_shop_receipts(
+                self.shop_id,
+                min_last_modified=cursor,
+                limit=self.page_limit,
+                offset=offset,
+                sort_on=ReceiptSortOn.UPDATED,
+                sort_order=ReceiptSortOrder.ASC,
+            )
+            message = response.message if isinstance(response.message, dict) else {}
+            page = message.get("results") or []
+            fresh = [receipt for receipt in page if receipt["receipt_id"] not in seen]
+            transactions = [
+                transaction
+                for receipt in fresh
+                for transaction in receipt.get("transactions") or []
+            ]
+            if page:
+                last = page[-1].get("updated_timestamp") or 0
+                if cursor is not None and last <= cursor:
+                    offset += len(page)
+                else:
+                    cursor, offset, seen = last, 0, set()
+                seen.update(
+                    receipt["receipt_id"]
+                    for receipt in page
+                    if (receipt.get("updated_timestamp") or 0) == cursor
+                )
+            with self.connection:
+                self._upsert_receipts(fresh)
+                self._upsert_transactions(transactions)
+                if cursor:
+                    self._store_watermark("receipts", cursor)
+            receipts_written += len(fresh)
+            transactions_written += len(transactions)
+            if len(page) < self.page_limit:
+                return receipts_written, transactions_written
+
+    def get_watermark(self, entity: str) -> Optional[int]:
+        row = self.connection.execute(
+            "SELECT watermark FROM sync_state WHERE entity = ?", (entity,)
+        ).fetchone()
+        return row["watermark"] if row is not None else None
+
+    def set_watermark(self, entity: str, watermark: int) -> None:
+        with self.connection:
+            self._store_watermark(entity, watermark)
+
+    def _store_watermark(self, entity: str, watermark: int) -> None:
+        self.connection.execute(
+            "INSERT INTO sync_state (entity, watermark) VALUES (?, ?) "
+            "ON CONFLICT(entity) DO UPDATE SET watermark = excluded.watermark",
+            (entity, watermark),
+        )
+
+    def _upsert_listings(self, listings: Iterable[Dict[str, Any]]) -> None:
+        rows = []
+        for listing in listings:
+            amount, divisor, currency = _money(listing.get("price"))
+            rows.append(
+                (
+                    listing["listing_id"],
+                    listing.get("state"),
+                    listing.get("title"),
+                    listing.get("quantity"),
+                    amount,
+                    divisor,
+                    currency,
+                    listing.get("created_timestamp"),
+                    listing.get("updated_timestamp"),
+                    json.dumps(listing),
+                )
+            )
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO listings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+        )
+
+    def _remove_listings_except(self, listing_ids: Set[int]) -> None:
+        stale = [
+            (row["listing_id"],)
+            for row in self.connection.execute("SELECT listing_id FROM listings")
+            if row["listing_id"] not in listing_ids
+        ]
+        with self.connection:
+            self.connection.executemany("DELETE FROM listings WHERE listing_id = ?", stale)
+            self.connection.executemany(
+                "DELETE FROM inventory WHERE listing_id = ?", stale
+            )
+
+    def _replace_inventory(self, listings: Iterable[Dict[str, Any]]) -> int:
+        rows = []
+        listing_ids = []
+        for listing in listings:
+            inventory = listing.get("inventory")
+            if not isinstance(inventory, dict):
+                continue
+            listing_ids.append((listing["listing_id"],))
+            for product in inventory.get("products") or []:
+                offerings = product.get("offerings") or [{}]
+                amount, divisor, _ = _money(offerings[0].get("price"))
+                rows.append(
+                    (
+                        product["product_id"],
+                        listing["listing_id"],
+                        product.get("sku"),
+                        int(bool(product.get("is_deleted"))),
+                        sum(offering.get("quantity") or 0 for offering in offerings),
+                        amount,
+                        divisor,
+                        json.dumps(product),
+                    )
+                )
+        self.connection.executemany(
+            "DELETE FROM inventory WHERE listing_id = ?", listing_ids
+        )
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO inventory VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+        )
+        return len(rows)
+
+    def _upsert_receipts(self, receipts: Iterable[Dict[str, Any]]) -> None:
+        rows = []
+        for receipt in receipts:
+            amount, divisor, currency = _money(receipt.get("grandtotal"))
+            rows.append(
+                (
+                    receipt["receipt_id"],
+                    receipt.get("buyer_user_id"),
+                    receipt.get("status"),
+                    int(bool(receipt.get("is_paid"))),
+                    int(bool(receipt.get("is_shipped"))),
+                    amount,
+                    divisor,
+                    currency,
+                    receipt.get("created_timestamp"),
+                    receipt.get("updated_timestamp"),
+                    json.dumps(receipt),
+                )
+            )
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO receipts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def _upsert_transactions(self, transactions: Iterable[Dict[str, Any]]) -> None:
+        rows = []
+        for transaction in transactions:
+            amount, divisor, _ = _money(transaction.get("price"))
+            rows.append(
+                (
+                    transaction["transaction_id"],
+                    transaction.get("receipt_id"),
+                    transaction.get("listing_id"),
+                    transaction.get("product_id"),
+                    transaction.get("sku"),
+                    transaction.get("quantity"),
+                    amount,
+                    divisor,
+                    transaction.get("created_timestamp"),
+                    json.dumps(transaction),
+                )
+            )
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO transactions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    # Queries
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        return [dict(row) for row in self.connection.execute(sql, params)]
+
+    def _documents(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        return [json.loads(row["data"]) for row in self.connection.execute(sql, params)]
+
+    def get_listing(self, listing_id: int) -> Optional[Dict[str, Any]]:
+        documents = self._documents(
+            "SELECT data FROM listings WHERE listing_id = ?", (listing_id,)
+        )
+        return documents[0] if documents else None
+
+    def get_listings(self, state: Optional[State] = None) -> List[Dict[str, Any]]:
+        if state is None:
+            return self._documents("SELECT data FROM listings ORDER BY listing_id")
+        return self._documents(
+            "SELECT data FROM listings WHERE state = ? ORDER BY listing_id",
+            (state.value,),
+        )
+
+    def get_inventory(self, listing_id: int) -> List[Dict[str, Any]]:
+        return self._documents(
+            "SELECT data FROM inventory WHERE listing_id = ? ORDER BY product_id",
+            (listing_id,),
+        )
+
+    def find_products_by_sku(self, sku: str) -> List[Dict[str, Any]]:
+        return self.query(
+            "SELECT product_id, listing_id, sku, quantity, price_amount, price_divisor "
+            "FROM inventory WHERE sku = ? AND is_deleted = 0",
+            (sku,),
+        )
+
+    def get_receipts(
+        self,
+        min_created: Optional[int] = None,
+        max_created: Optional[int] = None,
+        was_paid: Optional[bool] = None,
+        was_shipped: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        clauses, params = [], []
+        if min_created is not None:
+            clauses.append("created_timestamp >= ?")
+            params.append(min_created)
+        if max_created is not None:
+            clauses.append("created_timestamp <= ?")
+            params.append(max_created)
+        if was_paid is not None:
+            clauses.append("is_paid = ?")
+            params.append(int(was_paid))
+        if was_shipped is not None:
+            clauses.append("is_shipped = ?")
+            params.append(int(was_shipped))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._documents(
+            f"SELECT data FROM receipts{where} ORDER BY created_timestamp", params
+        )
+
+    def get_transactions(
+        self, receipt_id: Optional[int] = None, listing_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        clauses, params = [], []
+        if receipt_id is not None:
+            clauses.append("receipt_id = ?")
+            params.append(receipt_id)
+        if listing_id is not None:
+            clauses.append("listing_id = ?")
+            params.append(listing_id)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._documents(
+            f"SELECT data FROM transactions{where} ORDER BY transaction_id", params
+        )
+
+    def get_sales_by_listing(
+        self, min_created: Optional[int] = None, max_created: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Units sold and revenue (in currency units) per listing, best sellers first."""
+        clauses, params = [], []
+        if min_created is not None:
+            clauses.append("created_timestamp >= ?")
+            params.append(min_created)
+        if max_created is not None:
+            clauses.append("created_timestamp <= ?")
+            params.append(max_created)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self.query(
+            "SELECT listing_id, SUM(quantity) AS quantity, "
+            "SUM(quantity * CAST(price_amount AS REAL) / NULLIF(price_divisor, 0)) "
+            f"AS revenue FROM transactions{where} "
+            "GROUP BY listing_id ORDER BY quantity DESC",
+            params,
+        )
@@ -0,0 +1,154 @@
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from etsy_python.v3.common.Pagination import iterate_pages
+from etsy_python.v3.resources.Payment import PaymentResource
+from etsy_python.v3.resources.Receipt import ReceiptResource
+from etsy_python.v3.resources.ReceiptTransactions import ReceiptTransactionsResource
+from etsy_python.v3.resources.Response import Response
+from etsy_python.v3.resources.Session import EtsyClient
+
+# Etsy's id-list parameters accept at most 100 ids per call.
+MAX_BATCH_SIZE = 100
+
+
+def _results(message: Any) -> List[Dict[str, Any]]:
+    if isinstance(message, dict):
+        return message.get("results") or []
+    return message if isinstance(message, list) else []
+
+
+@dataclass
+class HydratedOrder:
+    receipt: Dict[str, Any]
+    transactions: List[Dict[str, Any]] = field(default_factory=list)
+    payments: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[BaseException] = None
+
+    @property
+    def receipt_id(self) -> int:
+        return self.receipt["receipt_id"]
+
+
+class OrderHydrator:
+    """Turn pages of receipts into complete orders with the fewest calls.
+
+    Transactions already embedded in a receipt (``getShopReceipts`` returns
+    them) are reused; only receipts without them cost a
+    ``get_shop_receipt_transactions_by_receipt`` call. Receipts do not carry
+    payment IDs, so payments whose IDs are known up front, e.g. from ledger
+    entries, are passed as ``payment_ids`` and fetched ``batch_size`` at a
+    time through ``get_payments``. The rest, and any a batch did not return,
+    fall back to ``get_shop_payment_by_receipt_id``. All calls for a page fan out over
+    ``max_workers`` threads.
+    """
+
+    def __init__(
+        self,
+        session: EtsyClient,
+        shop_id: int,
+        batch_size: int = MAX_BATCH_SIZE,
+        max_workers: int = 8,
+    ) -> None:
+        if not 0 < batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}")
+        self.session = session
+        self.shop_id = shop_id
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.receipts = ReceiptResource(session=session)
+        self.transactions = ReceiptTransactionsResource(session=session)
+        self.payments = PaymentResource(session=session)
+
+    def _transactions(self, receipt_id: int) -> List[Dict[str, Any]]:
+        response = self.transactions.get_shop_receipt_transactions_by_receipt(
+            self.shop_id, receipt_id
+        )
+        return _results(response.message)
+
+    def _payments_by_id(self, payment_ids: List[int]) -> List[Dict[str, Any]]:
+        return _results(self.payments.get_payments(self.shop_id, payment_ids).message)
+
+    def _payments_by_receipt(self, receipt_id: int) -> List[Dict[str, Any]]:
+        response = self.payments.get_shop_payment_by_receipt_id(self.shop_id, receipt_id)
+        return _results(response.message)
+
+    def hydrate(
+        self,
+        receipts: Iterable[Dict[str, Any]],
+        payment_ids: Optional[Mapping[int, int]] = None,
+    ) -> List[HydratedOrder]:
+        """Hydrate ``receipts``; ``payment_ids`` maps receipt ID to payment ID."""
+        orders = {receipt["receipt_id"]: HydratedOrder(receipt) for receipt in receipts}
+        known = {
+            receipt_id: payment_id
+            for receipt_id, payment_id in (payment_ids or {}).items()
+            if receipt_id in orders
+        }
+        by_payment = list(known.values())
+        batches = [
+            by_payment[i : i + self.batch_size]
+            for i in range(0, len(by_payment), self.batch_size)
+        ]
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="etsy-orders"
+        ) as executor:
+            transactions: Dict[Future, int] = {}
+            payments: Dict[Future, int] = {}
+            for receipt_id, order in orders.items():
+                embedded = order.receipt.get("transactions")
+                if isinstance(embedded, list):
+                    order.transactions = embedded
+                else:
+                    transactions[executor.submit(self._transactions, receipt_id)] = receipt_id
+                if receipt_id not in known:
+                    payments[executor.submit(self._payments_by_receipt, receipt_id)] = receipt_id
+            batched = [executor.submit(self._payments_by_id, batch) for batch in batches]
+
+            # Receipts a batch did not answer for (failed call, unknown or
+            # stale payment ID) fall back to the per-receipt lookup.
+            missing = set(known)
+            for future in as_completed(batched):
+                try:
+                    found = future.result()
+                except Exception:
+                    continue
+                for payment in found:
+                    order = orders.get(payment.get("receipt_id"))
+                    if order is not None:
+                        order.payments.append(payment)
+                        missing.discard(order.receipt_id)
+            for receipt_id in missing:
+                payments[executor.submit(self._payments_by_receipt, receipt_id)] = receipt_id
+
+            for future in as_completed(transactions):
+                order = orders[transactions[future]]
+                try:
+                    order.transactions = future.result()
+                except Exception as e:
+                    order.error = e
+            for future in as_completed(payments):
+                order = orders[payments[future]]
+                try:
+                    order.payments = future.result()
+                except Exception as e:
+                    order.error = order.error or e
+        return list(orders.values())
+
+    def hydrate_page(
+        self, page: Response, payment_ids: Optional[Mapping[int, int]] = None
+    ) -> List[HydratedOrder]:
+        """Hydrate the receipts of one ``get_shop_receipts`` response."""
+        return self.hydrate(_results(page.message), payment_ids)
+
+    def iterate_orders(
+        self,
+        payment_ids: Optional[Mapping[int, int]] = None,
+        **filters: Any,
+    ) -> Iterator[HydratedOrder]:
+        """Page through ``get_shop_receipts`` (``filters`` passed through),
+        hydrating a page at a time."""
+        for page in iterate_pages(self.receipts.get_shop_receipts, self.shop_id, **filters):
+            yield from self.hydrate(page, payment_ids)
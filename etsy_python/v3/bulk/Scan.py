@@ -0,0 +1,142 @@
+import math
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Set, Tuple
+
+from etsy_python.v3.common.Pagination import MAX_PAGE_LIMIT
+from etsy_python.v3.enums.ShopReceipt import SortOn, SortOrder
+from etsy_python.v3.resources.PaymentLedgerEntry import PaymentLedgeEntryResource
+from etsy_python.v3.resources.Receipt import ReceiptResource
+from etsy_python.v3.resources.Response import Response
+from etsy_python.v3.resources.Session import EtsyClient
+
+# Largest number of records a window may hold before it is split; five pages
+# keeps every offset shallow.
+DEFAULT_WINDOW_COUNT = 5 * MAX_PAGE_LIMIT
+
+Window = Tuple[int, int]
+# fetch(min_created, max_created, limit, offset) -> Response
+PageFetcher = Callable[[int, int, int, int], Response]
+
+
+def split_window(window: Window, parts: int) -> List[Window]:
+    """``window`` (inclusive bounds) cut into at most ``parts`` contiguous,
+    non-overlapping windows of near-equal width."""
+    start, end = window
+    parts = max(1, min(parts, end - start + 1))
+    width = (end - start + 1) / parts
+    bounds = [start + round(width * i) for i in range(parts)] + [end + 1]
+    return [(bounds[i], bounds[i + 1] - 1) for i in range(parts)]
+
+
+def _page(response: Response) -> Tuple[List[Dict[str, Any]], int]:
+    message = response.message if isinstance(response.message, dict) else {}
+    results = message.get("results") or []
+    return results, message.get("count", len(results))
+
+
+class WindowScanner:
+    """Scan a ``[min_created, max_created]`` range as parallel time windows.
+
+    Deep offsets are slow and shift under concurrent writes, so instead of
+    paging one long result set the range is cut into windows. Each window's
+    first page reports its ``count``. Windows holding more than
+    ``max_window_count`` records are split in proportion and probed again, so
+    dense periods get narrow windows and quiet ones wide windows. Small
+    windows are paged to the end. Windows run on ``max_workers`` threads and
+    records are deduplicated by ID, since windows are scanned at different
+    moments. Records are yielded as windows complete, not in creation order.
+    """
+
+    def __init__(
+        self,
+        session: EtsyClient,
+        shop_id: int,
+        max_window_count: int = DEFAULT_WINDOW_COUNT,
+        initial_windows: int = 8,
+        page_limit: int = MAX_PAGE_LIMIT,
+        max_workers: int = 8,
+    ) -> None:
+        if max_window_count < page_limit:
+            raise ValueError("max_window_count must be at least page_limit")
+        self.session = session
+        self.shop_id = shop_id
+        self.max_window_count = max_window_count
+        self.initial_windows = initial_windows
+        self.page_limit = page_limit
+        self.max_workers = max_workers
+        self.windows_scanned = 0
+
+    def _scan_window(
+        self, fetch: PageFetcher, window: Window
+    ) -> Tuple[List[Dict[str, Any]], List[Window]]:
+        results, count = _page(fetch(window[0], window[1], self.page_limit, 0))
+        if count > self.max_window_count and window[0] < window[1]:
+            parts = math.ceil(count / self.max_window_count)
+            return [], split_window(window, max(2, parts))
+        records = list(results)
+        while len(results) == self.page_limit and len(records) < count:
+            results, count = _page(fetch(window[0], window[1], self.page_limit, len(records)))
+            records.extend(results)
+        return records, []
+
+    def scan(
+        self, fetch: PageFetcher, min_created: int, max_created: int, id_key: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield each record in the range once, whatever endpoint ``fetch`` calls."""
+        seen: Set[Any] = set()
+        self.windows_scanned = 0
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="etsy-scan"
+        ) as executor:
+            pending: Set[Future] = {
+                executor.submit(self._scan_window, fetch, window)
+                for window in split_window((min_created, max_created), self.initial_windows)
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    records, windows = future.result()
+                    pending.update(
+                        executor.submit(self._scan_window, fetch, window) for window in windows
+                    )
+                    if not windows:
+                        self.windows_scanned += 1
+                    for record in records:
+                        if record[id_key] not in seen:
+                            seen.add(record[id_key])
+                            yield record
+
+    def scan_receipts(
+        self, min_created: int, max_created: int, **filters: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """Receipts created in the range; ``filters`` go to ``get_shop_receipts``."""
+        receipts = ReceiptResource(session=self.session)
+
+        def fetch(start: int, end: int, limit: int, offset: int) -> Response:
+            # Oldest first: receipts created during the scan land on the last
+            # page rather than shifting the offsets of earlier ones.
+            return receipts.get_shop_receipts(
+                self.shop_id,
+                min_created=start,
+                max_created=end,
+                limit=limit,
+                offset=offset,
+                sort_on=SortOn.CREATED,
+                sort_order=SortOrder.ASC,
+                **filters,
+            )
+
+        return self.scan(fetch, min_created, max_created, "receipt_id")
+
+    def scan_ledger_entries(
+        self, min_created: int, max_created: int
+    ) -> Iterator[Dict[str, Any]]:
+        """Payment-account ledger entries created in the range."""
+        ledger = PaymentLedgeEntryResource(session=self.session)
+
+        def fetch(start: int, end: int, limit: int, offset: int) -> Response:
+            return ledger.get_shop_payment_account_ledger_entries(
+                self.shop_id, min_created=start, max_created=end, limit=limit, offset=offset
+            )
+
+        return self.scan(fetch, min_created, max_created, "entry_id")
@@ -0,0 +1,176 @@
+import math
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from etsy_python.v3.enums.Listing import Includes
+from etsy_python.v3.exceptions.RequestException import RequestException
+from etsy_python.v3.models.Listing import UpdateListingRequest
+from etsy_python.v3.resources.Listing import ListingResource
+from etsy_python.v3.resources.Response import Response
+from etsy_python.v3.resources.Session import EtsyClient
+
+# getListingsByListingIds accepts at most 100 ids per call.
+MAX_BATCH_SIZE = 100
+
+# Payload keys whose ShopListing counterpart has a different name.
+_LISTING_FIELDS = {"type": "listing_type"}
+# Payload keys whose constructor argument has a different name.
+_REQUEST_ARGS = {"type": "listing_type"}
+_EMPTY = (None, "", [])
+
+
+class _Missing:
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+_MISSING = _Missing()
+
+
+def _current_value(listing: Mapping[str, Any], key: str) -> Any:
+    if key == "image_ids":
+        images = sorted(listing.get("images") or [], key=lambda i: i.get("rank", 0))
+        return [image["listing_image_id"] for image in images]
+    return listing.get(_LISTING_FIELDS.get(key, key), _MISSING)
+
+
+def _same(current: Any, desired: Any) -> bool:
+    if current is _MISSING:
+        # Write-only fields (production partners, personalization...) cannot
+        # be compared, so they are always sent.
+        return False
+    if desired in _EMPTY:
+        return current in _EMPTY
+    if isinstance(desired, float) or isinstance(current, float):
+        try:
+            return math.isclose(float(current), float(desired), rel_tol=1e-9)
+        except (TypeError, ValueError):
+            return False
+    return current == desired
+
+
+def diff_listing(
+    current: Mapping[str, Any], desired: UpdateListingRequest
+) -> Dict[str, Tuple[Any, Any]]:
+    """Fields of ``desired`` that differ from ``current``, as ``(old, new)``.
+
+    Only fields ``desired`` would actually send are considered, so ``None``
+    attributes mean "leave as is". Cleared nullable fields (``tags=[]``)
+    compare equal to an already empty value.
+    """
+    changes: Dict[str, Tuple[Any, Any]] = {}
+    for key, value in desired.get_dict().items():
+        old = _current_value(current, key)
+        if not _same(old, value):
+            changes[key] = (None if old is _MISSING else old, value)
+    return changes
+
+
+def partial_update(
+    desired: UpdateListingRequest, fields: List[str]
+) -> UpdateListingRequest:
+    """A copy of ``desired`` carrying only ``fields`` (payload key names)."""
+    kwargs = {
+        _REQUEST_ARGS.get(key, key): getattr(desired, "_type" if key == "type" else key)
+        for key in fields
+    }
+    with warnings.catch_warnings():
+        # Deprecated fields already warned when ``desired`` was built.
+        warnings.simplefilter("ignore", DeprecationWarning)
+        return UpdateListingRequest(**kwargs)
+
+
+@dataclass
+class ListingUpdateResult:
+    listing_id: int
+    changes: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)
+    response: Optional[Response] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def skipped(self) -> bool:
+        return not self.changes and self.error is None
+
+
+class BulkListingUpdater:
+    """Apply many ``update_listing`` calls, sending only what changed.
+
+    Current listings are fetched ``batch_size`` at a time through
+    ``get_listings_by_listing_ids`` and diffed against the desired
+    :class:`UpdateListingRequest`. Listings that already match are skipped;
+    the rest get a PATCH carrying only their changed fields. Batches and
+    PATCHes both run on ``max_workers`` threads.
+    """
+
+    def __init__(
+        self,
+        session: EtsyClient,
+        shop_id: int,
+        batch_size: int = MAX_BATCH_SIZE,
+        max_workers: int = 8,
+    ) -> None:
+        if not 0 < batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}")
+        self.session = session
+        self.shop_id = shop_id
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.listings = ListingResource(session=session)
+
+    def _fetch(self, listing_ids: List[int], with_images: bool) -> Dict[int, Any]:
+        includes = [Includes.IMAGES] if with_images else None
+        response = self.listings.get_listings_by_listing_ids(listing_ids, includes=includes)
+        return {listing["listing_id"]: listing for listing in response.message["results"]}
+
+    def _patch(self, listing_id: int, request: UpdateListingRequest) -> Response:
+        return self.listings.update_listing(self.shop_id, listing_id, request)
+
+    def update(
+        self, desired: Mapping[int, UpdateListingRequest], dry_run: bool = False
+    ) -> List[ListingUpdateResult]:
+        """Diff and PATCH; with ``dry_run`` only the diffs are computed."""
+        listing_ids = list(desired)
+        results = {listing_id: ListingUpdateResult(listing_id) for listing_id in listing_ids}
+        with_images = any(request.image_ids is not None for request in desired.values())
+        batches = [
+            listing_ids[i : i + self.batch_size]
+            for i in range(0, len(listing_ids), self.batch_size)
+        ]
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="etsy-update"
+        ) as executor:
+            fetches: Dict[Future, List[int]] = {
+                executor.submit(self._fetch, batch, with_images): batch
+                for batch in batches
+            }
+            patches: Dict[Future, int] = {}
+            for future in as_completed(fetches):
+                batch = fetches[future]
+                try:
+                    current = future.result()
+                except Exception as e:
+                    for listing_id in batch:
+                        results[listing_id].error = e
+                    continue
+                for listing_id in batch:
+                    result = results[listing_id]
+                    listing = current.get(listing_id)
+                    if listing is None:
+                        result.error = RequestException(
+                            404, "listing_not_found", f"Listing {listing_id} was not returned"
+                        )
+                        continue
+                    result.changes = diff_listing(listing, desired[listing_id])
+                    if result.changes and not dry_run:
+                        request = partial_update(desired[listing_id], list(result.changes))
+                        patches[executor.submit(self._patch, listing_id, request)] = listing_id
+            for future in as_completed(patches):
+                result = results[patches[future]]
+                try:
+                    result.response = future.result()
+                except Exception as e:
+                    result.error = e
+        return [results[listing_id] for listing_id in listing_ids]
@@ -0,0 +1,47 @@
+"""Names are imported on first access (PEP 562), so importing one helper
+does not load the others or their dependencies (``sqlite3`` for the mirror)."""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .Export import ExportFormat, export_ledger_entries, export_receipts
+    from .Ledger import LedgerEntryPayment, LedgerPaymentResolver
+    from .Mirror import ShopMirror
+    from .Orders import HydratedOrder, OrderHydrator
+    from .Publish import BulkPublisher, ListingSpec, PublishResult
+    from .Scan import WindowScanner
+    from .Update import BulkListingUpdater, ListingUpdateResult, diff_listing
+
+_LAZY: Dict[str, str] = {
+    "ExportFormat": ".Export",
+    "export_ledger_entries": ".Export",
+    "export_receipts": ".Export",
+    "LedgerEntryPayment": ".Ledger",
+    "LedgerPaymentResolver": ".Ledger",
+    "ShopMirror": ".Mirror",
+    "HydratedOrder": ".Orders",
+    "OrderHydrator": ".Orders",
+    "BulkPublisher": ".Publish",
+    "ListingSpec": ".Publish",
+    "PublishResult": ".Publish",
+    "WindowScanner": ".Scan",
+    "BulkListingUpdater": ".Update",
+    "ListingUpdateResult": ".Update",
+    "diff_listing": ".Update",
+}
+
+__all__ = [*_LAZY]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
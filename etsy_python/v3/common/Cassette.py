@@ -0,0 +1,283 @@
+import base64
+import json
+import threading
+import time
+from collections import deque
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Deque, Dict, FrozenSet, Iterator, List, MutableMapping, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+REDACTED = "[REDACTED]"
+# Credentials wherever they appear in a body.
+REDACTED_FIELDS = frozenset({"access_token", "refresh_token", "client_secret", "code_verifier"})
+# Masked only in OAuth token-exchange bodies; elsewhere names like ``code``
+# are ordinary data (currency, status and error codes).
+TOKEN_EXCHANGE_FIELDS = REDACTED_FIELDS | {"client_id", "code"}
+# The stored body is already decoded, so these no longer describe it.
+_DROPPED_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+)
+
+
+def redact(value: Any, fields: FrozenSet[str] = REDACTED_FIELDS) -> Any:
+    """``value`` with every field named in ``fields``, at any depth, replaced."""
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if key in fields else redact(item, fields)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(item, fields) for item in value]
+    return value
+
+
+def _credential_fields(url: str) -> FrozenSet[str]:
+    if urlsplit(url).path.endswith("/oauth/token"):
+        return TOKEN_EXCHANGE_FIELDS
+    return REDACTED_FIELDS
+
+
+def _target(url: str) -> str:
+    # Host-independent, so a cassette recorded against Etsy replays anywhere.
+    parts = urlsplit(url)
+    return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+
+def _encode_body(content: bytes, fields: FrozenSet[str]) -> Tuple[str, Any]:
+    try:
+        return "j", redact(json.loads(content), fields)
+    except ValueError:
+        pass
+    try:
+        return "t", content.decode("utf-8")
+    except UnicodeDecodeError:
+        return "b", base64.b64encode(content).decode("ascii")
+
+
+def _decode_body(kind: str, body: Any) -> bytes:
+    if kind == "j":
+        return json.dumps(body).encode("utf-8")
+    if kind == "b":
+        return base64.b64decode(body)
+    return body.encode("utf-8")
+
+
+class CassetteRecorder:
+    """Appends every exchange sent through a client to a cassette file.
+
+    Each line of the file is one compact JSON record: wall-clock start
+    (``at``), method, path and query (``u``, host stripped), the JSON request
+    body if any (``q``), status, response headers, the decoded response body
+    and the time to response headers (``d``). Authorization and API-key
+    headers are never written and :data:`REDACTED_FIELDS` are masked in
+    bodies, plus :data:`TOKEN_EXCHANGE_FIELDS` in OAuth token exchanges, so
+    token refreshes record safely. The file is opened for append
+    and flushed per record; several runs can share one cassette.
+
+    Pass to ``EtsyClient(recorder=...)``.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self.records = 0
+
+    def wrap(self, transport: Any) -> "RecordingTransport":
+        return RecordingTransport(transport, self)
+
+    def record(
+        self, method: str, url: str, request_json: Any, response: Any, started: float
+    ) -> None:
+        record: Dict[str, Any] = {
+            "at": round(started, 6),
+            "m": method,
+            "u": _target(url),
+            "s": response.status_code,
+            "h": {
+                key: value
+                for key, value in response.headers.items()
+                if key.lower() not in _DROPPED_HEADERS
+            },
+        }
+        fields = _credential_fields(url)
+        if request_json is not None:
+            record["q"] = redact(request_json, fields)
+        content = getattr(response, "content", b"")
+        if content:
+            record["k"], record["b"] = _encode_body(content, fields)
+        elapsed = getattr(response, "elapsed", None)
+        if isinstance(elapsed, timedelta):
+            record["d"] = round(elapsed.total_seconds(), 6)
+        line = json.dumps(record, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            self.records += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "CassetteRecorder":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class RecordingTransport:
+    """A transport that passes calls through and records what came back.
+
+    Requests that fail in transport are not recorded; they have no response
+    to replay.
+    """
+
+    def __init__(self, transport: Any, recorder: CassetteRecorder) -> None:
+        self.transport = transport
+        self.recorder = recorder
+
+    @property
+    def headers(self) -> MutableMapping[str, str]:
+        return self.transport.headers
+
+    @headers.setter
+    def headers(self, value: Dict[str, str]) -> None:
+        self.transport.headers = value
+
+    def _call(self, method: str, url: str, **kwargs: Any) -> Any:
+        started = time.time()
+        response = getattr(self.transport, method.lower())(url, **kwargs)
+        self.recorder.record(method, url, kwargs.get("json"), response, started)
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        return self._call("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        return self._call("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> Any:
+        return self._call("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs: Any) -> Any:
+        return self._call("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> Any:
+        return self._call("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        close = getattr(self.transport, "close", None)
+        if callable(close):
+            close()
+
+
+def load_cassette(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """The records in a cassette, in the order they were written.
+
+    A torn final line, left by a process killed mid-write, is skipped.
+    """
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
+
+
+def iter_paced(
+    records: List[Dict[str, Any]], speed: Optional[float] = 1.0
+) -> Iterator[Dict[str, Any]]:
+    """Yield ``records`` at their recorded start offsets, scaled by ``speed``.
+
+    Drives a replay with the original traffic shape: ``speed=1.0`` is real
+    time, ``10.0`` ten times faster and ``None`` as fast as possible.
+    """
+    if not records:
+        return
+    origin = records[0]["at"]
+    started = time.monotonic()
+    for record in records:
+        if speed:
+            wait = (record["at"] - origin) / speed - (time.monotonic() - started)
+            if wait > 0:
+                time.sleep(wait)
+        yield record
+
+
+class ReplayTransport:
+    """Serves a cassette's responses back in place of the network.
+
+    Requests are matched on method and path with query; repeated requests
+    get the recorded responses in recorded order. Each response is held for
+    its recorded latency divided by ``speed`` (``None`` serves at once), so
+    throughput features can be benchmarked reproducibly offline. A request
+    with nothing left to replay raises ``requests.ConnectionError``, as a
+    network failure would.
+    """
+
+    def __init__(
+        self,
+        cassette: Union[str, Path, List[Dict[str, Any]]],
+        speed: Optional[float] = 1.0,
+    ) -> None:
+        records = load_cassette(cassette) if isinstance(cassette, (str, Path)) else cassette
+        self.speed = speed
+        self.headers: MutableMapping[str, str] = CaseInsensitiveDict()
+        self._queues: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = {}
+        for record in records:
+            self._queues.setdefault((record["m"], record["u"]), deque()).append(record)
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        """Recorded responses not yet served."""
+        with self._lock:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        key = (method, _target(url))
+        with self._lock:
+            queue = self._queues.get(key)
+            record = queue.popleft() if queue else None
+        if record is None:
+            raise requests.ConnectionError(f"No recorded response for {method} {key[1]}")
+        latency = record.get("d", 0.0)
+        if self.speed:
+            time.sleep(latency / self.speed)
+
+        response = requests.Response()
+        response.status_code = record["s"]
+        response.headers = CaseInsensitiveDict(record["h"])
+        response._content = _decode_body(record["k"], record["b"]) if "b" in record else b""
+        response.encoding = "utf-8"
+        response.url = url
+        response.elapsed = timedelta(seconds=latency / self.speed if self.speed else 0.0)
+        response.request = requests.Request(
+            method, url, json=kwargs.get("json"), data=kwargs.get("data")
+        ).prepare()
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        pass
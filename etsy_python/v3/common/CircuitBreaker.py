@@ -0,0 +1,201 @@
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+import requests
+
+from etsy_python.v3.common.Hooks import uri_template
+from etsy_python.v3.exceptions.CircuitOpenException import CircuitOpenException
+from etsy_python.v3.exceptions.RequestException import RequestException
+
+# Statuses that say the endpoint, not the request, is in trouble.
+FAILURE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+# Path prefixes that scope a resource collection rather than name one.
+_SCOPES = frozenset({"shops", "users"})
+
+
+def endpoint_family(uri_path: str) -> str:
+    """First resource collection, below a shop or user scope.
+
+    ``/shops/1/receipts/2/transactions`` -> ``receipts``,
+    ``/listings/active`` -> ``listings``, ``/shops/1`` -> ``shops``.
+    """
+    segments = [s for s in uri_template(uri_path).split("/") if s]
+    if not segments:
+        return "/"
+    if segments[0] in _SCOPES and len(segments) > 2:
+        return segments[2]
+    return segments[0]
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class Circuit:
+    """Breaker for one endpoint family; created by :class:`CircuitBreaker`."""
+
+    def __init__(self, name: str, breaker: "CircuitBreaker") -> None:
+        self.name = name
+        self.breaker = breaker
+        self.state = CircuitState.CLOSED
+        self.opened_at = 0.0
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        # When each outstanding half-open probe was let through.
+        self._probes: Deque[float] = deque()
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.breaker.window
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            self._outcomes.popleft()
+
+    def _open(self, now: float) -> None:
+        self.state = CircuitState.OPEN
+        self.opened_at = now
+        self._outcomes.clear()
+        self._probes.clear()
+
+    def allow(self, now: float) -> None:
+        breaker = self.breaker
+        if self.state is CircuitState.OPEN:
+            remaining = self.opened_at + breaker.reset_timeout - now
+            if remaining > 0:
+                raise CircuitOpenException(
+                    503,
+                    "circuit_open",
+                    f"Calls to '{self.name}' are failing; not sending requests",
+                    endpoint=self.name,
+                    retry_after=remaining,
+                )
+            self.state = CircuitState.HALF_OPEN
+            self._probes.clear()
+        if self.state is CircuitState.HALF_OPEN:
+            # A probe that never reported back stops holding its slot after
+            # reset_timeout, so a lost outcome cannot wedge the circuit.
+            while self._probes and self._probes[0] + breaker.reset_timeout <= now:
+                self._probes.popleft()
+            if len(self._probes) >= breaker.half_open_probes:
+                raise CircuitOpenException(
+                    503,
+                    "circuit_open",
+                    f"Waiting for probe requests to '{self.name}'",
+                    endpoint=self.name,
+                    retry_after=self._probes[0] + breaker.reset_timeout - now,
+                )
+            self._probes.append(now)
+
+    def release(self) -> None:
+        """Give back a probe slot for a call that was never sent."""
+        if self.state is CircuitState.HALF_OPEN and self._probes:
+            self._probes.popleft()
+
+    def record(self, now: float, failed: bool) -> None:
+        breaker = self.breaker
+        if self.state is CircuitState.HALF_OPEN:
+            if failed:
+                self._open(now)
+            else:
+                self.state = CircuitState.CLOSED
+                self._outcomes.clear()
+                self._probes.clear()
+            return
+        if self.state is CircuitState.OPEN:
+            return
+        self._outcomes.append((now, failed))
+        self._prune(now)
+        calls = len(self._outcomes)
+        if calls >= breaker.min_calls:
+            failures = sum(1 for _, f in self._outcomes if f)
+            if failures / calls >= breaker.failure_rate:
+                self._open(now)
+
+
+class CircuitBreaker:
+    """Per-endpoint-family circuit breakers for ``EtsyClient``.
+
+    A call counts as failed when it raises a transport error, gets a status in
+    ``FAILURE_STATUSES`` or takes longer than ``slow_call_duration``. Once at
+    least ``min_calls`` calls in the last ``window`` seconds fail at
+    ``failure_rate`` or more, the family opens and calls raise
+    :class:`CircuitOpenException` without touching the network. After
+    ``reset_timeout`` up to ``half_open_probes`` calls go through; a success
+    closes the circuit and a failure opens it again. A probe that has not
+    reported within another ``reset_timeout`` frees its slot.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_calls: int = 10,
+        window: float = 60.0,
+        slow_call_duration: Optional[float] = None,
+        reset_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        key: Callable[[str], str] = endpoint_family,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window = window
+        self.slow_call_duration = slow_call_duration
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.key = key
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, Circuit] = {}
+
+    def circuit(self, uri_path: str) -> Circuit:
+        name = self.key(uri_path)
+        with self._lock:
+            circuit = self._circuits.get(name)
+            if circuit is None:
+                circuit = self._circuits[name] = Circuit(name, self)
+            return circuit
+
+    def states(self) -> Dict[str, CircuitState]:
+        with self._lock:
+            return {name: c.state for name, c in self._circuits.items()}
+
+    def before_call(self, uri_path: str) -> Circuit:
+        """Raise :class:`CircuitOpenException` if the family is open."""
+        circuit = self.circuit(uri_path)
+        with self._lock:
+            circuit.allow(self.clock())
+        return circuit
+
+    def is_failure(
+        self,
+        duration: float,
+        error: Optional[BaseException] = None,
+        status: Optional[int] = None,
+    ) -> bool:
+        if isinstance(error, RequestException):
+            status = error.code
+        elif isinstance(error, (requests.RequestException, OSError)):
+            return True
+        if status in FAILURE_STATUSES:
+            return True
+        return self.slow_call_duration is not None and duration > self.slow_call_duration
+
+    def after_call(
+        self,
+        circuit: Circuit,
+        duration: float,
+        error: Optional[BaseException] = None,
+        status: Optional[int] = None,
+    ) -> None:
+        failed = self.is_failure(duration, error, status)
+        with self._lock:
+            circuit.record(self.clock(), failed)
+
+    def release(self, circuit: Circuit) -> None:
+        """Undo :meth:`before_call` for a call that failed before it was sent."""
+        with self._lock:
+            circuit.release()
@@ -12,5 +12,12 @@ class Production(BaseEnvironment):
     request_url = f"{BaseEnvironment.base_request_url}/v3/application"
 
 
-ENVIRONMENTS = dict(PROD=Production)
+class Local(BaseEnvironment):
+    # Offline target such as scripts/mock_server.py; select with ETSY_ENV=LOCAL.
+    base_local_url = os_environ.get("ETSY_LOCAL_URL", "http://127.0.0.1:8080")
+    token_url = f"{base_local_url}/v3/public/oauth/token"
+    request_url = f"{base_local_url}/v3/application"
+
+
+ENVIRONMENTS = dict(PROD=Production, LOCAL=Local)
 environment = ENVIRONMENTS.get(os_environ.get("ETSY_ENV", "PROD"), Production)
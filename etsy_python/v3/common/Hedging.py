@@ -0,0 +1,199 @@
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeout
+from time import perf_counter
+from typing import Any, Callable, Collection, Deque, Dict, Optional
+
+DEFAULT_PERCENTILE = 95.0
+
+
+def _close_quietly(result: Any) -> None:
+    # The losing request cannot be aborted mid-flight; release its connection
+    # as soon as it finishes.
+    close = getattr(result, "close", None)
+    if callable(close):
+        close()
+
+
+class HedgePolicy:
+    """Opt-in request hedging for idempotent GETs.
+
+    When a GET has not answered within the ``percentile`` latency of its URI
+    template (``initial_delay`` until ``min_samples`` responses have been
+    seen), a duplicate is sent and whichever reply arrives first is used.
+    Hedges are capped at ``max_hedge_ratio`` of requests and must also fit the
+    caller's budget check, which ``EtsyClient`` wires to its quota tracker and
+    rate limiter. ``operations`` restricts hedging to specific URI templates
+    such as ``/listings/{id}``.
+
+    Attempts run on ``max_workers`` threads and never queue for one: when all
+    are busy, a request is sent on the caller's thread and is not hedged.
+    """
+
+    def __init__(
+        self,
+        percentile: float = DEFAULT_PERCENTILE,
+        initial_delay: float = 0.5,
+        min_delay: float = 0.01,
+        min_samples: int = 20,
+        sample_size: int = 200,
+        max_hedge_ratio: float = 0.1,
+        quota_reserve: int = 0,
+        operations: Optional[Collection[str]] = None,
+        max_workers: int = 8,
+    ) -> None:
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.sample_size = sample_size
+        self.max_hedge_ratio = max_hedge_ratio
+        self.quota_reserve = quota_reserve
+        self.operations = frozenset(operations) if operations is not None else None
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="etsy-hedge"
+        )
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._busy = 0
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def applies(self, template: str) -> bool:
+        return self.operations is None or template in self.operations
+
+    def observe(self, template: str, latency: float) -> None:
+        with self._lock:
+            samples = self._latencies.get(template)
+            if samples is None:
+                samples = self._latencies[template] = deque(maxlen=self.sample_size)
+            samples.append(latency)
+
+    def delay_for(self, template: str) -> float:
+        with self._lock:
+            samples = sorted(self._latencies.get(template, ()))
+        if len(samples) < self.min_samples:
+            return self.initial_delay
+        index = min(int(len(samples) * self.percentile / 100.0), len(samples) - 1)
+        return max(samples[index], self.min_delay)
+
+    def _reserve_worker(self) -> bool:
+        # Work is only submitted with a worker free to take it, so an attempt
+        # never sits in the executor queue with its hedge timer running.
+        with self._lock:
+            if self._busy >= self.max_workers:
+                return False
+            self._busy += 1
+            return True
+
+    def _release_worker(self) -> None:
+        with self._lock:
+            self._busy -= 1
+
+    def _submit(self, send: Callable[[], Any]) -> Future:
+        try:
+            future = self._executor.submit(send)
+        except BaseException:
+            self._release_worker()
+            raise
+        future.add_done_callback(lambda _: self._release_worker())
+        return future
+
+    def _reserve_hedge(self, budget: Callable[[], bool]) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.max_hedge_ratio * self.requests:
+                return False
+        if not self._reserve_worker():
+            return False
+        if not budget():
+            self._release_worker()
+            return False
+        with self._lock:
+            self.hedges += 1
+        return True
+
+    def run(
+        self,
+        template: str,
+        send: Callable[[], Any],
+        budget: Callable[[], bool],
+        on_hedge: Optional[Callable[[], None]] = None,
+        on_discard: Callable[[Any], None] = _close_quietly,
+    ) -> Any:
+        """Send via ``send``, hedging once if the reply is slow and ``budget()`` allows.
+
+        ``on_hedge`` is called just before the duplicate goes out, so callers
+        can count it as a resend. The losing attempt is cancelled if it has not
+        started; otherwise its result is handed to ``on_discard`` once it
+        arrives (by default the response is closed).
+        """
+        with self._lock:
+            self.requests += 1
+        if not self._reserve_worker():
+            # Every worker is busy: send here rather than queue, unhedged.
+            start = perf_counter()
+            result = send()
+            self.observe(template, perf_counter() - start)
+            return result
+
+        started = threading.Event()
+        begun = [0.0]
+
+        def send_primary() -> Any:
+            begun[0] = perf_counter()
+            started.set()
+            return send()
+
+        def record(future: Future) -> None:
+            # Primary latencies feed the percentile even when a hedge wins,
+            # so hedging does not drag its own trigger point down.
+            if not future.cancelled() and future.exception() is None:
+                self.observe(template, perf_counter() - begun[0])
+
+        def discard(lost: Future) -> None:
+            if lost.exception() is None:
+                on_discard(lost.result())
+
+        primary = self._submit(send_primary)
+        primary.add_done_callback(record)
+        # The hedge delay counts from when the primary starts, not from
+        # when it was handed to the pool.
+        started.wait()
+        try:
+            return primary.result(timeout=self.delay_for(template))
+        except FuturesTimeout:
+            pass
+        if not self._reserve_hedge(budget):
+            return primary.result()
+
+        if on_hedge is not None:
+            on_hedge()
+        hedge = self._submit(send)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    loser = hedge if future is primary else primary
+                    if not loser.cancel():
+                        loser.add_done_callback(discard)
+                    if future is hedge:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+        # Both attempts failed; surface the original request's error.
+        return primary.result()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,198 @@
+import logging
+import re
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def uri_template(uri_path: str) -> str:
+    """Collapse numeric path segments so ``/listings/123`` keys as ``/listings/{id}``."""
+    return _ID_SEGMENT.sub("/{id}", uri_path)
+
+
+@dataclass
+class RequestTimings:
+    """Per-request phase durations in seconds.
+
+    ``connect`` covers DNS resolution plus TCP/TLS setup and is 0.0 when a
+    pooled connection was reused; ``dns`` is only set by transports that report
+    it separately. ``ttfb`` runs until response headers were parsed and
+    ``total`` includes reading the body.
+    """
+
+    dns: Optional[float] = None
+    connect: Optional[float] = None
+    ttfb: Optional[float] = None
+    total: Optional[float] = None
+
+
+@dataclass
+class RequestEvent:
+    operation: str
+    uri_template: str
+    method: str
+    url: str
+    status: Optional[int] = None
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    # Response body as transferred, before decompression; None when the
+    # transport does not report it.
+    wire_bytes_received: Optional[int] = None
+    content_encoding: Optional[str] = None
+    timings: RequestTimings = field(default_factory=RequestTimings)
+    # Duplicates sent for this call; hedging is currently the only resend.
+    retries: int = 0
+    rate_limits: Any = None
+    error: Optional[BaseException] = None
+    # Scratch space for hooks that need per-request state (e.g. an open span).
+    context: Dict[str, Any] = field(default_factory=dict)
+
+
+class RequestHook:
+    """Base class for ``EtsyClient(hooks=[...])``; override any subset.
+
+    ``before_send`` runs once the URL is built, ``after_response`` whenever an
+    HTTP response arrived (including error statuses, in which case
+    ``event.error`` is already set), ``on_retry`` before a request is resent,
+    and ``on_error`` when the call raises, whether from the transport or an
+    error status. Exceptions raised by hooks are logged and never affect the
+    request.
+    """
+
+    def before_send(self, event: RequestEvent) -> None:
+        pass
+
+    def after_response(self, event: RequestEvent) -> None:
+        pass
+
+    def on_retry(self, event: RequestEvent) -> None:
+        pass
+
+    def on_error(self, event: RequestEvent) -> None:
+        pass
+
+
+def dispatch(hooks: Sequence[RequestHook], stage: str, event: RequestEvent) -> None:
+    for hook in hooks:
+        try:
+            getattr(hook, stage)(event)
+        except Exception:
+            logger.exception("Request hook %r failed in %s", hook, stage)
+
+
+class LoggingHook(RequestHook):
+    def __init__(self, log: Optional[logging.Logger] = None, level: int = logging.INFO):
+        self.log = log or logging.getLogger("etsy_python.requests")
+        self.level = level
+
+    def after_response(self, event: RequestEvent) -> None:
+        self.log.log(
+            self.level,
+            "%s %s -> %s in %.1fms (sent=%dB received=%dB retries=%d)",
+            event.method,
+            event.uri_template,
+            event.status,
+            (event.timings.total or 0.0) * 1000,
+            event.bytes_sent,
+            event.bytes_received,
+            event.retries,
+        )
+
+    def on_error(self, event: RequestEvent) -> None:
+        if event.status is None:
+            self.log.warning(
+                "%s %s failed: %r", event.method, event.uri_template, event.error
+            )
+
+
+DEFAULT_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class HistogramHook(RequestHook):
+    """Prometheus-style latency histograms and byte counters per operation.
+
+    Series are labelled by operation, method and status (``error`` when no
+    response arrived). Received bytes are counted both decoded and as
+    transferred, so the two counters show what compression saves.
+    :meth:`render` returns the text exposition format, so the output can be
+    served from an existing ``/metrics`` endpoint.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = "etsy"):
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+
+    def _observe(self, event: RequestEvent) -> None:
+        key = (
+            event.operation,
+            event.method,
+            str(event.status) if event.status is not None else "error",
+        )
+        duration = event.timings.total or 0.0
+        with self._lock:
+            series = self._series.setdefault(
+                key,
+                {
+                    "buckets": [0] * len(self.buckets),
+                    "sum": 0.0,
+                    "count": 0,
+                    "bytes_sent": 0,
+                    "bytes_received": 0,
+                    "wire_bytes_received": 0,
+                },
+            )
+            index = bisect_left(self.buckets, duration)
+            for i in range(index, len(self.buckets)):
+                series["buckets"][i] += 1
+            series["sum"] += duration
+            series["count"] += 1
+            series["bytes_sent"] += event.bytes_sent
+            series["bytes_received"] += event.bytes_received
+            series["wire_bytes_received"] += (
+                event.wire_bytes_received
+                if event.wire_bytes_received is not None
+                else event.bytes_received
+            )
+
+    def after_response(self, event: RequestEvent) -> None:
+        self._observe(event)
+
+    def on_error(self, event: RequestEvent) -> None:
+        # Error statuses were already observed in after_response.
+        if event.status is None:
+            self._observe(event)
+
+    def snapshot(self) -> Dict[Tuple[str, str, str], Dict[str, Any]]:
+        with self._lock:
+            return {
+                key: {**series, "buckets": list(series["buckets"])}
+                for key, series in self._series.items()
+            }
+
+    def render(self) -> str:
+        name = f"{self.prefix}_request_duration_seconds"
+        sent = f"{self.prefix}_request_bytes_sent_total"
+        received = f"{self.prefix}_request_bytes_received_total"
+        wire = f"{self.prefix}_request_wire_bytes_received_total"
+        lines: List[str] = [f"# TYPE {name} histogram"]
+        sent_lines: List[str] = [f"# TYPE {sent} counter"]
+        received_lines: List[str] = [f"# TYPE {received} counter"]
+        wire_lines: List[str] = [f"# TYPE {wire} counter"]
+        for (operation, method, status), series in sorted(self.snapshot().items()):
+            labels = f'operation="{operation}",method="{method}",status="{status}"'
+            for bound, count in zip(self.buckets, series["buckets"]):
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {series["count"]}')
+            lines.append(f"{name}_sum{{{labels}}} {series['sum']}")
+            lines.append(f"{name}_count{{{labels}}} {series['count']}")
+            sent_lines.append(f"{sent}{{{labels}}} {series['bytes_sent']}")
+            received_lines.append(f"{received}{{{labels}}} {series['bytes_received']}")
+            wire_lines.append(f"{wire}{{{labels}}} {series['wire_bytes_received']}")
+        return "\n".join(lines + sent_lines + received_lines + wire_lines) + "\n"
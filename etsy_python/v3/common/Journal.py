@@ -0,0 +1,300 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+
+from etsy_python.v3.exceptions.RequestException import RequestException
+from etsy_python.v3.resources.Response import Response
+from etsy_python.v3.resources.enums.Request import Method
+
+if TYPE_CHECKING:
+    from etsy_python.v3.resources.Session import EtsyClient
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _is_final(error: BaseException) -> bool:
+    # A 4xx other than 429 means Etsy rejected the call and nothing was
+    # applied; anything else (timeouts, 5xx) may or may not have landed.
+    code = getattr(error, "code", None)
+    return (
+        isinstance(error, RequestException)
+        and isinstance(code, int)
+        and 400 <= code < 500
+        and code != 429
+    )
+
+
+@dataclass
+class JournalEntry:
+    key: str
+    run_id: str
+    method: str
+    uri_path: str
+    query_params: Optional[Dict[str, Any]] = None
+    body: Optional[Dict[str, Any]] = None
+    state: str = PENDING
+    code: Optional[int] = None
+    message: Any = None
+    error: Optional[BaseException] = field(default=None, compare=False)
+
+
+class RequestJournal:
+    """Write-ahead log of mutating calls, for resuming interrupted bulk runs.
+
+    Pass to ``EtsyClient(journal=...)``. Before a POST, PUT, PATCH or DELETE
+    is sent, a ``pending`` record with its path, query and body goes to an
+    append-only file. Once the call returns it is marked ``done``, with the
+    response, or ``failed`` when Etsy rejected it with a 4xx. Records are
+    flushed and, with ``fsync``, forced to disk, so a crash loses at most the
+    call in flight.
+
+    Calls are keyed by ``run_id`` plus their content and how many identical
+    calls came before them in the run, so every call is sent even when it
+    repeats an earlier one. To resume an interrupted job, open the journal
+    with the crashed run's ``run_id`` and run the job again: the calls it
+    already completed return their recorded response without being sent.
+    A new journal without ``run_id`` starts a fresh run and skips nothing.
+    :meth:`replay` instead re-sends only the calls left ``pending``. File
+    uploads carry no replayable body and are not journaled.
+    """
+
+    def __init__(
+        self, path: Union[str, Path], run_id: Optional[str] = None, fsync: bool = True
+    ) -> None:
+        self.path = Path(path)
+        self.run_id = run_id if run_id is not None else uuid.uuid4().hex
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._entries: Dict[str, JournalEntry] = {}
+        # How many times each call has been made in this process.
+        self._occurrences: Dict[str, int] = {}
+        torn = self.path.exists() and self._load()
+        self._file = open(self.path, "a", encoding="utf-8")
+        if torn:
+            # Start a fresh line so the next record is not glued to the torn one.
+            self._write_raw("\n")
+
+    def _load(self) -> bool:
+        """Read the journal back; True if it ends in a torn record."""
+        line = "\n"
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # torn final line from a crash mid-write
+                key = record["k"]
+                if record["s"] == PENDING:
+                    self._entries[key] = JournalEntry(
+                        key,
+                        record["n"],
+                        record["m"],
+                        record["u"],
+                        record.get("q"),
+                        record.get("b"),
+                    )
+                elif key in self._entries:
+                    entry = self._entries[key]
+                    entry.state, entry.code = record["s"], record.get("c")
+                    entry.message = record.get("r")
+        return not line.endswith("\n")
+
+    @staticmethod
+    def _content(
+        run_id: str,
+        method: str,
+        uri_path: str,
+        query_params: Optional[Dict[str, Any]],
+        body: Optional[Dict[str, Any]],
+    ) -> str:
+        canonical = json.dumps(
+            [run_id, method, uri_path, query_params, body], sort_keys=True, default=str
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _key(content: str, occurrence: int) -> str:
+        marked = f"{content}#{occurrence}".encode("utf-8")
+        return hashlib.sha256(marked).hexdigest()[:32]
+
+    @classmethod
+    def key_for(
+        cls,
+        run_id: str,
+        method: str,
+        uri_path: str,
+        query_params: Optional[Dict[str, Any]],
+        body: Optional[Dict[str, Any]],
+        occurrence: int = 1,
+    ) -> str:
+        """Key of the ``occurrence``-th call with this content in run ``run_id``."""
+        content = cls._content(run_id, method, uri_path, query_params, body)
+        return cls._key(content, occurrence)
+
+    @staticmethod
+    def _line(record: Dict[str, Any]) -> str:
+        return json.dumps(record, separators=(",", ":"), default=str) + "\n"
+
+    @staticmethod
+    def _started(entry: JournalEntry) -> Dict[str, Any]:
+        record: Dict[str, Any] = {
+            "k": entry.key,
+            "s": PENDING,
+            "n": entry.run_id,
+            "m": entry.method,
+            "u": entry.uri_path,
+        }
+        if entry.query_params:
+            record["q"] = entry.query_params
+        if entry.body is not None:
+            record["b"] = entry.body
+        return record
+
+    @staticmethod
+    def _outcome(entry: JournalEntry) -> Dict[str, Any]:
+        record: Dict[str, Any] = {"k": entry.key, "s": entry.state, "c": entry.code}
+        if entry.state == DONE:
+            record["r"] = entry.message
+        return record
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._write_raw(self._line(record))
+
+    def _write_raw(self, text: str) -> None:
+        self._file.write(text)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def get(self, key: str) -> Optional[JournalEntry]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def entries(self, state: Optional[str] = None) -> List[JournalEntry]:
+        """Journaled calls in first-seen order, optionally only in ``state``."""
+        with self._lock:
+            return [
+                e for e in self._entries.values() if state is None or e.state == state
+            ]
+
+    def pending(self) -> List[JournalEntry]:
+        """Calls that were started but never confirmed."""
+        return self.entries(PENDING)
+
+    def run(
+        self,
+        method: Method,
+        uri_path: str,
+        query_params: Optional[Dict[str, Any]],
+        body: Optional[Dict[str, Any]],
+        send: Callable[[], Any],
+    ) -> Any:
+        """Journal and perform one call; ``send`` does the request.
+
+        ``body`` is the payload already serialized by the client.
+        """
+        query = (
+            {k: _plain(v) for k, v in query_params.items() if v is not None}
+            if query_params
+            else None
+        )
+        with self._lock:
+            # Identical calls are told apart by their position in the run.
+            content = self._content(self.run_id, method.name, uri_path, query, body)
+            occurrence = self._occurrences.get(content, 0) + 1
+            self._occurrences[content] = occurrence
+            key = self._key(content, occurrence)
+            entry = self._entries.get(key)
+            if entry is not None and entry.state == DONE:
+                return Response(entry.code, entry.message)
+            if entry is None:
+                entry = JournalEntry(
+                    key, self.run_id, method.name, uri_path, query, body
+                )
+                self._entries[key] = entry
+        return self._send(entry, send)
+
+    def _send(self, entry: JournalEntry, send: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry.state = PENDING
+            self._write({**self._started(entry), "t": round(time.time(), 3)})
+        try:
+            result = send()
+        except Exception as e:
+            if _is_final(e):
+                with self._lock:
+                    entry.state, entry.code = FAILED, e.code
+                    self._write(self._outcome(entry))
+            raise
+        with self._lock:
+            entry.state, entry.code, entry.message = DONE, result.code, result.message
+            self._write(self._outcome(entry))
+        return result
+
+    def replay(self, client: "EtsyClient") -> List[JournalEntry]:
+        """Re-send every pending call, from any run, through ``client``.
+
+        Calls go out in journal order and settle their original entries.
+        They are not validated again. Errors are kept on the returned
+        entries rather than raised, so one failure does not stop the rest of
+        the recovery.
+        """
+        replayed = self.pending()
+        for entry in replayed:
+            try:
+                self._send(
+                    entry,
+                    lambda: client._request(
+                        entry.uri_path,
+                        Method[entry.method],
+                        None,
+                        entry.query_params,
+                        entry.body,
+                    ),
+                )
+                entry.error = None
+            except Exception as e:
+                entry.error = e
+        return replayed
+
+    def compact(self) -> None:
+        """Rewrite the file with one record per call, dropping history."""
+        with self._lock:
+            temporary = self.path.with_name(self.path.name + ".tmp")
+            with open(temporary, "w", encoding="utf-8") as f:
+                for entry in self._entries.values():
+                    f.write(self._line(self._started(entry)))
+                    if entry.state != PENDING:
+                        f.write(self._line(self._outcome(entry)))
+                f.flush()
+                os.fsync(f.fileno())
+            self._file.close()
+            os.replace(temporary, self.path)
+            self._file = open(self.path, "a", encoding="utf-8")
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "RequestJournal":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
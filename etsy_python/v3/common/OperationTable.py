@@ -0,0 +1,745 @@
+"""Etsy Open API v3 operations, generated from ``specs/baseline.json``.
+
+Do not edit by hand; regenerate with ``python scripts/generate_operations.py``.
+Rows are ``(operation_id, method, path, path_params, query_params)``.
+"""
+
+from typing import Tuple
+
+OPERATION_TABLE: Tuple[Tuple[str, str, str, Tuple[str, ...], Tuple[str, ...]], ...] = (
+    (
+        "consolidateShopReturnPolicies",
+        "POST",
+        "/shops/{shop_id}/policies/return/consolidate",
+        ("shop_id",),
+        (),
+    ),
+    (
+        "createDraftListing",
+        "POST",
+        "/shops/{shop_id}/listings",
+        ("shop_id",),
+        (),
+    ),
+    (
+        "createListingTranslation",
+        "POST",
+        "/shops/{shop_id}/listings/{listing_id}/translations/{language}",
+        ("shop_id", "listing_id", "language"),
+        (),
+    ),
+    (
+        "createReceiptShipment",
+        "POST",
+        "/shops/{shop_id}/receipts/{receipt_id}/tracking",
+        ("shop_id", "receipt_id"),
+        ("legacy",),
+    ),
+    (
+        "createShopReadinessStateDefinition",
+        "POST",
+        "/shops/{shop_id}/readiness-state-definitions",
+        ("shop_id",),
+        (),
+    ),
+    (
+        "createShopReturnPolicy",
+        "POST",
+        "/shops/{shop_id}/policies/return",
+        ("shop_id",),
+        (),
+    ),
+    (
+        "createShopSection",
+        "POST",
+        "/shops/{shop_id}/sections",
+        ("shop_id",),
+        (),
+    ),
+    (
+        "createShopShippingProfile",
+        "POST",
+        "/shops/{shop_id}/shipping-profiles",
+        ("shop_id",),
+        (),
+    ),
+    (
+        "createShopShippingProfileDestination",
+        "POST",
+        "/shops/{shop_id}/shipping-profiles/{shipping_profile_id}/destinations",
+        ("shop_id", "shipping_profile_id"),
+        (),
+    ),
+    (
+        "createShopShippingProfileUpgrade",
+        "POST",
+        "/shops/{shop_id}/shipping-profiles/{shipping_profile_id}/upgrades",
+        ("shop_id", "shipping_profile_id"),
+        (),
+    ),
+    (
+        "deleteListing",
+        "DELETE",
+        "/listings/{listing_id}",
+        ("listing_id",),
+        (),
+    ),
+    (
+        "deleteListingFile",
+        "DELETE",
+        "/shops/{shop_id}/listings/{listing_id}/files/{listing_file_id}",
+        ("shop_id", "listing_id", "listing_file_id"),
+        (),
+    ),
+    (
+        "deleteListingImage",
+        "DELETE",
+        "/shops/{shop_id}/listings/{listing_id}/images/{listing_image_id}",
+        ("shop_id", "listing_id", "listing_image_id"),
+        (),
+    ),
+    (
+        "deleteListingPersonalization",
+        "DELETE",
+        "/shops/{shop_id}/listings/{listing_id}/personalization",
+        ("shop_id", "listing_id"),
+        (),
+    ),
+    (
+        "deleteListingProperty",
+        "DELETE",
+        "/shops/{shop_id}/listings/{listing_id}/properties/{property_id}",
+        ("shop_id", "listing_id", "property_id"),
+        (),
+    ),
+    (
+        "deleteListingVideo",
+        "DELETE",
+        "/shops/{shop_id}/listings/{listing_id}/videos/{video_id}",
+        ("shop_id", "listing_id", "video_id"),
+        (),
+    ),
+    (
+        "deleteShopReadinessStateDefinition",
+        "DELETE",
+        "/shops/{shop_id}/readiness-state-definitions/{readiness_state_definition_id}",
+        ("shop_id", "readiness_state_definition_id"),
+        (),
+    ),
+    (
+        "deleteShopReturnPolicy",
+        "DELETE",
+        "/shops/{shop_id}/policies/return/{return_policy_id}",
+        ("shop_id", "return_policy_id"),
+        (),
+    ),
+    (
+        "deleteShopSection",
+        "DELETE",
+        "/shops/{shop_id}/sections/{shop_section_id}",
+        ("shop_id", "shop_section_id"),
+        (),
+    ),
+    (
+        "deleteShopShippingProfile",
+        "DELETE",
+        "/shops/{shop_id}/shipping-profiles/{shipping_profile_id}",
+        ("shop_id", "shipping_profile_id"),
+        (),
+    ),
+    (
+        "deleteShopShippingProfileDestination",
+        "DELETE",
+        "/shops/{shop_id}/shipping-profiles/{shipping_profile_id}/destinations/{shipping_profile_destination_id}",
+        ("shop_id", "shipping_profile_id", "shipping_profile_destination_id"),
+        (),
+    ),
+    (
+        "deleteShopShippingProfileUpgrade",
+        "DELETE",
+        "/shops/{shop_id}/shipping-profiles/{shipping_profile_id}/upgrades/{upgrade_id}",
+        ("shop_id", "shipping_profile_id", "upgrade_id"),
+        (),
+    ),
+    (
+        "deleteUserAddress",
+        "DELETE",
+        "/user/addresses/{user_address_id}",
+        ("user_address_id",),
+        (),
+    ),
+    (
+        "findAllActiveListingsByShop",
+        "GET",
+        "/shops/{shop_id}/listings/active",
+        ("shop_id",),
+        ("limit", "sort_on", "sort_order", "offset", "keywords"),
+    ),
+    (
+        "findAllListingsActive",
+        "GET",
+        "/listings/active",
+        (),
+        ("limit", "offset", "keywords", "sort_on", "sort_order", "min_price", "max_price", "taxonomy_id", "shop_location", "is_safe", "currency", "buyer_country"),
+    ),
+    (
+        "findShops",
+        "GET",
+        "/shops",
+        (),
+        ("shop_name", "limit", "offset"),
+    ),
+    (
+        "getAllListingFiles",
+        "GET",
+        "/shops/{shop_id}/listings/{listing_id}/files",
+        ("shop_id", "listing_id"),
+        (),
+    ),
+    (
+        "getBuyerTaxonomyNodes",
+        "GET",
+        "/buyer-taxonomy/nodes",
+        (),
+        (),
+    ),
+    (
+        "getFeaturedListingsByShop",
+        "GET",
+        "/shops/{shop_id}/listings/featured",
+        ("shop_id",),
+        ("limit", "offset", "legacy"),
+    ),
+    (
+        "getHolidayPreferences",
+        "GET",
+        "/shops/{shop_id}/holiday-preferences",
+        ("shop_id",),
+        (),
+    ),
+    (
+        "getListing",
+        "GET",
+        "/listings/{listing_id}",
+        ("listing_id",),
+        ("includes", "language", "allow_suggested_title"),
+    ),
+    (
+        "getListingFile",
+        "GET",
+        "/shops/{shop_id}/listings/{listing_id}/files/{listing_file_id}",
+        ("shop_id", "listing_id", "listing_file_id"),
+        (),
+    ),
+    (
+        "getListingImage",
+        "GET",
+        "/listings/{listing_id}/images/{listing_image_id}",
+        ("listing_id", "listing_image_id"),
+        (),
+    ),
+    (
+        "getListingImages",
+        "GET",
+        "/listings/{listing_id}/images",
+        ("listing_id",),
+        (),
+    ),
+    (
+        "getListingInventory",
+        "GET",
+        "/listings/{listing_id}/inventory",
+        ("listing_id",),
+        ("show_deleted", "includes"),
+    ),
+    (
+        "getListingOffering",
+        "GET",
+        "/listings/{listing_id}/products/{product_id}/offerings/{product_offering_id}",
+        ("listing_id", "product_id", "product_offering_id"),
+        ("legacy",),
+    ),
+    (
+        "getListingPersonalization",
+        "GET",
+        "/listings/{listing_id}/personalization",
+        ("listing_id",),
+        (),
+    ),
+    (
+        "getListingProduct",
+        "GET",
+        "/listings/{listing_id}/inventory/products/{product_id}",
+        ("listing_id", "product_id"),
+        ("legacy",),
+    ),
+    (
+        "getListingProperties",
+        "GET",
+        "/shops/{shop_id}/listings/{listing_id}/properties",
+        ("shop_id", "listing_id"),
+        (),
+    ),
+    (
+        "getListingProperty",
+        "GET",
+        "/listings/{listing_id}/properties/{property_id}",
+        ("listing_id", "property_id"),
+        (),
+    ),
+    (
+        "getListingTranslation",
+        "GET",
+        "/shops/{shop_id}/listings/{listing_id}/translations/{language}",
+        ("shop_id", "listing_id", "language"),
+        (),
+    ),
+    (
+        "getListingVariationImages",
+        "GET",
+        "/shops/{shop_id}/listings/{listing_id}/variation-images",
+        ("shop_id", "listing_id"),
+        (),
+    ),
+    (
+        "getListingVideo",
+        "GET",
+        "/listings/{listing_id}/videos/{video_id}",
+        ("listing_id", "video_id"),
+        (),
+    ),
+    (
+        "getListingVideos",
+        "GET",
+        "/listings/{listing_id}/videos",
+        ("listing_id",),
+        (),
+    ),
+    (
+        "getListingsByListingIds",
+        "GET",
+        "/listings/batch",
+        (),
+        ("listing_ids", "includes", "legacy", "currency", "buyer_country"),
+    ),
+    (
+        "getListingsByShop",
+        "GET",
+        "/shops/{shop_id}/listings",
+        ("shop_id",),
+        ("state", "limit", "offset", "sort_on", "sort_order", "includes"),
+    ),
+    (
+        "getListingsByShopReceipt",
+        "GET",
+        "/shops/{shop_id}/receipts/{receipt_id}/listings",
+        ("shop_id", "receipt_id"),
+        ("limit", "offset", "legacy"),
+    ),
+    (
+        "getListingsByShopReturnPolicy",
+        "GET",
+        "/shops/{shop_id}/policies/return/{return_policy_id}/listings",
+        ("shop_id", "return_policy_id"),
+        ("legacy",),
+    ),
+    (
+        "getListingsByShopSectionId",
+        "GET",
+        "/shops/{shop_id}/shop-sections/listings",
+        ("shop_id",),
+        ("shop_section_ids", "limit", "offset", "sort_on", "sort_order", "legacy"),
+    ),
+    (
+        "getListingsInventoryByListingIds",
+        "GET",
+        "/listings/batch/inventory",
+        (),
+        ("listing_ids",),
+    ),
+    (
+        "getListingsShippingByListingIds",
+        "GET",
+        "/listings/batch/shipping",
+        (),
+        ("listing_ids",),
+    ),
+    (
+        "getMe",
+        "GET",
+        "/users/me",
+        (),
+        (),
+    ),
+    (
+        "getPaymentAccountLedgerEntryPayments",
+        "GET",
+        "/shops/{shop_id}/payment-account/ledger-entries/payments",
+        ("shop_id",),
+        ("ledger_entry_ids",),
+    ),
+    (
+        "getPayments",
+        "GET",
+        "/shops/{shop_id}/payments",
+        ("shop_id",),
+        ("payment_ids",),
+    ),
+    (
+        "getPropertiesByBuyerTaxonomyId",
+        "GET",
+        "/buyer-taxonomy/nodes/{taxonomy_id}/properties",
+        ("taxonomy_id",),
+        (),
+    ),
+    (
+        "getPropertiesByTaxonomyId",
+        "GET",
+        "/seller-taxonomy/nodes/{taxonomy_id}/properties",
+        ("taxonomy_id",),
+        (),
+    ),
+    (
+        "getReviewsByListing",
+        "GET",
+        "/listings/{listing_id}/reviews",
+        ("listing_id",),
+        ("limit", "offset", "min_created", "max_created"),
+    ),
+    (
+        "getReviewsByShop",
+        "GET",
+        "/shops/{shop_id}/reviews",
+        ("shop_id",),
+        ("limit", "offset", "min_created", "max_created"),
+    ),
+    (
+        "getSellerTaxonomyNodes",
+        "GET",
+        "/seller-taxonomy/nodes",
+        (),
+        (),
+    ),
+    (
+        "getShippingCarriers",
+        "GET",
+        "/shipping-carriers",
+        (),
+        ("origin_country_iso",),
+    ),
+    (
+        "getShop",
+        "GET",
+        "/shops/{shop_id}",
+        ("shop_id",),
+        (),
+    ),
+    (
+        "getShopByOwnerUserId",
+        "GET",
+        "/users/{user_id}/shops",
+        ("user_id",),
+        (),
+    ),
+    (
+        "getShopPaymentAccountLedgerEntries",
+        "GET",
+        "/shops/{shop_id}/payment-account/ledger-entries",
+        ("shop_id",),
+        ("min_created", "max_created", "limit", "offset"),
+    ),
+    (
+        "getShopPaymentAccountLedgerEntry",
+        "GET",
+        "/shops/{shop_id}/payment-account/ledger-entries/{ledger_entry_id}",
+        ("shop_id", "ledger_entry_id"),
+        (),
+    ),
+    (
+        "getShopPaymentByReceiptId",
+        "GET",
+        "/shops/{shop_id}/receipts/{receipt_id}/payments",
+        ("shop_id", "receipt_id"),
+        (),
+    ),
+    (
+        "getShopProductionPartners",
+        "GET",
+        "/shops/{shop_id}/production-partners",
+        ("shop_id",),
+        (),
+    ),
+    (
+        "getShopReadinessStateDefinition",
+        "GET",
+        "/shops/{shop_id}/readiness-state-definitions/{readiness_state_definition_id}",
+        ("shop_id", "readiness_state_definition_id"),
+        (),
+    ),
+    (
+        "getShopReadinessStateDefinitions",
+        "GET",
+        "/shops/{shop_id}/readiness-state-definitions",
+        ("shop_id",),
+        ("limit", "offset"),
+    ),
+    (
+        "getShopReceipt",
+        "GET",
+        "/shops/{shop_id}/receipts/{receipt_id}",
+        ("shop_id", "receipt_id"),
+        ("legacy",),
+    ),
+    (
+        "getShopReceiptTransaction",
+        "GET",
+        "/shops/{shop_id}/transactions/{transaction_id}",
+        ("shop_id", "transaction_id"),
+        (),
+    ),
+    (
+        "getShopReceiptTransactionsByListing",
+        "GET",
+        "/shops/{shop_id}/listings/{listing_id}/transactions",
+        ("shop_id", "listing_id"),
+        ("limit", "offset", "legacy"),
+    ),
+    (
+        "getShopReceiptTransactionsByReceipt",
+        "GET",
+        "/shops/{shop_id}/receipts/{receipt_id}/transactions",
+        ("shop_id", "receipt_id"),
+        ("legacy",),
+    ),
+    (
+        "getShopReceiptTransactionsByShop",
+        "GET",
+        "/shops/{shop_id}/transactions",
+        ("shop_id",),
+        ("limit", "offset", "legacy"),
+    ),
+    (
+        "getShopReceipts",
+        "GET",
+        "/shops/{shop_id}/receipts",
+        ("shop_id",),
+        ("min_created", "max_created", "min_last_modified", "max_last_modified", "limit", "offset", "sort_on", "sort_order", "was_paid", "was_shipped", "was_delivered", "was_canceled", "legacy"),
+    ),
+    (
+        "getShopReturnPolicies",
+        "GET",
+        "/shops/{shop_id}/policies/return",
+        ("shop_id",),
+        (),
+    ),
+    (
+        "getShopReturnPolicy",
+        "GET",
+        "/shops/{shop_id}/policies/return/{return_policy_id}",
+        ("shop_id", "return_policy_id"),
+        (),
+    ),
+    (
+        "getShopSection",
+        "GET",
+        "/shops/{shop_id}/sections/{shop_section_id}",
+        ("shop_id", "shop_section_id"),
+        (),
+    ),
+    (
+        "getShopSections",
+        "GET",
+        "/shops/{shop_id}/sections",
+        ("shop_id",),
+        (),
+    ),
+    (
+        "getShopShippingProfile",
+        "GET",
+        "/shops/{shop_id}/shipping-profiles/{shipping_profile_id}",
+        ("shop_id", "shipping_profile_id"),
+        (),
+    ),
+    (
+        "getShopShippingProfileDestinationsByShippingProfile",
+        "GET",
+        "/shops/{shop_id}/shipping-profiles/{shipping_profile_id}/destinations",
+        ("shop_id", "shipping_profile_id"),
+        ("limit", "offset"),
+    ),
+    (
+        "getShopShippingProfileUpgrades",
+        "GET",
+        "/shops/{shop_id}/shipping-profiles/{shipping_profile_id}/upgrades",
+        ("shop_id", "shipping_profile_id"),
+        (),
+    ),
+    (
+        "getShopShippingProfiles",
+        "GET",
+        "/shops/{shop_id}/shipping-profiles",
+        ("shop_id",),
+        (),
+    ),
+    (
+        "getUser",
+        "GET",
+        "/users/{user_id}",
+        ("user_id",),
+        (),
+    ),
+    (
+        "getUserAddress",
+        "GET",
+        "/user/addresses/{user_address_id}",
+        ("user_address_id",),
+        (),
+    ),
+    (
+        "getUserAddresses",
+        "GET",
+        "/user/addresses",
+        (),
+        ("limit", "offset"),
+    ),
+    (
+        "ping",
+        "GET",
+        "/openapi-ping",
+        (),
+        (),
+    ),
+    (
+        "tokenScopes",
+        "POST",
+        "/scopes",
+        (),
+        (),
+    ),
+    (
+        "updateHolidayPreferences",
+        "PUT",
+        "/shops/{shop_id}/holiday-preferences/{holiday_id}",
+        ("shop_id", "holiday_id"),
+        (),
+    ),
+    (
+        "updateListing",
+        "PATCH",
+        "/shops/{shop_id}/listings/{listing_id}",
+        ("shop_id", "listing_id"),
+        (),
+    ),
+    (
+        "updateListingInventory",
+        "PUT",
+        "/listings/{listing_id}/inventory",
+        ("listing_id",),
+        ("max_variations_supported",),
+    ),
+    (
+        "updateListingPersonalization",
+        "POST",
+        "/shops/{shop_id}/listings/{listing_id}/personalization",
+        ("shop_id", "listing_id"),
+        ("supports_multiple_personalization_questions",),
+    ),
+    (
+        "updateListingProperty",
+        "PUT",
+        "/shops/{shop_id}/listings/{listing_id}/properties/{property_id}",
+        ("shop_id", "listing_id", "property_id"),
+        (),
+    ),
+    (
+        "updateListingTranslation",
+        "PUT",
+        "/shops/{shop_id}/listings/{listing_id}/translations/{language}",
+        ("shop_id", "listing_id", "language"),
+        (),
+    ),
+    (
+        "updateShop",
+        "PUT",
+        "/shops/{shop_id}",
+        ("shop_id",),
+        (),
+    ),
+    (
+        "updateShopReadinessStateDefinition",
+        "PUT",
+        "/shops/{shop_id}/readiness-state-definitions/{readiness_state_definition_id}",
+        ("shop_id", "readiness_state_definition_id"),
+        (),
+    ),
+    (
+        "updateShopReceipt",
+        "PUT",
+        "/shops/{shop_id}/receipts/{receipt_id}",
+        ("shop_id", "receipt_id"),
+        ("legacy",),
+    ),
+    (
+        "updateShopReturnPolicy",
+        "PUT",
+        "/shops/{shop_id}/policies/return/{return_policy_id}",
+        ("shop_id", "return_policy_id"),
+        (),
+    ),
+    (
+        "updateShopSection",
+        "PUT",
+        "/shops/{shop_id}/sections/{shop_section_id}",
+        ("shop_id", "shop_section_id"),
+        (),
+    ),
+    (
+        "updateShopShippingProfile",
+        "PUT",
+        "/shops/{shop_id}/shipping-profiles/{shipping_profile_id}",
+        ("shop_id", "shipping_profile_id"),
+        (),
+    ),
+    (
+        "updateShopShippingProfileDestination",
+        "PUT",
+        "/shops/{shop_id}/shipping-profiles/{shipping_profile_id}/destinations/{shipping_profile_destination_id}",
+        ("shop_id", "shipping_profile_id", "shipping_profile_destination_id"),
+        (),
+    ),
+    (
+        "updateShopShippingProfileUpgrade",
+        "PUT",
+        "/shops/{shop_id}/shipping-profiles/{shipping_profile_id}/upgrades/{upgrade_id}",
+        ("shop_id", "shipping_profile_id", "upgrade_id"),
+        (),
+    ),
+    (
+        "updateVariationImages",
+        "POST",
+        "/shops/{shop_id}/listings/{listing_id}/variation-images",
+        ("shop_id", "listing_id"),
+        (),
+    ),
+    (
+        "uploadListingFile",
+        "POST",
+        "/shops/{shop_id}/listings/{listing_id}/files",
+        ("shop_id", "listing_id"),
+        (),
+    ),
+    (
+        "uploadListingImage",
+        "POST",
+        "/shops/{shop_id}/listings/{listing_id}/images",
+        ("shop_id", "listing_id"),
+        (),
+    ),
+    (
+        "uploadListingVideo",
+        "POST",
+        "/shops/{shop_id}/listings/{listing_id}/videos",
+        ("shop_id", "listing_id"),
+        (),
+    ),
+)
@@ -0,0 +1,144 @@
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+from etsy_python.v3.common.Hooks import uri_template
+from etsy_python.v3.common.OperationTable import OPERATION_TABLE
+
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+_PATH_PARAM = re.compile(r"\{(\w+)\}")
+
+
+@dataclass(frozen=True)
+class Operation:
+    """One Etsy API operation: method, path template and parameter names.
+
+    ``path`` is relative to the API root (``/shops/{shop_id}/listings``), as
+    passed to ``EtsyClient.make_request``.
+    """
+
+    operation_id: str
+    method: str
+    path: str
+    path_params: Tuple[str, ...] = ()
+    query_params: Tuple[str, ...] = ()
+
+    @property
+    def idempotent(self) -> bool:
+        """Safe to resend: GET, PUT and DELETE, per HTTP semantics."""
+        return self.method in IDEMPOTENT_METHODS
+
+    def format_path(self, *args: Any, **kwargs: Any) -> str:
+        """Fill the path template, positionally in path order or by name."""
+        return _compiled_format(self.path)(*args, **kwargs)
+
+    def query(self, **values: Any) -> Dict[str, Any]:
+        """``values`` as a ``query_params`` dict; unknown names raise ``TypeError``."""
+        unknown = set(values).difference(self.query_params)
+        if unknown:
+            raise TypeError(
+                f"{self.operation_id} has no query parameter(s) {', '.join(sorted(unknown))}"
+            )
+        return values
+
+
+_FORMATS: Dict[str, Any] = {}
+
+
+def _compiled_format(path: str) -> Any:
+    # "/shops/{shop_id}/listings/{listing_id}" -> "/shops/{0}/listings/{1}" plus
+    # the name order, so both positional and keyword calls are a single format().
+    compiled = _FORMATS.get(path)
+    if compiled is None:
+        names = _PATH_PARAM.findall(path)
+        template = _PATH_PARAM.sub(lambda m: "{%d}" % names.index(m.group(1)), path)
+
+        def compiled(*args: Any, **kwargs: Any) -> str:
+            if kwargs:
+                missing = [name for name in names[len(args):] if name not in kwargs]
+                if missing:
+                    raise TypeError(f"{path} is missing {', '.join(missing)}")
+                args = args + tuple(kwargs[name] for name in names[len(args):])
+            elif len(args) != len(names):
+                raise TypeError(f"{path} takes {len(names)} path parameter(s)")
+            return template.format(*args)
+
+        _FORMATS[path] = compiled
+    return compiled
+
+
+class OperationRegistry:
+    """Operations by operationId, with reverse lookup from request paths.
+
+    :meth:`resolve` maps a method and concrete path (``/listings/123``) back
+    to its operation, preferring literal segments over parameters so
+    ``/listings/batch`` resolves to ``getListingsByListingIds`` rather than
+    ``getListing``. Patterns are compiled on first use and lookups are cached
+    per URI template.
+    """
+
+    _CACHE_LIMIT = 2048
+
+    def __init__(self, operations: Iterable[Operation]) -> None:
+        self._operations: Dict[str, Operation] = {
+            operation.operation_id: operation for operation in operations
+        }
+        self._patterns: Optional[Dict[str, List[Tuple[Pattern[str], Operation]]]] = None
+        self._resolved: Dict[Tuple[str, str], Optional[Operation]] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, operation_id: str) -> Operation:
+        return self._operations[operation_id]
+
+    def __contains__(self, operation_id: object) -> bool:
+        return operation_id in self._operations
+
+    def __iter__(self) -> Iterator[Operation]:
+        return iter(self._operations.values())
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def get(self, operation_id: str) -> Optional[Operation]:
+        return self._operations.get(operation_id)
+
+    def _compile(self) -> Dict[str, List[Tuple[Pattern[str], Operation]]]:
+        with self._lock:
+            if self._patterns is None:
+                by_method: Dict[str, List[Tuple[Pattern[str], Operation]]] = {}
+                ordered = sorted(
+                    self._operations.values(),
+                    key=lambda op: (len(op.path_params), op.path),
+                )
+                for operation in ordered:
+                    pattern = re.compile(
+                        "/".join(
+                            "[^/]+" if _PATH_PARAM.fullmatch(segment) else re.escape(segment)
+                            for segment in operation.path.split("/")
+                        )
+                        + r"\Z"
+                    )
+                    by_method.setdefault(operation.method, []).append((pattern, operation))
+                self._patterns = by_method
+            return self._patterns
+
+    def resolve(self, method: str, uri_path: str) -> Optional[Operation]:
+        """The operation serving ``method uri_path``, or None if unknown."""
+        key = (method, uri_template(uri_path.split("?", 1)[0]))
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
+        patterns = self._patterns if self._patterns is not None else self._compile()
+        operation = next(
+            (op for pattern, op in patterns.get(method, ()) if pattern.match(key[1])),
+            None,
+        )
+        if len(self._resolved) >= self._CACHE_LIMIT:
+            self._resolved.clear()
+        self._resolved[key] = operation
+        return operation
+
+
+REGISTRY = OperationRegistry(Operation(*row) for row in OPERATION_TABLE)
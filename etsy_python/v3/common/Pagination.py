@@ -0,0 +1,46 @@
+from typing import Any, Callable, Dict, Iterator, List
+
+from etsy_python.v3.resources.Response import Response
+
+# Largest page size Etsy accepts on its offset-paginated collection endpoints.
+MAX_PAGE_LIMIT = 100
+
+
+def iterate_pages(
+    fetch: Callable[..., Response],
+    *args: Any,
+    limit: int = MAX_PAGE_LIMIT,
+    offset: int = 0,
+    **kwargs: Any,
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield the ``results`` of each page returned by an offset-paginated call.
+
+    ``fetch`` is a bound resource method such as
+    ``ReceiptResource.get_shop_receipts``; ``limit`` and ``offset`` are passed
+    through as keyword arguments. Only one page is held at a time, so callers
+    that consume the generator incrementally keep memory flat regardless of the
+    collection size. Iteration stops on a short page or once ``count`` is
+    reached.
+    """
+    while True:
+        response = fetch(*args, limit=limit, offset=offset, **kwargs)
+        message = response.message if isinstance(response.message, dict) else {}
+        results = message.get("results") or []
+        if results:
+            yield results
+        offset += len(results)
+        count = message.get("count")
+        if len(results) < limit or (count is not None and offset >= count):
+            return
+
+
+def iterate_results(
+    fetch: Callable[..., Response],
+    *args: Any,
+    limit: int = MAX_PAGE_LIMIT,
+    offset: int = 0,
+    **kwargs: Any,
+) -> Iterator[Dict[str, Any]]:
+    """Flatten :func:`iterate_pages` into a stream of individual records."""
+    for page in iterate_pages(fetch, *args, limit=limit, offset=offset, **kwargs):
+        yield from page
@@ -0,0 +1,161 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from etsy_python.v3.common.Hooks import RequestEvent, RequestHook
+
+DEFAULT_WINDOW = 3600.0
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class QuotaSnapshot:
+    """Point-in-time view of the daily budget.
+
+    ``remaining_today`` is the last value Etsy reported minus the calls this
+    tracker has seen since, so it stays useful between responses that carry
+    no rate-limit headers. Rates are calls per hour over the tracker window.
+    """
+
+    limit_per_day: Optional[int]
+    remaining_today: Optional[int]
+    limit_per_second: Optional[int]
+    remaining_this_second: Optional[int]
+    calls_per_hour: float
+    operation_rates: Dict[str, float] = field(default_factory=dict)
+    seconds_until_exhausted: Optional[float] = None
+    exhausted_at: Optional[datetime] = None
+
+
+class QuotaTracker(RequestHook):
+    """Aggregate the ``X-Limit-*`` / ``X-Remaining-*`` headers across calls.
+
+    Installed on every ``EtsyClient`` as ``client.quota``. Besides reporting
+    the remaining daily budget and per-operation consumption, it answers
+    :meth:`can_afford`, which batch jobs can poll to leave headroom for
+    interactive traffic.
+    """
+
+    def __init__(
+        self, window: float = DEFAULT_WINDOW, clock: Callable[[], float] = time.time
+    ) -> None:
+        self.window = window
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._calls: Deque[Tuple[float, str]] = deque()
+        self._first_call: Optional[float] = None
+        self.limit_per_day: Optional[int] = None
+        self.limit_per_second: Optional[int] = None
+        self._reported_remaining: Optional[int] = None
+        self._remaining_this_second: Optional[int] = None
+        self._reported_at: Optional[float] = None
+        self._calls_since_report = 0
+
+    def after_response(self, event: RequestEvent) -> None:
+        self.observe(event.operation, event.rate_limits)
+
+    def observe(self, operation: str, rate_limits: Any = None) -> None:
+        """Record one call that reached Etsy, with its rate-limit headers if any."""
+        now = self.clock()
+        with self._lock:
+            self._calls.append((now, operation))
+            if self._first_call is None:
+                self._first_call = now
+            self._prune(now)
+
+            remaining = _as_int(getattr(rate_limits, "remaining_today", None))
+            if remaining is None:
+                self._calls_since_report += 1
+                return
+            self._reported_remaining = remaining
+            self._reported_at = now
+            self._calls_since_report = 0
+            self._remaining_this_second = _as_int(
+                getattr(rate_limits, "remaining_this_second", None)
+            )
+            self.limit_per_day = (
+                _as_int(getattr(rate_limits, "limit_per_day", None)) or self.limit_per_day
+            )
+            self.limit_per_second = (
+                _as_int(getattr(rate_limits, "limit_per_second", None))
+                or self.limit_per_second
+            )
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._calls and self._calls[0][0] < cutoff:
+            self._calls.popleft()
+
+    def _remaining_today(self) -> Optional[int]:
+        if self._reported_remaining is None:
+            return None
+        return max(self._reported_remaining - self._calls_since_report, 0)
+
+    def _span(self, now: float) -> float:
+        # Until a full window has elapsed, rate over the time actually observed.
+        observed = now - self._first_call if self._first_call is not None else 0.0
+        return max(min(observed, self.window), 1.0)
+
+    def snapshot(self) -> QuotaSnapshot:
+        now = self.clock()
+        with self._lock:
+            self._prune(now)
+            span = self._span(now)
+            counts: Dict[str, int] = {}
+            for _, operation in self._calls:
+                counts[operation] = counts.get(operation, 0) + 1
+            per_hour = 3600.0 / span
+            remaining = self._remaining_today()
+            remaining_this_second = (
+                self._remaining_this_second
+                if self._reported_at is not None and now - self._reported_at < 1.0
+                else self.limit_per_second
+            )
+            snapshot = QuotaSnapshot(
+                limit_per_day=self.limit_per_day,
+                remaining_today=remaining,
+                limit_per_second=self.limit_per_second,
+                remaining_this_second=remaining_this_second,
+                calls_per_hour=len(self._calls) * per_hour,
+                operation_rates={op: n * per_hour for op, n in counts.items()},
+            )
+        if remaining is not None and snapshot.calls_per_hour > 0:
+            seconds = remaining / snapshot.calls_per_hour * 3600.0
+            snapshot.seconds_until_exhausted = seconds
+            snapshot.exhausted_at = datetime.fromtimestamp(
+                now, tz=timezone.utc
+            ) + timedelta(seconds=seconds)
+        return snapshot
+
+    def can_afford(self, calls: int = 1, reserve: int = 0) -> bool:
+        """Whether ``calls`` more requests fit the budget right now.
+
+        ``reserve`` daily calls are held back, so a batch job asking with a
+        reserve stops before it starves interactive callers. While the last
+        per-second reading is fresh, the current second must also have room
+        for the first ``limit_per_second`` of those calls. Before any headers
+        have been seen the budget is unknown and this answers ``True``.
+        """
+        now = self.clock()
+        with self._lock:
+            remaining = self._remaining_today()
+            if remaining is not None and remaining - reserve < calls:
+                return False
+            if (
+                self._remaining_this_second is not None
+                and self._reported_at is not None
+                and now - self._reported_at < 1.0
+            ):
+                burst = min(calls, self.limit_per_second or calls)
+                if self._remaining_this_second - self._calls_since_report < burst:
+                    return False
+        return True
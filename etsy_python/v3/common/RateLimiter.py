@@ -0,0 +1,237 @@
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Any, Callable, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+DEFAULT_PER_SECOND = 10.0
+
+# tokens, last update (wall clock seconds)
+_STATE = struct.Struct("dd")
+
+
+def _take(
+    state: Optional[Tuple[float, float]],
+    now: float,
+    rate: float,
+    capacity: float,
+    tokens: float,
+    max_delay: Optional[float] = None,
+) -> Tuple[Tuple[float, float], Optional[float]]:
+    """Token-bucket step shared by every backend.
+
+    Callers that find the bucket empty still take their tokens, driving the
+    balance negative, and are told how long to wait for them. Concurrent
+    callers therefore queue up one slot apart instead of polling. When the
+    wait would exceed ``max_delay`` nothing is taken and the delay is ``None``.
+    """
+    balance, updated = state if state is not None else (capacity, now)
+    balance = min(capacity, balance + max(now - updated, 0.0) * rate)
+    after = balance - tokens
+    delay = -after / rate if after < 0 else 0.0
+    if max_delay is not None and delay > max_delay:
+        return (balance, now), None
+    return (after, now), delay
+
+
+class RateLimitBackend:
+    """Storage for a token bucket; override :meth:`reserve`.
+
+    ``reserve`` must apply :func:`_take` atomically with respect to every
+    other client sharing the budget and return the seconds to wait before
+    sending, or ``None`` if that would exceed ``max_delay``. Backends for a
+    network store only need to implement this.
+    """
+
+    def reserve(
+        self,
+        rate: float,
+        capacity: float,
+        tokens: float,
+        now: float,
+        max_delay: Optional[float] = None,
+    ) -> Optional[float]:
+        raise NotImplementedError
+
+
+class LocalRateLimitBackend(RateLimitBackend):
+    """Budget shared by the threads of one process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._state: Optional[Tuple[float, float]] = None
+
+    def reserve(
+        self,
+        rate: float,
+        capacity: float,
+        tokens: float,
+        now: float,
+        max_delay: Optional[float] = None,
+    ) -> Optional[float]:
+        with self._lock:
+            self._state, delay = _take(
+                self._state, now, rate, capacity, tokens, max_delay
+            )
+        return delay
+
+
+class FileRateLimitBackend(RateLimitBackend):
+    """Budget shared by every process on the host through a memory-mapped file.
+
+    Each reservation holds an exclusive ``flock`` on ``path`` while it
+    updates the bucket, so the critical section is a few microseconds. The
+    file is reopened after a fork, because a forked child shares the parent's
+    open file description and ``flock`` would not exclude the two. POSIX only;
+    use :class:`SQLiteRateLimitBackend` elsewhere.
+    """
+
+    def __init__(self, path: str) -> None:
+        if fcntl is None:
+            raise RuntimeError("FileRateLimitBackend requires fcntl (POSIX)")
+        self.path = path
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._fd = -1
+        self._map: Optional[mmap.mmap] = None
+
+    def _open(self) -> mmap.mmap:
+        if self._pid != os.getpid() or self._map is None:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            if os.fstat(self._fd).st_size < _STATE.size:
+                os.ftruncate(self._fd, _STATE.size)
+            self._map = mmap.mmap(self._fd, _STATE.size)
+            self._pid = os.getpid()
+        return self._map
+
+    def reserve(
+        self,
+        rate: float,
+        capacity: float,
+        tokens: float,
+        now: float,
+        max_delay: Optional[float] = None,
+    ) -> Optional[float]:
+        with self._lock:
+            view = self._open()
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                balance, updated = _STATE.unpack_from(view)
+                # A fresh, zero-filled file has never been written.
+                state = (balance, updated) if updated else None
+                state, delay = _take(state, now, rate, capacity, tokens, max_delay)
+                _STATE.pack_into(view, 0, *state)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return delay
+
+    def close(self) -> None:
+        with self._lock:
+            if self._map is not None and self._pid == os.getpid():
+                self._map.close()
+                os.close(self._fd)
+            self._map = None
+            self._pid = None
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """Budget shared through a SQLite database, one row per ``name``.
+
+    ``BEGIN IMMEDIATE`` serialises writers across processes. Slower than the
+    file backend, but portable and able to hold several named budgets (for
+    example one per app key) in a single file.
+    """
+
+    def __init__(self, path: str, name: str = "default", timeout: float = 5.0) -> None:
+        self.path = path
+        self.name = name
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> Any:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            import sqlite3
+
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits "
+                "(name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def reserve(
+        self,
+        rate: float,
+        capacity: float,
+        tokens: float,
+        now: float,
+        max_delay: Optional[float] = None,
+    ) -> Optional[float]:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated FROM rate_limits WHERE name = ?", (self.name,)
+            ).fetchone()
+            state, delay = _take(row, now, rate, capacity, tokens, max_delay)
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limits (name, tokens, updated) "
+                "VALUES (?, ?, ?)",
+                (self.name, *state),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return delay
+
+
+class RateLimiter:
+    """Client-side limiter in front of ``EtsyClient.make_request``.
+
+    Pass the same backend location to every client, e.g.
+    ``RateLimiter(backend=FileRateLimitBackend("/tmp/etsy.ratelimit"))`` in
+    each gunicorn and Celery worker, and together they stay under
+    ``per_second``. ``burst`` defaults to one second's worth of calls.
+    """
+
+    def __init__(
+        self,
+        per_second: float = DEFAULT_PER_SECOND,
+        burst: Optional[float] = None,
+        backend: Optional[RateLimitBackend] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if per_second <= 0:
+            raise ValueError("per_second must be positive")
+        self.per_second = per_second
+        self.burst = burst if burst is not None else per_second
+        self.backend = backend if backend is not None else LocalRateLimitBackend()
+        self.clock = clock
+        self.sleep = sleep
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until ``tokens`` calls may be sent; returns the time waited."""
+        delay = self.backend.reserve(self.per_second, self.burst, tokens, self.clock())
+        if delay > 0:
+            self.sleep(delay)
+        return delay
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take ``tokens`` only if they are available right now; never waits."""
+        delay = self.backend.reserve(
+            self.per_second, self.burst, tokens, self.clock(), max_delay=0.0
+        )
+        return delay is not None
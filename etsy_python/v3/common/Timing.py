@@ -0,0 +1,62 @@
+import threading
+from time import perf_counter
+from typing import Any
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+_connect_times = threading.local()
+
+
+def pop_connect_time() -> float:
+    """Seconds spent opening a connection for the last request on this thread.
+
+    Returns 0.0 when the request reused a pooled connection.
+    """
+    elapsed = getattr(_connect_times, "value", 0.0)
+    _connect_times.value = 0.0
+    return elapsed
+
+
+def set_connect_time(elapsed: float) -> None:
+    """Record connection setup time for transports that time it themselves."""
+    _connect_times.value = elapsed
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self) -> None:
+        start = perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_times.value = perf_counter() - start
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    # Includes the TLS handshake as well as DNS and TCP connect.
+    def connect(self) -> None:
+        start = perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_times.value = perf_counter() - start
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools record connection setup time per thread."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
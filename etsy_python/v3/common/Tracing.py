@@ -0,0 +1,143 @@
+from contextlib import contextmanager
+from importlib.util import find_spec
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+from etsy_python._version import __version__
+from etsy_python.v3.common.Hooks import RequestEvent, RequestHook
+
+
+def _otel_installed() -> bool:
+    try:
+        return find_spec("opentelemetry.trace") is not None
+    except ImportError:  # pragma: no cover - exercised when OTel is absent
+        return False
+
+
+# Only probe for the package here; the API itself is imported when the first
+# TracingHook is created, keeping it off the import path of the SDK.
+OTEL_AVAILABLE = _otel_installed()
+otel_trace: Any = None
+SpanKind: Any = None
+Status: Any = None
+StatusCode: Any = None
+
+
+def _load_otel() -> None:
+    global otel_trace, SpanKind, Status, StatusCode
+    if otel_trace is None:
+        from opentelemetry import trace
+        from opentelemetry.trace import SpanKind, Status, StatusCode
+
+        otel_trace = trace
+
+
+_SPAN_KEY = "otel_span"
+
+
+def _rate_limit_attributes(rate_limits: Any) -> Dict[str, int]:
+    attributes: Dict[str, int] = {}
+    if rate_limits is None:
+        return attributes
+    for name in (
+        "limit_per_second",
+        "remaining_this_second",
+        "limit_per_day",
+        "remaining_today",
+    ):
+        value = getattr(rate_limits, name, None)
+        try:
+            attributes[f"etsy.rate_limit.{name}"] = int(value)
+        except (TypeError, ValueError):
+            continue
+    return attributes
+
+
+class TracingHook(RequestHook):
+    """Emit an OpenTelemetry CLIENT span per API call.
+
+    Spans are named after the operation and carry the HTTP semantic-convention
+    attributes, the body sizes, the rate-limit budget reported by Etsy and a
+    ``retry`` event per resend. ``EtsyClient`` installs this automatically when
+    ``opentelemetry-api`` is importable; without a configured SDK the API hands
+    out non-recording spans, so the cost stays negligible.
+    """
+
+    def __init__(self, tracer_provider: Any = None) -> None:
+        if not OTEL_AVAILABLE:
+            raise ImportError(
+                "Tracing requires opentelemetry-api: pip install opentelemetry-api"
+            )
+        _load_otel()
+        self.tracer = otel_trace.get_tracer(
+            "etsy_python", __version__, tracer_provider=tracer_provider
+        )
+
+    def before_send(self, event: RequestEvent) -> None:
+        parts = urlsplit(event.url)
+        attributes = {
+            "http.request.method": event.method,
+            "url.full": event.url,
+            "url.template": event.uri_template,
+            "server.address": parts.hostname or "",
+            "etsy.operation": event.operation,
+        }
+        if parts.port is not None:
+            attributes["server.port"] = parts.port
+        event.context[_SPAN_KEY] = self.tracer.start_span(
+            event.operation, kind=SpanKind.CLIENT, attributes=attributes
+        )
+
+    def after_response(self, event: RequestEvent) -> None:
+        span = event.context.get(_SPAN_KEY)
+        if span is None:
+            return
+        span.set_attribute("http.response.status_code", event.status)
+        span.set_attribute("http.request.body.size", event.bytes_sent)
+        # Semantic conventions ask for the transferred (compressed) size.
+        span.set_attribute(
+            "http.response.body.size",
+            event.wire_bytes_received
+            if event.wire_bytes_received is not None
+            else event.bytes_received,
+        )
+        if event.content_encoding:
+            span.set_attribute("etsy.response.decoded_size", event.bytes_received)
+        if event.retries:
+            span.set_attribute("http.request.resend_count", event.retries)
+        span.set_attributes(_rate_limit_attributes(event.rate_limits))
+        # Error statuses are closed by on_error, which runs right after.
+        if event.error is None:
+            span.end()
+
+    def on_retry(self, event: RequestEvent) -> None:
+        span = event.context.get(_SPAN_KEY)
+        if span is not None:
+            span.add_event("retry", {"http.request.resend_count": event.retries})
+
+    def on_error(self, event: RequestEvent) -> None:
+        span = event.context.get(_SPAN_KEY)
+        if span is None:
+            return
+        error_type = (
+            str(event.status) if event.status is not None else type(event.error).__name__
+        )
+        span.set_attribute("error.type", error_type)
+        if event.error is not None:
+            span.record_exception(event.error)
+        span.set_status(Status(StatusCode.ERROR, str(event.error)))
+        span.end()
+
+    @contextmanager
+    def token_refresh_span(self, token_url: str) -> Iterator[Any]:
+        with self.tracer.start_as_current_span(
+            "etsy.oauth.refresh_token",
+            kind=SpanKind.CLIENT,
+            attributes={"http.request.method": "POST", "url.full": token_url},
+        ) as span:
+            yield span
+
+
+def default_tracing_hook(tracer_provider: Optional[Any] = None) -> Optional[TracingHook]:
+    """A TracingHook when OpenTelemetry is installed, else ``None``."""
+    return TracingHook(tracer_provider) if OTEL_AVAILABLE else None
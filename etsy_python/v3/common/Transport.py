@@ -0,0 +1,135 @@
+from datetime import timedelta
+from time import perf_counter
+from typing import Any, Dict, MutableMapping, Optional, Protocol
+
+import requests
+
+from etsy_python.v3.common.Timing import set_connect_time
+
+
+class Transport(Protocol):
+    """What ``EtsyClient`` needs from its HTTP layer.
+
+    ``requests.Session`` is the default and the reference: a mutable
+    ``headers`` mapping sent with every request, ``get``/``post``/``put``/
+    ``patch``/``delete`` accepting ``json``, ``data`` and ``files``, and
+    responses exposing ``status_code``, ``headers``, ``json()``, ``content``
+    and ``elapsed``. Transport failures must surface as
+    ``requests.RequestException`` so retries and circuit breakers treat
+    every transport alike.
+    """
+
+    headers: MutableMapping[str, str]
+
+    def get(self, url: str, **kwargs: Any) -> Any: ...
+
+    def post(self, url: str, **kwargs: Any) -> Any: ...
+
+    def put(self, url: str, **kwargs: Any) -> Any: ...
+
+    def patch(self, url: str, **kwargs: Any) -> Any: ...
+
+    def delete(self, url: str, **kwargs: Any) -> Any: ...
+
+    def close(self) -> None: ...
+
+
+_CONNECT_STARTED = "connection.connect_tcp.started"
+# TLS completes the connection for https; plain http stops after TCP.
+_CONNECT_DONE = ("connection.connect_tcp.complete", "connection.start_tls.complete")
+
+
+class HTTPXTransport:
+    """``httpx.Client`` behind the :class:`Transport` interface, HTTP/2 by default.
+
+    Over HTTP/2 concurrent requests to Etsy share a few multiplexed
+    connections instead of one TCP+TLS connection per in-flight request, so
+    high fan-out pays far fewer handshakes and holds far fewer sockets. The
+    client is thread-safe; one transport can back many threads. Pass
+    ``client`` to supply a preconfigured ``httpx.Client``.
+
+    Requires ``pip install etsy-python[http2]``.
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        timeout: Optional[float] = 30.0,
+        client: Any = None,
+    ) -> None:
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "HTTPXTransport requires httpx: pip install etsy-python[http2]"
+            ) from None
+        self._httpx = httpx
+        if client is None:
+            client = httpx.Client(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                ),
+                timeout=timeout,
+            )
+        self.client = client
+
+    @property
+    def headers(self) -> MutableMapping[str, str]:
+        return self.client.headers
+
+    @headers.setter
+    def headers(self, value: Dict[str, str]) -> None:
+        self.client.headers = value
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        started: Dict[str, float] = {}
+
+        def trace(event: str, info: Any) -> None:
+            if event == _CONNECT_STARTED:
+                started["connect"] = perf_counter()
+            elif event in _CONNECT_DONE and "connect" in started:
+                set_connect_time(perf_counter() - started["connect"])
+
+        start = perf_counter()
+        try:
+            response = self.client.request(
+                method, url, extensions={"trace": trace}, **kwargs
+            )
+        except self._httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except self._httpx.TransportError as e:
+            raise requests.ConnectionError(str(e)) from e
+        try:
+            response.elapsed
+        except RuntimeError:
+            # Responses built in memory (httpx.MockTransport) are never timed.
+            response.elapsed = timedelta(seconds=perf_counter() - start)
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> Any:
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs: Any) -> Any:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> Any:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        self.client.close()
+
+    def __enter__(self) -> "HTTPXTransport":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
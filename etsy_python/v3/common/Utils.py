@@ -1,6 +1,8 @@
+import re
 import warnings
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
 
 
 def warn_removed_legacy_param(operation_id: str) -> None:
@@ -25,15 +27,70 @@ def warn_removed_legacy_param(operation_id: str) -> None:
     )
 
 
-def generate_get_uri(uri: str, params: Optional[Dict[str, Any]] = None) -> str:
+# Encoded ``key=value`` pairs, keyed by parameter, value type and value.
+# Scalars (enums, bools, ints, strings) and lists of enums such as
+# ``includes`` repeat across calls; the cache is cleared when full.
+_PAIR_CACHE: Dict[Tuple[Any, ...], str] = {}
+_PAIR_CACHE_LIMIT = 1024
+_SCALARS = (str, int, float, bool)
+# Values made only of unreserved characters (and commas) need no quoting.
+_needs_no_quoting = re.compile(r"[A-Za-z0-9_.~,-]*\Z").match
+
+
+def _encode_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, Enum):
+        return _encode_value(value.value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        if all(item.__class__ is int for item in value):
+            return ",".join(map(str, value))  # ids, the common case
+        return ",".join(_encode_value(item) for item in value)
+    value = str(value)
+    if _needs_no_quoting(value):
+        return value
+    # Commas separate list items in Etsy's query syntax, so they stay literal.
+    return quote(value, safe=",")
+
+
+def _encode_pair(key: str, value: Any) -> str:
+    cls = value.__class__
+    if cls in _SCALARS or isinstance(value, Enum):
+        # The type keeps True apart from 1 (and 1.0), which compare equal.
+        cache_key: Tuple[Any, ...] = (key, cls, value)
+    elif (cls is list or cls is tuple) and value and all(
+        isinstance(item, Enum) for item in value
+    ):
+        cache_key = (key, tuple(value))
+    else:
+        return f"{quote(key, safe='')}={_encode_value(value)}"
+    encoded = _PAIR_CACHE.get(cache_key)
+    if encoded is None:
+        if len(_PAIR_CACHE) >= _PAIR_CACHE_LIMIT:
+            _PAIR_CACHE.clear()
+        encoded = _PAIR_CACHE[cache_key] = f"{quote(key, safe='')}={_encode_value(value)}"
+    return encoded
+
+
+def encode_query(params: Optional[Dict[str, Any]]) -> str:
+    """Percent-encode ``params`` as a query string (without the leading ``?``).
+
+    ``None`` values are skipped, bools become ``true``/``false``, enums are
+    sent by value and lists are comma-joined, so ``listing_ids=[1, 2]`` and
+    ``includes=[Includes.IMAGES]`` can be passed as is.
+    """
     if not params:
-        return uri
-    formatted = "&".join(
-        f"{key}={str(value).lower() if isinstance(value, bool) else value}"
-        for key, value in params.items()
-        if value is not None
+        return ""
+    return "&".join(
+        _encode_pair(key, value) for key, value in params.items() if value is not None
     )
-    return f"{uri}?{formatted}" if formatted else uri
+
+
+def generate_get_uri(uri: str, params: Optional[Dict[str, Any]] = None) -> str:
+    query = encode_query(params)
+    return f"{uri}?{query}" if query else uri
 
 
 def todict(
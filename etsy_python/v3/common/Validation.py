@@ -0,0 +1,152 @@
+import threading
+from typing import AbstractSet, Any, Callable, Collection, Dict, List, Mapping, Optional
+
+from etsy_python.v3.common.ValidationTable import VALIDATION_TABLE
+from etsy_python.v3.exceptions.ValidationException import ValidationException
+
+# A check returns an error message, or None when the value passes.
+Check = Callable[[Any], Optional[str]]
+Validator = Callable[..., List[str]]
+
+_TYPES: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "array": lambda v: isinstance(v, (list, tuple)),
+    "object": lambda v: isinstance(v, dict),
+}
+
+
+def _compile_field(rules: Mapping[str, Any]) -> Check:
+    # Only the constraints a field actually has become checks, so a typical
+    # field costs one or two comparisons.
+    checks: List[Check] = []
+    kind = rules.get("type")
+    if kind in _TYPES:
+        is_kind = _TYPES[kind]
+        checks.append(lambda v: None if is_kind(v) else f"must be of type {kind}")
+    if "enum" in rules:
+        allowed = frozenset(rules["enum"])
+        message = f"must be one of {', '.join(map(repr, rules['enum']))}"
+
+        def check_enum(value: Any) -> Optional[str]:
+            try:
+                return None if value in allowed else message
+            except TypeError:  # unhashable, so certainly not a member
+                return message
+
+        checks.append(check_enum)
+    if "minimum" in rules:
+        low = rules["minimum"]
+        checks.append(lambda v: None if v >= low else f"must be >= {low}")
+    if "exclusiveMinimum" in rules:
+        above = rules["exclusiveMinimum"]
+        checks.append(lambda v: None if v > above else f"must be > {above}")
+    if "maximum" in rules:
+        high = rules["maximum"]
+        checks.append(lambda v: None if v <= high else f"must be <= {high}")
+    if "minLength" in rules:
+        shortest = rules["minLength"]
+        checks.append(
+            lambda v: None if len(v) >= shortest else f"must be at least {shortest} characters"
+        )
+    if "maxLength" in rules:
+        longest = rules["maxLength"]
+        checks.append(
+            lambda v: None if len(v) <= longest else f"must be at most {longest} characters"
+        )
+    if "minItems" in rules:
+        fewest = rules["minItems"]
+        checks.append(lambda v: None if len(v) >= fewest else f"needs at least {fewest} items")
+    if "maxItems" in rules:
+        most = rules["maxItems"]
+        checks.append(lambda v: None if len(v) <= most else f"allows at most {most} items")
+    if "items" in rules:
+        item_check = _compile_field(rules["items"])
+
+        def check_items(values: Any) -> Optional[str]:
+            for index, item in enumerate(values):
+                error = item_check(item)
+                if error is not None:
+                    return f"item {index} ({item!r}) {error}"
+            return None
+
+        checks.append(check_items)
+    nullable = rules.get("nullable", False)
+
+    def check(value: Any) -> Optional[str]:
+        if value is None:
+            return None if nullable else "must not be null"
+        for one in checks:
+            # Later checks assume the type check passed.
+            error = one(value)
+            if error is not None:
+                return error
+        return None
+
+    return check
+
+
+def compile_validator(fields: Mapping[str, Mapping[str, Any]]) -> Validator:
+    """A function listing every problem with a request body.
+
+    Fields the rules do not mention are allowed, so SDK fields the spec has
+    not caught up with still go through. Required fields are the models'
+    concern (``Request.check_mandatory``). A null is always accepted for a
+    field in ``nullable``: the models send one to clear such a field, whether
+    or not the spec says it may be null.
+    """
+    checks = {name: _compile_field(rules) for name, rules in fields.items()}
+
+    def validate(
+        body: Mapping[str, Any], nullable: AbstractSet[str] = frozenset()
+    ) -> List[str]:
+        errors = []
+        for name, value in body.items():
+            check = checks.get(name)
+            if check is not None and (value is not None or name not in nullable):
+                error = check(value)
+                if error is not None:
+                    errors.append(f"{name}: {error}")
+        return errors
+
+    return validate
+
+
+_VALIDATORS: Dict[str, Optional[Validator]] = {}
+_lock = threading.Lock()
+
+
+def get_validator(operation_id: str) -> Optional[Validator]:
+    """The compiled validator for ``operation_id``, or None without a body schema."""
+    try:
+        return _VALIDATORS[operation_id]
+    except KeyError:
+        pass
+    with _lock:
+        if operation_id not in _VALIDATORS:
+            fields = VALIDATION_TABLE.get(operation_id)
+            _VALIDATORS[operation_id] = compile_validator(fields) if fields is not None else None
+        return _VALIDATORS[operation_id]
+
+
+def validate_body(
+    operation_id: str, body: Mapping[str, Any], nullable: Collection[str] = ()
+) -> None:
+    """Raise :class:`ValidationException` if ``body`` breaks the operation's schema.
+
+    ``nullable`` names the body keys the request model may null out.
+    """
+    validator = get_validator(operation_id)
+    if validator is None:
+        return
+    errors = validator(body, frozenset(nullable))
+    if errors:
+        raise ValidationException(
+            400,
+            "invalid_request",
+            f"{operation_id}: {'; '.join(errors)}",
+            operation=operation_id,
+            errors=errors,
+        )
@@ -0,0 +1,258 @@
+"""Etsy Open API v3 request-body rules, generated from ``specs/baseline.json``.
+
+Do not edit by hand; regenerate with ``python scripts/generate_validators.py``.
+Entries are ``operation_id: {field: constraints}``.
+"""
+
+from typing import Any, Dict
+
+VALIDATION_TABLE: Dict[str, Dict[str, Dict[str, Any]]] = {
+    "consolidateShopReturnPolicies": {
+        "destination_return_policy_id": {"minimum": 1, "type": "integer"},
+        "source_return_policy_id": {"minimum": 1, "type": "integer"},
+    },
+    "createDraftListing": {
+        "description": {"type": "string"},
+        "image_ids": {"items": {"minimum": 1, "type": "integer"}, "nullable": True, "type": "array"},
+        "is_customizable": {"type": "boolean"},
+        "is_personalizable": {"type": "boolean"},
+        "is_supply": {"type": "boolean"},
+        "is_taxable": {"type": "boolean"},
+        "item_dimensions_unit": {"enum": ["in", "ft", "mm", "cm", "m", "yd", "inches"], "nullable": True, "type": "string"},
+        "item_height": {"maximum": 1.79769313486e+308, "minimum": 0, "nullable": True, "type": "number"},
+        "item_length": {"maximum": 1.79769313486e+308, "minimum": 0, "nullable": True, "type": "number"},
+        "item_weight": {"maximum": 1.79769313486e+308, "minimum": 0, "nullable": True, "type": "number"},
+        "item_weight_unit": {"enum": ["oz", "lb", "g", "kg"], "nullable": True, "type": "string"},
+        "item_width": {"maximum": 1.79769313486e+308, "minimum": 0, "nullable": True, "type": "number"},
+        "materials": {"items": {"maxLength": 45, "type": "string"}, "maxItems": 13, "nullable": True, "type": "array"},
+        "personalization_char_count_max": {"type": "integer"},
+        "personalization_instructions": {"type": "string"},
+        "personalization_is_required": {"type": "boolean"},
+        "price": {"exclusiveMinimum": 0, "type": "number"},
+        "processing_max": {"nullable": True, "type": "integer"},
+        "processing_min": {"nullable": True, "type": "integer"},
+        "production_partner_ids": {"items": {"minimum": 1, "type": "integer"}, "nullable": True, "type": "array"},
+        "quantity": {"minimum": 1, "type": "integer"},
+        "readiness_state_id": {"minimum": 1, "nullable": True, "type": "integer"},
+        "return_policy_id": {"minimum": 1, "nullable": True, "type": "integer"},
+        "shipping_profile_id": {"minimum": 1, "nullable": True, "type": "integer"},
+        "shop_section_id": {"minimum": 1, "nullable": True, "type": "integer"},
+        "should_auto_renew": {"type": "boolean"},
+        "styles": {"items": {"maxLength": 45, "type": "string"}, "maxItems": 2, "nullable": True, "type": "array"},
+        "tags": {"items": {"maxLength": 20, "type": "string"}, "maxItems": 13, "nullable": True, "type": "array"},
+        "taxonomy_id": {"minimum": 1, "type": "integer"},
+        "title": {"maxLength": 140, "type": "string"},
+        "type": {"enum": ["physical", "download", "both"], "type": "string"},
+        "when_made": {"enum": ["made_to_order", "2020_2026", "2010_2019", "2007_2009", "before_2007", "2000_2006", "1990s", "1980s", "1970s", "1960s", "1950s", "1940s", "1930s", "1920s", "1910s", "1900s", "1800s", "1700s", "before_1700"], "type": "string"},
+        "who_made": {"enum": ["i_did", "someone_else", "collective"], "type": "string"},
+    },
+    "createListingTranslation": {
+        "description": {"type": "string"},
+        "tags": {"items": {"maxLength": 20, "type": "string"}, "maxItems": 13, "type": "array"},
+        "title": {"maxLength": 140, "type": "string"},
+    },
+    "createReceiptShipment": {
+        "carrier_name": {"type": "string"},
+        "customs_data": {"items": {"type": "object"}, "nullable": True, "type": "array"},
+        "dimension_units": {"nullable": True, "type": "string"},
+        "duty_amount": {"nullable": True, "type": "number"},
+        "duty_currency": {"nullable": True, "type": "string"},
+        "height": {"nullable": True, "type": "number"},
+        "incoterm": {"nullable": True, "type": "string"},
+        "length": {"nullable": True, "type": "number"},
+        "mail_class": {"nullable": True, "type": "string"},
+        "note_to_buyer": {"type": "string"},
+        "revenue_eligibility": {"nullable": True, "type": "string"},
+        "send_bcc": {"type": "boolean"},
+        "ship_date": {"nullable": True, "type": "string"},
+        "ship_from_country": {"nullable": True, "type": "string"},
+        "ship_to_country": {"nullable": True, "type": "string"},
+        "shipping_label_cost": {"nullable": True, "type": "number"},
+        "shipping_label_currency": {"nullable": True, "type": "string"},
+        "tracking_code": {"type": "string"},
+        "weight": {"nullable": True, "type": "number"},
+        "weight_units": {"nullable": True, "type": "string"},
+        "width": {"nullable": True, "type": "number"},
+    },
+    "createShopReadinessStateDefinition": {
+        "max_processing_time": {"maximum": 10, "minimum": 1, "type": "integer"},
+        "min_processing_time": {"maximum": 10, "minimum": 1, "type": "integer"},
+        "processing_time_unit": {"enum": ["days", "weeks"], "type": "string"},
+        "readiness_state": {"enum": ["ready_to_ship", "made_to_order"], "type": "string"},
+    },
+    "createShopReturnPolicy": {
+        "accepts_exchanges": {"type": "boolean"},
+        "accepts_returns": {"type": "boolean"},
+        "return_deadline": {"nullable": True, "type": "integer"},
+    },
+    "createShopSection": {
+        "title": {"type": "string"},
+    },
+    "createShopShippingProfile": {
+        "destination_country_iso": {"type": "string"},
+        "destination_region": {"enum": ["eu", "non_eu", "none"], "type": "string"},
+        "mail_class": {"type": "string"},
+        "max_delivery_days": {"maximum": 45, "minimum": 1, "type": "integer"},
+        "max_processing_time": {"maximum": 10, "minimum": 1, "type": "integer"},
+        "min_delivery_days": {"maximum": 45, "minimum": 1, "type": "integer"},
+        "min_processing_time": {"maximum": 10, "minimum": 1, "type": "integer"},
+        "origin_country_iso": {"type": "string"},
+        "origin_postal_code": {"type": "string"},
+        "primary_cost": {"minimum": 0, "type": "number"},
+        "processing_time_unit": {"enum": ["business_days", "weeks"], "type": "string"},
+        "secondary_cost": {"minimum": 0, "type": "number"},
+        "shipping_carrier_id": {"minimum": 0, "type": "integer"},
+        "title": {"type": "string"},
+    },
+    "createShopShippingProfileDestination": {
+        "destination_country_iso": {"type": "string"},
+        "destination_region": {"enum": ["eu", "non_eu", "none"], "type": "string"},
+        "mail_class": {"type": "string"},
+        "max_delivery_days": {"maximum": 45, "minimum": 1, "type": "integer"},
+        "min_delivery_days": {"maximum": 45, "minimum": 1, "type": "integer"},
+        "primary_cost": {"minimum": 0, "type": "number"},
+        "secondary_cost": {"minimum": 0, "type": "number"},
+        "shipping_carrier_id": {"minimum": 0, "type": "integer"},
+    },
+    "createShopShippingProfileUpgrade": {
+        "mail_class": {"type": "string"},
+        "max_delivery_days": {"maximum": 45, "minimum": 1, "type": "integer"},
+        "min_delivery_days": {"maximum": 45, "minimum": 1, "type": "integer"},
+        "price": {"minimum": 0, "type": "number"},
+        "secondary_price": {"minimum": 0, "type": "number"},
+        "shipping_carrier_id": {"minimum": 0, "type": "integer"},
+        "type": {"enum": [0, 1], "type": "integer"},
+        "upgrade_name": {"type": "string"},
+    },
+    "tokenScopes": {
+        "token": {"type": "string"},
+    },
+    "updateHolidayPreferences": {
+        "is_working": {"type": "boolean"},
+    },
+    "updateListing": {
+        "description": {"type": "string"},
+        "featured_rank": {"nullable": True, "type": "integer"},
+        "image_ids": {"items": {"minimum": 1, "type": "integer"}, "type": "array"},
+        "is_personalizable": {"type": "boolean"},
+        "is_supply": {"type": "boolean"},
+        "is_taxable": {"type": "boolean"},
+        "item_dimensions_unit": {"enum": ["", "in", "ft", "mm", "cm", "m", "yd", "inches"], "nullable": True, "type": "string"},
+        "item_height": {"maximum": 1.79769313486e+308, "minimum": 0, "nullable": True, "type": "number"},
+        "item_length": {"maximum": 1.79769313486e+308, "minimum": 0, "nullable": True, "type": "number"},
+        "item_weight": {"maximum": 1.79769313486e+308, "minimum": 0, "nullable": True, "type": "number"},
+        "item_weight_unit": {"enum": ["", "oz", "lb", "g", "kg"], "nullable": True, "type": "string"},
+        "item_width": {"maximum": 1.79769313486e+308, "minimum": 0, "nullable": True, "type": "number"},
+        "materials": {"items": {"maxLength": 45, "type": "string"}, "maxItems": 13, "nullable": True, "type": "array"},
+        "personalization_char_count_max": {"type": "integer"},
+        "personalization_instructions": {"type": "string"},
+        "personalization_is_required": {"type": "boolean"},
+        "production_partner_ids": {"items": {"minimum": 1, "type": "integer"}, "nullable": True, "type": "array"},
+        "return_policy_id": {"minimum": 1, "nullable": True, "type": "integer"},
+        "shipping_profile_id": {"minimum": 1, "nullable": True, "type": "integer"},
+        "shop_section_id": {"nullable": True, "type": "integer"},
+        "should_auto_renew": {"type": "boolean"},
+        "state": {"enum": ["active", "inactive"], "type": "string"},
+        "tags": {"items": {"maxLength": 20, "type": "string"}, "maxItems": 13, "nullable": True, "type": "array"},
+        "taxonomy_id": {"minimum": 1, "type": "integer"},
+        "title": {"maxLength": 140, "type": "string"},
+        "type": {"enum": ["physical", "download", "both"], "nullable": True, "type": "string"},
+        "when_made": {"enum": ["made_to_order", "2020_2026", "2010_2019", "2007_2009", "before_2007", "2000_2006", "1990s", "1980s", "1970s", "1960s", "1950s", "1940s", "1930s", "1920s", "1910s", "1900s", "1800s", "1700s", "before_1700"], "type": "string"},
+        "who_made": {"enum": ["i_did", "someone_else", "collective"], "type": "string"},
+    },
+    "updateListingInventory": {
+        "price_on_property": {"items": {"type": "integer"}, "type": "array"},
+        "products": {"items": {"type": "object"}, "type": "array"},
+        "quantity_on_property": {"items": {"type": "integer"}, "type": "array"},
+        "readiness_state_on_property": {"items": {"minimum": 1, "type": "integer"}, "nullable": True, "type": "array"},
+        "sku_on_property": {"items": {"type": "integer"}, "type": "array"},
+    },
+    "updateListingPersonalization": {
+        "personalization_questions": {"items": {"type": "object"}, "type": "array"},
+    },
+    "updateListingProperty": {
+        "scale_id": {"minimum": 1, "type": "integer"},
+        "value_ids": {"items": {"minimum": 1, "type": "integer"}, "type": "array"},
+        "values": {"items": {"type": "string"}, "type": "array"},
+    },
+    "updateListingTranslation": {
+        "description": {"type": "string"},
+        "tags": {"items": {"maxLength": 20, "type": "string"}, "maxItems": 13, "type": "array"},
+        "title": {"maxLength": 140, "type": "string"},
+    },
+    "updateShop": {
+        "announcement": {"type": "string"},
+        "digital_sale_message": {"type": "string"},
+        "policy_additional": {"type": "string"},
+        "sale_message": {"type": "string"},
+        "title": {"type": "string"},
+    },
+    "updateShopReadinessStateDefinition": {
+        "max_processing_time": {"maximum": 10, "minimum": 1, "type": "integer"},
+        "min_processing_time": {"maximum": 10, "minimum": 1, "type": "integer"},
+        "processing_time_unit": {"enum": ["days", "weeks"], "type": "string"},
+        "readiness_state": {"enum": ["ready_to_ship", "made_to_order"], "type": "string"},
+    },
+    "updateShopReceipt": {
+        "was_paid": {"nullable": True, "type": "boolean"},
+        "was_shipped": {"nullable": True, "type": "boolean"},
+    },
+    "updateShopReturnPolicy": {
+        "accepts_exchanges": {"type": "boolean"},
+        "accepts_returns": {"type": "boolean"},
+        "return_deadline": {"nullable": True, "type": "integer"},
+    },
+    "updateShopSection": {
+        "title": {"type": "string"},
+    },
+    "updateShopShippingProfile": {
+        "max_processing_time": {"maximum": 10, "minimum": 1, "type": "integer"},
+        "min_processing_time": {"maximum": 10, "minimum": 1, "type": "integer"},
+        "origin_country_iso": {"type": "string"},
+        "origin_postal_code": {"type": "string"},
+        "processing_time_unit": {"enum": ["business_days", "weeks"], "type": "string"},
+        "title": {"type": "string"},
+    },
+    "updateShopShippingProfileDestination": {
+        "destination_country_iso": {"type": "string"},
+        "destination_region": {"enum": ["eu", "non_eu", "none"], "type": "string"},
+        "mail_class": {"type": "string"},
+        "max_delivery_days": {"maximum": 45, "minimum": 1, "type": "integer"},
+        "min_delivery_days": {"maximum": 45, "minimum": 1, "type": "integer"},
+        "primary_cost": {"minimum": 0, "type": "number"},
+        "secondary_cost": {"minimum": 0, "type": "number"},
+        "shipping_carrier_id": {"minimum": 0, "type": "integer"},
+    },
+    "updateShopShippingProfileUpgrade": {
+        "mail_class": {"type": "string"},
+        "max_delivery_days": {"maximum": 45, "minimum": 1, "type": "integer"},
+        "min_delivery_days": {"maximum": 45, "minimum": 1, "type": "integer"},
+        "price": {"minimum": 0, "type": "number"},
+        "secondary_price": {"minimum": 0, "type": "number"},
+        "shipping_carrier_id": {"minimum": 0, "type": "integer"},
+        "type": {"enum": [0, 1], "type": "integer"},
+        "upgrade_name": {"type": "string"},
+    },
+    "updateVariationImages": {
+        "variation_images": {"items": {"type": "object"}, "type": "array"},
+    },
+    "uploadListingFile": {
+        "file": {"nullable": True, "type": "string"},
+        "listing_file_id": {"minimum": 1, "type": "integer"},
+        "name": {"type": "string"},
+        "rank": {"minimum": 1, "type": "integer"},
+    },
+    "uploadListingImage": {
+        "alt_text": {"type": "string"},
+        "image": {"nullable": True, "type": "string"},
+        "is_watermarked": {"type": "boolean"},
+        "listing_image_id": {"minimum": 1, "type": "integer"},
+        "overwrite": {"type": "boolean"},
+        "rank": {"minimum": 0, "type": "integer"},
+    },
+    "uploadListingVideo": {
+        "name": {"type": "string"},
+        "video": {"nullable": True, "type": "string"},
+        "video_id": {"minimum": 1, "type": "integer"},
+    },
+}
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+from etsy_python.v3.exceptions.RequestException import RequestException
+
+
+@dataclass
+class CircuitOpenException(RequestException):
+    endpoint: str = ""
+    retry_after: float = 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"[EtsyCircuitOpen] [endpoint = {self.endpoint}] "
+            f"[retry_after = {self.retry_after:.1f}s] {super().__str__()}"
+        )
@@ -0,0 +1,13 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from etsy_python.v3.exceptions.RequestException import RequestException
+
+
+@dataclass
+class ValidationException(RequestException):
+    operation: str = ""
+    errors: List[str] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        return f"[EtsyValidation] [operation = {self.operation}] {super().__str__()}"
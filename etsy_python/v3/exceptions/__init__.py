@@ -1,2 +1,4 @@
 from .BaseAPIException import BaseAPIException
 from .RequestException import RequestException
+from .CircuitOpenException import CircuitOpenException
+from .ValidationException import ValidationException
@@ -1,32 +1,89 @@
+"""Names are imported on first access (PEP 562), so importing one model
+does not load every module in the package."""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+# Classes named like their own module are bound eagerly: once the submodule is
+# imported, the import system sets the package attribute to the module and
+# __getattr__ would never run.
 from .FileRequest import FileRequest
-from .Listing import (
-    CreateDraftListingRequest,
-    UpdateListingRequest,
-    UpdateListingInventoryRequest,
-    UpdateListingPropertyRequest,
-    UploadListingImageRequest,
-    UploadListingFileRequest,
-    UpdateVariationImagesRequest,
-    CreateListingTranslationRequest,
-    UpdateListingTranslationRequest,
-    UpdateListingVideoRequest,
-)
-from .Miscellaneous import GetTokenScopes
 from .Product import Product
-from .Receipt import CreateReceiptShipmentRequest, UpdateShopReceiptRequest
 from .Request import Request
-from .ShippingProfile import (
-    CreateShopShippingProfileRequest,
-    UpdateShopShippingProfileRequest,
-    CreateShopShippingProfileDestinationRequest,
-    UpdateShopShippingProfileDestinationRequest,
-    CreateShopShippingProfileUpgradeRequest,
-    UpdateShopShippingProfileUpgradeRequest,
-)
-from .Shop import CreateShopSectionRequest, UpdateShopSectionRequest, UpdateShopRequest
-from .ShopReturnPolicy import (
-    ConsolidateShopReturnPoliciesRequest,
-    CreateShopReturnPolicyRequest,
-    UpdateShopReturnPolicyRequest,
-)
-from .Utils import Offering, PropertyValues, VariationImage
+
+if TYPE_CHECKING:
+    from .Listing import (
+        CreateDraftListingRequest,
+        UpdateListingRequest,
+        UpdateListingInventoryRequest,
+        UpdateListingPropertyRequest,
+        UploadListingImageRequest,
+        UploadListingFileRequest,
+        UpdateVariationImagesRequest,
+        CreateListingTranslationRequest,
+        UpdateListingTranslationRequest,
+        UpdateListingVideoRequest,
+    )
+    from .Miscellaneous import GetTokenScopes
+    from .Receipt import CreateReceiptShipmentRequest, UpdateShopReceiptRequest
+    from .ShippingProfile import (
+        CreateShopShippingProfileRequest,
+        UpdateShopShippingProfileRequest,
+        CreateShopShippingProfileDestinationRequest,
+        UpdateShopShippingProfileDestinationRequest,
+        CreateShopShippingProfileUpgradeRequest,
+        UpdateShopShippingProfileUpgradeRequest,
+    )
+    from .Shop import CreateShopSectionRequest, UpdateShopSectionRequest, UpdateShopRequest
+    from .ShopReturnPolicy import (
+        ConsolidateShopReturnPoliciesRequest,
+        CreateShopReturnPolicyRequest,
+        UpdateShopReturnPolicyRequest,
+    )
+    from .Utils import Offering, PropertyValues, VariationImage
+
+_LAZY: Dict[str, str] = {
+    "CreateDraftListingRequest": ".Listing",
+    "UpdateListingRequest": ".Listing",
+    "UpdateListingInventoryRequest": ".Listing",
+    "UpdateListingPropertyRequest": ".Listing",
+    "UploadListingImageRequest": ".Listing",
+    "UploadListingFileRequest": ".Listing",
+    "UpdateVariationImagesRequest": ".Listing",
+    "CreateListingTranslationRequest": ".Listing",
+    "UpdateListingTranslationRequest": ".Listing",
+    "UpdateListingVideoRequest": ".Listing",
+    "GetTokenScopes": ".Miscellaneous",
+    "CreateReceiptShipmentRequest": ".Receipt",
+    "UpdateShopReceiptRequest": ".Receipt",
+    "CreateShopShippingProfileRequest": ".ShippingProfile",
+    "UpdateShopShippingProfileRequest": ".ShippingProfile",
+    "CreateShopShippingProfileDestinationRequest": ".ShippingProfile",
+    "UpdateShopShippingProfileDestinationRequest": ".ShippingProfile",
+    "CreateShopShippingProfileUpgradeRequest": ".ShippingProfile",
+    "UpdateShopShippingProfileUpgradeRequest": ".ShippingProfile",
+    "CreateShopSectionRequest": ".Shop",
+    "UpdateShopSectionRequest": ".Shop",
+    "UpdateShopRequest": ".Shop",
+    "ConsolidateShopReturnPoliciesRequest": ".ShopReturnPolicy",
+    "CreateShopReturnPolicyRequest": ".ShopReturnPolicy",
+    "UpdateShopReturnPolicyRequest": ".ShopReturnPolicy",
+    "Offering": ".Utils",
+    "PropertyValues": ".Utils",
+    "VariationImage": ".Utils",
+}
+
+__all__ = ["FileRequest", "Product", "Request", *_LAZY]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
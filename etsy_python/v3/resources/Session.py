@@ -1,7 +1,8 @@
+import sys
+from contextlib import nullcontext
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Dict, Optional
-
-from requests import Session
+from time import perf_counter, time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from etsy_python.v3.common.Request import ERROR_CODES, NO_RESPONSE_CODES
 from etsy_python.v3.common.Env import environment
@@ -13,6 +14,40 @@ from etsy_python.v3.models.Request import Request
 from etsy_python.v3.models.FileRequest import FileRequest
 from etsy_python.v3.resources.enums.RateLimit import RateLimit
 
+if TYPE_CHECKING:
+    from requests import Session
+
+    from etsy_python.v3.common.Hooks import RequestEvent, RequestHook
+
+    # Opt-in features; callers that pass them have already imported them.
+    from etsy_python.v3.common.Cassette import CassetteRecorder
+    from etsy_python.v3.common.CircuitBreaker import CircuitBreaker
+    from etsy_python.v3.common.Hedging import HedgePolicy
+    from etsy_python.v3.common.Journal import RequestJournal
+    from etsy_python.v3.common.RateLimiter import RateLimiter
+    from etsy_python.v3.common.Scheduler import RequestScheduler
+    from etsy_python.v3.common.Transport import Transport
+
+
+def __getattr__(name: str) -> Any:
+    # requests, and the hooks, registry and timing modules below, are only
+    # needed once a client exists, so importing a resource module skips them
+    # (PEP 562). ``Session`` stays a module attribute so it can be patched.
+    if name == "Session":
+        from requests import Session
+
+        globals()["Session"] = Session
+        return Session
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _wire_bytes(response: Any) -> Optional[int]:
+    """Body bytes as read off the connection, before any decompression."""
+    # urllib3 (requests) counts raw bytes read; httpx counts bytes downloaded.
+    tell = getattr(getattr(response, "raw", None), "tell", None)
+    count = tell() if callable(tell) else getattr(response, "num_bytes_downloaded", None)
+    return count if isinstance(count, int) and not isinstance(count, bool) else None
+
 
 class EtsyClient:
     def __init__(
@@ -22,19 +57,66 @@ class EtsyClient:
         refresh_token: str,
         expiry: datetime,
         sync_refresh: Optional[Callable[[str, str, datetime], None]] = None,
+        hooks: Optional[List["RequestHook"]] = None,
+        tracing: bool = True,
+        tracer_provider: Any = None,
+        rate_limiter: Optional["RateLimiter"] = None,
+        scheduler: Optional["RequestScheduler"] = None,
+        circuit_breaker: Optional["CircuitBreaker"] = None,
+        hedging: Optional["HedgePolicy"] = None,
+        transport: Optional["Transport"] = None,
+        recorder: Optional["CassetteRecorder"] = None,
+        validate: bool = True,
+        journal: Optional["RequestJournal"] = None,
     ) -> None:
+        from etsy_python.v3.common.Quota import QuotaTracker
+        from etsy_python.v3.common.Timing import TimedHTTPAdapter
+        from etsy_python.v3.common.Tracing import default_tracing_hook
+
         self.keystring = keystring
         self.access_token = access_token
         self.refresh_token = refresh_token
         self.expiry = expiry
         self.sync_refresh = sync_refresh
+        self.rate_limiter = rate_limiter
+        # A scheduler owns its own limiter and takes precedence.
+        self.scheduler = scheduler
+        self.circuit_breaker = circuit_breaker
+        self.hedging = hedging
+        self.validate = validate
+        self.journal = journal
+        self.quota = QuotaTracker()
+        self.hooks = [*(hooks or []), self.quota]
+        # Only present when OpenTelemetry is installed; otherwise calls skip
+        # the instrumented path entirely.
+        self.tracing_hook = default_tracing_hook(tracer_provider) if tracing else None
+        if self.tracing_hook is not None:
+            self.hooks.insert(0, self.tracing_hook)
 
         self.user_id = self._get_user_id(access_token)
 
-        self.session = Session()
+        if transport is None:
+            self.session = sys.modules[__name__].Session()
+            adapter = TimedHTTPAdapter()
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+        else:
+            self.session = transport
+        self.recorder = recorder
+        if recorder is not None:
+            self.session = recorder.wrap(self.session)
         self.session.headers = self._get_resource_headers(keystring, access_token)
 
     def update_token(self) -> tuple:
+        span = (
+            self.tracing_hook.token_refresh_span(environment.token_url)
+            if self.tracing_hook is not None
+            else nullcontext()
+        )
+        with span:
+            return self._update_token()
+
+    def _update_token(self) -> tuple:
         self._remove_authorization_header()
         refresh_json = self._get_refresh_json(self.keystring, self.refresh_token)
         response = self.session.post(environment.token_url, json=refresh_json)
@@ -75,7 +157,13 @@ class EtsyClient:
 
     @staticmethod
     def _get_request_headers(keystring: str) -> dict:
-        return {"Accept": "application/json", "x-api-key": keystring}
+        from urllib3.util.request import ACCEPT_ENCODING
+
+        return {
+            "Accept": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "x-api-key": keystring,
+        }
 
     @staticmethod
     def _get_refresh_json(keystring: str, refresh_token: str) -> dict:
@@ -106,42 +194,276 @@ class EtsyClient:
     ) -> Any:
         if method not in {Method.GET, Method.DELETE} and payload is None:
             raise ValueError(f"Improper payload for {method}")
+        # Serialized once here; validation, the journal and the send share it.
+        body = (
+            payload.get_dict()
+            if isinstance(payload, Request) and not isinstance(payload, FileRequest)
+            else None
+        )
+        if self.validate and body is not None:
+            self._validate(method, uri_path, body, payload.get_nulled())
+        if (
+            self.journal is not None
+            and method != Method.GET
+            and (payload is None or isinstance(payload, Request))
+            and not isinstance(payload, FileRequest)
+        ):
+            return self.journal.run(
+                method,
+                uri_path,
+                query_params,
+                body,
+                lambda: self._request(uri_path, method, payload, query_params, body),
+            )
+        return self._request(uri_path, method, payload, query_params, body)
 
+    def _request(
+        self,
+        uri_path: str,
+        method: Method,
+        payload: Optional[Request],
+        query_params: Optional[Dict[str, Any]],
+        body: Optional[Dict[str, Any]],
+    ) -> Any:
         is_token_expired = datetime.now(tz=timezone.utc) >= self.ensure_utc(self.expiry)
         if is_token_expired:
             self.update_token()
 
-        uri_path = f"{environment.request_url}{uri_path}"
-        uri_path = generate_get_uri(uri_path, query_params)
+        url = generate_get_uri(f"{environment.request_url}{uri_path}", query_params)
+        # Checked before taking a rate-limit slot so an open circuit costs nothing.
+        circuit = (
+            self.circuit_breaker.before_call(uri_path)
+            if self.circuit_breaker is not None
+            else None
+        )
+        if circuit is None:
+            self._acquire_slot()
+            return self._perform(method, uri_path, url, payload, body)
+
+        outcome: Optional[Dict[str, Any]] = None
+        try:
+            self._acquire_slot()
+            start = perf_counter()
+            try:
+                result = self._perform(method, uri_path, url, payload, body)
+            except Exception as e:
+                outcome = {"error": e}
+                raise
+            outcome = {"status": result.code}
+            return result
+        finally:
+            # Anything that stops the call short of an outcome (a limiter
+            # error, KeyboardInterrupt) must hand back a half-open probe slot.
+            if outcome is None:
+                self.circuit_breaker.release(circuit)
+            else:
+                self.circuit_breaker.after_call(circuit, perf_counter() - start, **outcome)
+
+    def _acquire_slot(self) -> None:
+        if self.scheduler is not None:
+            self.scheduler.acquire()
+        elif self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+    @staticmethod
+    def _validate(
+        method: Method, uri_path: str, body: Dict[str, Any], nulled: List[str]
+    ) -> None:
+        from etsy_python.v3.common.Operations import REGISTRY
+
+        operation = REGISTRY.resolve(method.name, uri_path)
+        if operation is None:
+            return
+        # Imported on first write so read-only clients never load the rules.
+        from etsy_python.v3.common.Validation import validate_body
+
+        # Fields the model nulled to clear them may be null whatever the spec
+        # says; ``_type`` is serialized as "type".
+        validate_body(
+            operation.operation_id,
+            body,
+            ["type" if name == "_type" else name for name in nulled],
+        )
+
+    def _perform(
+        self,
+        method: Method,
+        uri_path: str,
+        url: str,
+        payload: Optional[Request],
+        body: Optional[Dict[str, Any]],
+    ) -> Any:
+        from etsy_python.v3.common.Hooks import RequestEvent, dispatch, uri_template
+        from etsy_python.v3.common.Operations import REGISTRY
+        from etsy_python.v3.common.Timing import pop_connect_time
+
+        template = uri_template(uri_path)
+        operation = REGISTRY.resolve(method.name, uri_path)
+        event = RequestEvent(
+            operation=operation.operation_id
+            if operation is not None
+            else f"{method.name} {template}",
+            uri_template=template,
+            method=method.name,
+            url=url,
+        )
+        dispatch(self.hooks, "before_send", event)
+        pop_connect_time()
+        start = perf_counter()
+        try:
+            response, connect = self._transmit(event, method, url, payload, body)
+        except Exception as e:
+            event.timings.total = perf_counter() - start
+            event.error = e
+            dispatch(self.hooks, "on_error", event)
+            raise
+        self._record_response(event, response, perf_counter() - start, connect)
+        try:
+            result = self._process_request(response)
+        except Exception as e:
+            event.rate_limits = getattr(e, "rate_limits", None)
+            event.error = e
+            dispatch(self.hooks, "after_response", event)
+            dispatch(self.hooks, "on_error", event)
+            raise
+        event.rate_limits = result.rate_limits
+        dispatch(self.hooks, "after_response", event)
+        return result
+
+    def _transmit(
+        self,
+        event: "RequestEvent",
+        method: Method,
+        url: str,
+        payload: Optional[Request],
+        body: Optional[Dict[str, Any]],
+    ) -> Tuple[Any, float]:
+        """Send the request; returns the response and its connect time."""
+        if self.hedging is not None and method == Method.GET:
+            if self.hedging.applies(event.uri_template):
+                # Both attempts bypass the recorder; the cassette gets one
+                # interaction, with the reply that was used.
+                transport = (
+                    self.session if self.recorder is None else self.session.transport
+                )
+                started = time()
+                response, connect, _ = self.hedging.run(
+                    event.uri_template,
+                    lambda: self._timed_get(transport, url),
+                    self._can_hedge,
+                    on_hedge=lambda: self._on_resend(event),
+                    on_discard=lambda attempt: self._record_discarded(event, *attempt),
+                )
+                if self.recorder is not None:
+                    self.recorder.record("GET", url, None, response, started)
+                return response, connect
+        from etsy_python.v3.common.Timing import pop_connect_time
+
+        response = self._send(method, url, payload, body)
+        return response, pop_connect_time()
+
+    @staticmethod
+    def _timed_get(transport: Any, url: str) -> Tuple[Any, float, float]:
+        # Runs on a hedging worker; connect times are kept per thread, so
+        # they are collected here rather than by the caller.
+        from etsy_python.v3.common.Timing import pop_connect_time
+
+        pop_connect_time()
+        start = perf_counter()
+        response = transport.get(url)
+        return response, pop_connect_time(), perf_counter() - start
+
+    def _record_discarded(
+        self, event: "RequestEvent", response: Any, connect: float, total: float
+    ) -> None:
+        """Report a losing hedge attempt: it reached Etsy and used quota."""
+        from etsy_python.v3.common.Hooks import RequestEvent, dispatch
+
+        duplicate = RequestEvent(
+            operation=event.operation,
+            uri_template=event.uri_template,
+            method=event.method,
+            url=event.url,
+        )
+        try:
+            self._record_response(duplicate, response, total, connect)
+            duplicate.rate_limits = self._rate_limits(response)
+            dispatch(self.hooks, "after_response", duplicate)
+        finally:
+            response.close()
+
+    def _on_resend(self, event: "RequestEvent") -> None:
+        from etsy_python.v3.common.Hooks import dispatch
+
+        event.retries += 1
+        dispatch(self.hooks, "on_retry", event)
+
+    def _can_hedge(self) -> bool:
+        if not self.quota.can_afford(1, reserve=self.hedging.quota_reserve):
+            return False
+        limiter = (
+            self.scheduler.rate_limiter if self.scheduler is not None else self.rate_limiter
+        )
+        return limiter is None or limiter.try_acquire()
+
+    def _send(
+        self,
+        method: Method,
+        url: str,
+        payload: Optional[Request],
+        body: Optional[Dict[str, Any]],
+    ) -> Any:
         if method == Method.GET:
-            response = self.session.get(uri_path)
-        elif method == Method.PUT and isinstance(payload, Request):
-            response = self.session.put(uri_path, json=payload.get_dict())
+            return self.session.get(url)
+        elif method == Method.PUT and body is not None:
+            return self.session.put(url, json=body)
         elif method == Method.POST and isinstance(payload, FileRequest):
-            response = self.session.post(
-                uri_path, files=payload.file, data=payload.data
-            )
-        elif method == Method.POST and isinstance(payload, Request):
-            response = self.session.post(uri_path, json=payload.get_dict())
-        elif method == Method.PATCH and isinstance(payload, Request):
-            response = self.session.patch(uri_path, json=payload.get_dict())
+            return self.session.post(url, files=payload.file, data=payload.data)
+        elif method == Method.POST and body is not None:
+            return self.session.post(url, json=body)
+        elif method == Method.PATCH and body is not None:
+            return self.session.patch(url, json=body)
         elif method == Method.DELETE:
-            response = self.session.delete(uri_path)
-        else:
-            raise ValueError("Invalid method or payload")
-        return self._process_request(response)
+            return self.session.delete(url)
+        raise ValueError("Invalid method or payload")
+
+    @staticmethod
+    def _record_response(
+        event: "RequestEvent", response: Any, total: float, connect: float
+    ) -> None:
+        event.status = response.status_code
+        event.timings.total = total
+        event.timings.connect = connect
+        elapsed = getattr(response, "elapsed", None)
+        if isinstance(elapsed, timedelta):
+            event.timings.ttfb = elapsed.total_seconds()
+        content = getattr(response, "content", None)
+        if isinstance(content, (bytes, bytearray)):
+            event.bytes_received = len(content)
+        event.content_encoding = response.headers.get("Content-Encoding")
+        event.wire_bytes_received = _wire_bytes(response)
+        request = getattr(response, "request", None)
+        # requests exposes the encoded body as ``body``, httpx as ``content``.
+        body = getattr(request, "body", None)
+        if body is None:
+            body = getattr(request, "content", None)
+        if isinstance(body, (bytes, bytearray, str)):
+            event.bytes_sent = len(body)
+
+    @staticmethod
+    def _rate_limits(response: Any) -> Optional[RateLimit]:
+        if "X-Limit-Per-Day" not in response.headers:
+            return None
+        return RateLimit(
+            response.headers.get("X-Limit-Per-Second"),
+            response.headers["X-Remaining-This-Second"],
+            response.headers["X-Limit-Per-Day"],
+            response.headers["X-Remaining-Today"],
+        )
 
     def _process_request(self, response: Any) -> Any:
         is_error = response.status_code in ERROR_CODES
-
-        rate_limits = None
-        if "X-Limit-Per-Day" in response.headers:
-            rate_limits = RateLimit(
-                response.headers["X-Limit-Per-Day"],
-                response.headers["X-Remaining-This-Second"],
-                response.headers["X-Limit-Per-Day"],
-                response.headers["X-Remaining-Today"],
-            )
+        rate_limits = self._rate_limits(response)
 
         response_json = (
             response.json() if response.status_code not in NO_RESPONSE_CODES else None
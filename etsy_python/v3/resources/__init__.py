@@ -1,29 +1,87 @@
-from .Listing import ListingResource
-from .ListingFile import ListingFileResource
-from .ListingImage import ListingImageResource
-from .ListingInventory import ListingInventoryResource
-from .ListingOffering import ListingOfferingResource
-from .ListingProduct import ListingProductResource
-from .ListingTranslation import ListingTranslationResource
-from .ListingVariationImages import ListingVariationImagesResource
-from .ListingVideo import ListingVideoResource
-from .HolidayPreferences import HolidayPreferencesResource
-from .Miscellaneous import MiscellaneousResource
-from .Payment import PaymentResource
-from .ProcessingProfile import ProcessingProfileResource
-from .PaymentLedgerEntry import PaymentLedgeEntryResource
-from .enums.RateLimit import RateLimit
-from .enums.Request import Method
-from .Receipt import ReceiptResource
-from .ReceiptTransactions import ReceiptTransactionsResource
+"""Names are imported on first access (PEP 562), so importing one resource
+does not load every module in the package."""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+# Bound eagerly because the class shares its module's name: once the submodule
+# is imported, the import system sets the package attribute to the module and
+# __getattr__ would never run.
 from .Response import Response
-from .Review import ReviewResource
-from .Session import EtsyClient
-from .ShippingProfile import ShippingProfileResource
-from .Shop import ShopResource
-from .ShopProductionPartner import ShopProductionPartnerResource
-from .ShopReturnPolicy import ShopReturnPolicyResource
-from .ShopSection import ShopSectionResource
-from .Taxonomy import BuyerTaxonomyResource, SellerTaxonomyResource
-from .User import UserResource
-from .UserAddress import UserAddressResource
+
+if TYPE_CHECKING:
+    from .Listing import ListingResource
+    from .ListingFile import ListingFileResource
+    from .ListingImage import ListingImageResource
+    from .ListingInventory import ListingInventoryResource
+    from .ListingOffering import ListingOfferingResource
+    from .ListingProduct import ListingProductResource
+    from .ListingTranslation import ListingTranslationResource
+    from .ListingVariationImages import ListingVariationImagesResource
+    from .ListingVideo import ListingVideoResource
+    from .HolidayPreferences import HolidayPreferencesResource
+    from .Miscellaneous import MiscellaneousResource
+    from .Payment import PaymentResource
+    from .ProcessingProfile import ProcessingProfileResource
+    from .PaymentLedgerEntry import PaymentLedgeEntryResource
+    from .enums.RateLimit import RateLimit
+    from .enums.Request import Method
+    from .Receipt import ReceiptResource
+    from .ReceiptTransactions import ReceiptTransactionsResource
+    from .Review import ReviewResource
+    from .Session import EtsyClient
+    from .ShippingProfile import ShippingProfileResource
+    from .Shop import ShopResource
+    from .ShopProductionPartner import ShopProductionPartnerResource
+    from .ShopReturnPolicy import ShopReturnPolicyResource
+    from .ShopSection import ShopSectionResource
+    from .Taxonomy import BuyerTaxonomyResource, SellerTaxonomyResource
+    from .User import UserResource
+    from .UserAddress import UserAddressResource
+
+_LAZY: Dict[str, str] = {
+    "ListingResource": ".Listing",
+    "ListingFileResource": ".ListingFile",
+    "ListingImageResource": ".ListingImage",
+    "ListingInventoryResource": ".ListingInventory",
+    "ListingOfferingResource": ".ListingOffering",
+    "ListingProductResource": ".ListingProduct",
+    "ListingTranslationResource": ".ListingTranslation",
+    "ListingVariationImagesResource": ".ListingVariationImages",
+    "ListingVideoResource": ".ListingVideo",
+    "HolidayPreferencesResource": ".HolidayPreferences",
+    "MiscellaneousResource": ".Miscellaneous",
+    "PaymentResource": ".Payment",
+    "ProcessingProfileResource": ".ProcessingProfile",
+    "PaymentLedgeEntryResource": ".PaymentLedgerEntry",
+    "RateLimit": ".enums.RateLimit",
+    "Method": ".enums.Request",
+    "ReceiptResource": ".Receipt",
+    "ReceiptTransactionsResource": ".ReceiptTransactions",
+    "ReviewResource": ".Review",
+    "EtsyClient": ".Session",
+    "ShippingProfileResource": ".ShippingProfile",
+    "ShopResource": ".Shop",
+    "ShopProductionPartnerResource": ".ShopProductionPartner",
+    "ShopReturnPolicyResource": ".ShopReturnPolicy",
+    "ShopSectionResource": ".ShopSection",
+    "BuyerTaxonomyResource": ".Taxonomy",
+    "SellerTaxonomyResource": ".Taxonomy",
+    "UserResource": ".User",
+    "UserAddressResource": ".UserAddress",
+}
+
+__all__ = ["Response", *_LAZY]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Generate the SDK's operation table from the Etsy OAS spec.
+
+Writes ``etsy_python/v3/common/OperationTable.py``: one row per operation with
+its operationId, HTTP method, path template (relative to the API root), path
+parameters in path order and query parameters in spec order. The table backs
+``etsy_python.v3.common.Operations.REGISTRY``.
+
+Usage:
+    python scripts/generate_operations.py
+    python scripts/generate_operations.py --spec specs/baseline.json
+    python scripts/generate_operations.py --check   # exit 1 if the table is stale
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SPEC = ROOT / "specs" / "baseline.json"
+DEFAULT_OUTPUT = ROOT / "etsy_python" / "v3" / "common" / "OperationTable.py"
+API_PREFIX = "/v3/application"
+METHODS = ("get", "post", "put", "delete", "patch")
+_PATH_PARAM = re.compile(r"\{(\w+)\}")
+
+Row = Tuple[str, str, str, Tuple[str, ...], Tuple[str, ...]]
+
+
+def load_json(path: Path) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def get_rows(spec: dict) -> List[Row]:
+    """One row per operation, sorted by operationId."""
+    rows = []
+    for path, methods in spec.get("paths", {}).items():
+        relative = path[len(API_PREFIX):] if path.startswith(API_PREFIX) else path
+        for method, details in methods.items():
+            if method not in METHODS:
+                continue
+            query = tuple(
+                param["name"]
+                for param in details.get("parameters", [])
+                if param.get("in") == "query"
+            )
+            rows.append(
+                (
+                    details.get("operationId", f"{method}:{relative}"),
+                    method.upper(),
+                    relative,
+                    tuple(_PATH_PARAM.findall(relative)),
+                    query,
+                )
+            )
+    return sorted(rows)
+
+
+def _tuple(names: Tuple[str, ...]) -> str:
+    if len(names) == 1:
+        return f"({json.dumps(names[0])},)"
+    return "(" + ", ".join(json.dumps(name) for name in names) + ")"
+
+
+def render(spec: dict, source: str = "specs/baseline.json") -> str:
+    lines = [
+        f'"""Etsy Open API v3 operations, generated from ``{source}``.',
+        "",
+        "Do not edit by hand; regenerate with ``python scripts/generate_operations.py``.",
+        "Rows are ``(operation_id, method, path, path_params, query_params)``.",
+        '"""',
+        "",
+        "from typing import Tuple",
+        "",
+        "OPERATION_TABLE: Tuple[Tuple[str, str, str, Tuple[str, ...], Tuple[str, ...]], ...] = (",
+    ]
+    for operation_id, method, path, path_params, query_params in get_rows(spec):
+        lines.extend(
+            [
+                "    (",
+                f"        {json.dumps(operation_id)},",
+                f"        {json.dumps(method)},",
+                f"        {json.dumps(path)},",
+                f"        {_tuple(path_params)},",
+                f"        {_tuple(query_params)},",
+                "    ),",
+            ]
+        )
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate the operation table from the OAS spec")
+    parser.add_argument("--spec", default=str(DEFAULT_SPEC), help="Path to the OAS spec")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help="Module to write")
+    parser.add_argument(
+        "--check", action="store_true", help="Fail instead of writing when the table is stale"
+    )
+    args = parser.parse_args()
+
+    spec_path = Path(args.spec)
+    try:
+        source = spec_path.resolve().relative_to(ROOT).as_posix()
+    except ValueError:
+        source = spec_path.name
+    content = render(load_json(spec_path), source)
+    output = Path(args.output)
+    current = output.read_text(encoding="utf-8") if output.exists() else None
+
+    if args.check:
+        if current != content:
+            print(f"{output} is out of date; run scripts/generate_operations.py", file=sys.stderr)
+            return 1
+        print(f"{output} is up to date.")
+        return 0
+    if current != content:
+        output.write_text(content, encoding="utf-8")
+        print(f"Wrote {len(get_rows(load_json(spec_path)))} operations to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
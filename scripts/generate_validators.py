@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Generate the SDK's request-body validation rules from the Etsy OAS spec.
+
+Writes ``etsy_python/v3/common/ValidationTable.py``: for each operation with a
+request body, the constraints the spec declares per field (type, enum,
+minimum/maximum, nullable, array item rules). Required fields are left to each
+model's ``mandatory`` list, which ``Request.__init__`` already enforces. Limits
+Etsy documents only in prose, such as the 140-character listing title and
+the 13-tag cap, are merged in from ``DOCUMENTED_LIMITS``. The table backs
+``etsy_python.v3.common.Validation``.
+
+Usage:
+    python scripts/generate_validators.py
+    python scripts/generate_validators.py --spec specs/baseline.json
+    python scripts/generate_validators.py --check   # exit 1 if the table is stale
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SPEC = ROOT / "specs" / "baseline.json"
+DEFAULT_OUTPUT = ROOT / "etsy_python" / "v3" / "common" / "ValidationTable.py"
+METHODS = ("post", "put", "patch", "delete")
+CONSTRAINTS = (
+    "type",
+    "enum",
+    "minimum",
+    "maximum",
+    "exclusiveMinimum",
+    "minLength",
+    "maxLength",
+    "minItems",
+    "maxItems",
+    "nullable",
+)
+
+_LISTING_TEXT = {
+    "title": {"maxLength": 140},
+    "tags": {"maxItems": 13, "items": {"maxLength": 20}},
+    "materials": {"maxItems": 13, "items": {"maxLength": 45}},
+    "styles": {"maxItems": 2, "items": {"maxLength": 45}},
+}
+# Listing limits from Etsy's field descriptions and seller policies, which the
+# spec does not encode as schema keywords.
+DOCUMENTED_LIMITS: Dict[str, Dict[str, Dict[str, Any]]] = {
+    "createDraftListing": {
+        **_LISTING_TEXT,
+        "quantity": {"minimum": 1},
+        "price": {"exclusiveMinimum": 0},
+    },
+    "updateListing": _LISTING_TEXT,
+    "createListingTranslation": _LISTING_TEXT,
+    "updateListingTranslation": _LISTING_TEXT,
+}
+
+Rules = Dict[str, Dict[str, Dict[str, Any]]]
+
+
+def load_json(path: Path) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _resolve(spec: dict, schema: dict) -> dict:
+    while "$ref" in schema:
+        node: Any = spec
+        for part in schema["$ref"].lstrip("#/").split("/"):
+            node = node[part]
+        schema = node
+    return schema
+
+
+def _field_rules(spec: dict, schema: dict) -> Dict[str, Any]:
+    schema = _resolve(spec, schema)
+    rules = {key: schema[key] for key in CONSTRAINTS if key in schema}
+    if schema.get("type") == "array" and "items" in schema:
+        items = _field_rules(spec, schema["items"])
+        if items:
+            rules["items"] = items
+    return rules
+
+
+def _merge(rules: Dict[str, Any], extra: Dict[str, Any]) -> Dict[str, Any]:
+    merged = dict(rules)
+    for key, value in extra.items():
+        merged[key] = _merge(merged.get(key, {}), value) if isinstance(value, dict) else value
+    return merged
+
+
+def get_rules(spec: dict) -> Rules:
+    """Validation rules per operationId with a request body, sorted."""
+    rules: Rules = {}
+    for methods in spec.get("paths", {}).values():
+        for method, details in methods.items():
+            if method not in METHODS or "requestBody" not in details:
+                continue
+            operation_id = details["operationId"]
+            fields: Dict[str, Dict[str, Any]] = {}
+            for content in details["requestBody"].get("content", {}).values():
+                schema = _resolve(spec, content.get("schema", {}))
+                for name, prop in schema.get("properties", {}).items():
+                    fields.setdefault(name, _field_rules(spec, prop))
+            for name, extra in DOCUMENTED_LIMITS.get(operation_id, {}).items():
+                if name in fields:
+                    fields[name] = _merge(fields[name], extra)
+            rules[operation_id] = {name: fields[name] for name in sorted(fields)}
+    return dict(sorted(rules.items()))
+
+
+def _literal(value: Any) -> str:
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{json.dumps(k)}: {_literal(value[k])}" for k in sorted(value)) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_literal(item) for item in value) + "]"
+    if isinstance(value, str):
+        return json.dumps(value)
+    return repr(value)
+
+
+def render(spec: dict, source: str = "specs/baseline.json") -> str:
+    lines = [
+        f'"""Etsy Open API v3 request-body rules, generated from ``{source}``.',
+        "",
+        "Do not edit by hand; regenerate with ``python scripts/generate_validators.py``.",
+        "Entries are ``operation_id: {field: constraints}``.",
+        '"""',
+        "",
+        "from typing import Any, Dict",
+        "",
+        "VALIDATION_TABLE: Dict[str, Dict[str, Dict[str, Any]]] = {",
+    ]
+    for operation_id, fields in get_rules(spec).items():
+        lines.append(f"    {json.dumps(operation_id)}: {{")
+        for name, rules in fields.items():
+            lines.append(f"        {json.dumps(name)}: {_literal(rules)},")
+        lines.append("    },")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate request validation rules from the OAS spec")
+    parser.add_argument("--spec", default=str(DEFAULT_SPEC), help="Path to the OAS spec")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help="Module to write")
+    parser.add_argument(
+        "--check", action="store_true", help="Fail instead of writing when the table is stale"
+    )
+    args = parser.parse_args()
+
+    spec_path = Path(args.spec)
+    try:
+        source = spec_path.resolve().relative_to(ROOT).as_posix()
+    except ValueError:
+        source = spec_path.name
+    content = render(load_json(spec_path), source)
+    output = Path(args.output)
+    current = output.read_text(encoding="utf-8") if output.exists() else None
+
+    if args.check:
+        if current != content:
+            print(f"{output} is out of date; run scripts/generate_validators.py", file=sys.stderr)
+            return 1
+        print(f"{output} is up to date.")
+        return 0
+    if current != content:
+        output.write_text(content, encoding="utf-8")
+        print(f"Wrote rules for {len(get_rules(load_json(spec_path)))} operations to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
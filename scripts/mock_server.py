@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+Offline mock of the Etsy Open API v3, generated from the OAS spec.
+
+Every operation in the spec is routed and answered with a response body built
+from its success schema, so payloads have the same shape and types as
+production. Rate-limit headers (X-Limit-Per-Second, X-Remaining-This-Second,
+X-Limit-Per-Day, X-Remaining-Today) are emulated and a 429 is returned once a
+budget is exhausted. Bodies of 1 KiB or more are gzipped when the client sends
+Accept-Encoding: gzip. Latency and error injection are configurable, which makes
+the server usable for load tests and benchmarks without touching production.
+
+Usage:
+    python scripts/mock_server.py
+    python scripts/mock_server.py --port 8080 --latency-ms 40 --jitter-ms 20 --error-rate 0.01
+
+Point a client at it with:
+    ETSY_ENV=LOCAL ETSY_LOCAL_URL=http://127.0.0.1:8080 python your_script.py
+
+Library use (tests, benchmarks):
+    with MockEtsyServer() as server:
+        ...  # server.url, server.request_url, server.token_url
+"""
+
+import argparse
+import gzip
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+DEFAULT_SPEC = Path(__file__).resolve().parent.parent / "specs" / "baseline.json"
+TOKEN_PATH = "/v3/public/oauth/token"
+HTTP_METHODS = ("get", "post", "put", "delete", "patch")
+# Bodies at least this large are gzipped when the client accepts it.
+GZIP_MIN_SIZE = 1024
+
+
+def load_json(path: Path) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class SchemaSampler:
+    """Build deterministic, schema-valid sample values from OAS schemas."""
+
+    def __init__(self, spec: dict, array_items: int = 1, max_depth: int = 8) -> None:
+        self.schemas = spec.get("components", {}).get("schemas", {})
+        self.array_items = array_items
+        self.max_depth = max_depth
+
+    def resolve(self, schema: dict) -> Tuple[dict, Optional[str]]:
+        ref = schema.get("$ref")
+        if ref is None:
+            return schema, None
+        name = ref.rsplit("/", 1)[-1]
+        return self.schemas.get(name, {}), name
+
+    def sample(self, schema: dict, stack: Tuple[str, ...] = ()) -> Any:
+        schema, ref_name = self.resolve(schema)
+        if ref_name is not None:
+            stack = stack + (ref_name,)
+        for combinator in ("oneOf", "anyOf"):
+            if schema.get(combinator):
+                return self.sample(schema[combinator][0], stack)
+        if schema.get("allOf"):
+            merged: Dict[str, Any] = {}
+            for part in schema["allOf"]:
+                value = self.sample(part, stack)
+                if isinstance(value, dict):
+                    merged.update(value)
+            return merged
+        if "enum" in schema and schema["enum"]:
+            return schema["enum"][0]
+        schema_type = schema.get("type")
+        if schema_type == "object" or "properties" in schema:
+            return {
+                key: self.sample(prop, stack)
+                for key, prop in schema.get("properties", {}).items()
+                if isinstance(prop, dict)
+            }
+        if schema_type == "array":
+            items = schema.get("items", {})
+            _, item_ref = self.resolve(items)
+            # Self-referencing trees (taxonomy children) terminate as empty lists.
+            if len(stack) >= self.max_depth or (item_ref is not None and item_ref in stack):
+                return []
+            nested = items.get("oneOf", [items])[0] if isinstance(items, dict) else {}
+            _, nested_ref = self.resolve(nested)
+            if nested_ref is not None and nested_ref in stack:
+                return []
+            return [self.sample(items, stack) for _ in range(self.array_items)]
+        if schema_type == "integer":
+            return max(int(schema.get("minimum", 1)), 1)
+        if schema_type == "number":
+            return float(max(schema.get("minimum", 1.0), 1.0))
+        if schema_type == "boolean":
+            return False
+        if schema_type == "string":
+            fmt = schema.get("format", "")
+            if fmt == "email":
+                return "buyer@example.com"
+            if fmt.startswith("ISO 3166"):
+                return "US"
+            return "string"
+        return None
+
+
+class Operation:
+    def __init__(self, operation_id: str, method: str, path: str, details: dict) -> None:
+        self.operation_id = operation_id
+        self.method = method
+        self.path = path
+        self.path_params = re.findall(r"{(\w+)}", path)
+        pattern = re.sub(r"{(\w+)}", r"(?P<\1>[^/]+)", path)
+        self.pattern = re.compile(f"^{pattern}$")
+        self.status, self.schema = self._success_response(details.get("responses", {}))
+
+    @staticmethod
+    def _success_response(responses: dict) -> Tuple[int, Optional[dict]]:
+        for code in sorted(responses):
+            if code.startswith("2"):
+                content = responses[code].get("content", {})
+                schema = content.get("application/json", {}).get("schema")
+                return int(code), schema
+        return 200, None
+
+
+class MockEtsyState:
+    """Configuration and mutable counters shared by all handler threads."""
+
+    def __init__(
+        self,
+        spec: dict,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: Sequence[int] = (500, 503),
+        operation_error_rates: Optional[Dict[str, float]] = None,
+        limit_per_second: int = 10,
+        limit_per_day: int = 10000,
+        array_items: int = 1,
+        seed: Optional[int] = None,
+        gzip_min_size: Optional[int] = GZIP_MIN_SIZE,
+    ) -> None:
+        self.latency = latency
+        self.gzip_min_size = gzip_min_size
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = list(error_statuses)
+        self.operation_error_rates = dict(operation_error_rates or {})
+        self.limit_per_second = limit_per_second
+        self.limit_per_day = limit_per_day
+        self.sampler = SchemaSampler(spec, array_items=array_items)
+        self.operations: Dict[str, List[Operation]] = {m.upper(): [] for m in HTTP_METHODS}
+        for path, methods in spec.get("paths", {}).items():
+            for method, details in methods.items():
+                if method in HTTP_METHODS:
+                    operation = Operation(
+                        details.get("operationId", f"{method}:{path}"),
+                        method.upper(),
+                        path,
+                        details,
+                    )
+                    self.operations[method.upper()].append(operation)
+        for candidates in self.operations.values():
+            # Literal segments must win over placeholders (/listings/active vs /listings/{id}).
+            candidates.sort(key=lambda op: (len(op.path_params), -len(op.path)))
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.recent: Deque[float] = deque()
+        self.day = self._today()
+        self.used_today = 0
+        self.calls: Dict[str, int] = {}
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(tz=timezone.utc).strftime("%Y-%m-%d")
+
+    def match(self, method: str, path: str) -> Tuple[Optional[Operation], Dict[str, str]]:
+        for operation in self.operations.get(method, []):
+            found = operation.pattern.match(path)
+            if found:
+                return operation, found.groupdict()
+        return None, {}
+
+    def consume(self, operation_id: str) -> Tuple[bool, Dict[str, str]]:
+        """Record a call; returns (allowed, rate-limit headers)."""
+        with self.lock:
+            self.calls[operation_id] = self.calls.get(operation_id, 0) + 1
+            now = time.monotonic()
+            while self.recent and now - self.recent[0] >= 1.0:
+                self.recent.popleft()
+            if self._today() != self.day:
+                self.day, self.used_today = self._today(), 0
+            allowed = (
+                len(self.recent) < self.limit_per_second
+                and self.used_today < self.limit_per_day
+            )
+            if allowed:
+                self.recent.append(now)
+                self.used_today += 1
+            headers = {
+                "X-Limit-Per-Second": str(self.limit_per_second),
+                "X-Remaining-This-Second": str(max(self.limit_per_second - len(self.recent), 0)),
+                "X-Limit-Per-Day": str(self.limit_per_day),
+                "X-Remaining-Today": str(max(self.limit_per_day - self.used_today, 0)),
+            }
+            return allowed, headers
+
+    def delay(self) -> float:
+        with self.lock:
+            return self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def should_fail(self, operation_id: str) -> Optional[int]:
+        rate = self.operation_error_rates.get(operation_id, self.error_rate)
+        with self.lock:
+            if rate and self.random.random() < rate:
+                return self.random.choice(self.error_statuses)
+        return None
+
+    def body_for(self, operation: Operation, path_values: Dict[str, str]) -> Any:
+        if operation.schema is None:
+            return None
+        body = self.sampler.sample(operation.schema)
+        values = {k: int(v) if v.isdigit() else v for k, v in path_values.items()}
+        targets = [body]
+        if isinstance(body, dict) and isinstance(body.get("results"), list):
+            body["count"] = len(body["results"])
+            targets.extend(body["results"])
+        # Echo path ids back so a GET for listing 42 returns listing_id 42.
+        for target in targets:
+            if isinstance(target, dict):
+                for key, value in values.items():
+                    if key in target:
+                        target[key] = value
+        return body
+
+
+class MockEtsyHandler(BaseHTTPRequestHandler):
+    server_version = "MockEtsy/1.0"
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, Nagle plus
+    # delayed ACK adds ~40ms to every keep-alive response.
+    disable_nagle_algorithm = True
+
+    @property
+    def state(self) -> MockEtsyState:
+        return self.server.state  # type: ignore[attr-defined]
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        payload = b"" if status == 204 else json.dumps(body).encode("utf-8")
+        min_size = self.state.gzip_min_size
+        compress = (
+            min_size is not None
+            and len(payload) >= min_size
+            and "gzip" in self.headers.get("Accept-Encoding", "")
+        )
+        if compress:
+            payload = gzip.compress(payload, compresslevel=6)
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        if status != 204:
+            self.send_header("Content-Type", "application/json")
+        if compress:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _drain_body(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+    def _handle(self) -> None:
+        self._drain_body()
+        path = urlsplit(self.path).path
+        delay = self.state.delay()
+        if delay:
+            time.sleep(delay)
+
+        if path == TOKEN_PATH and self.command == "POST":
+            self._send(
+                200,
+                {
+                    "access_token": "12345678.mock-access-token",
+                    "refresh_token": "mock-refresh-token",
+                    "expires_in": 3600,
+                    "token_type": "Bearer",
+                },
+            )
+            return
+
+        operation, path_values = self.state.match(self.command, path)
+        if operation is None:
+            self._send(404, {"error": f"No operation for {self.command} {path}"})
+            return
+
+        allowed, headers = self.state.consume(operation.operation_id)
+        if not allowed:
+            self._send(429, {"error": "Rate limit exceeded"}, {**headers, "Retry-After": "1"})
+            return
+
+        failure = self.state.should_fail(operation.operation_id)
+        if failure is not None:
+            self._send(failure, {"error": f"Injected {failure} for {operation.operation_id}"}, headers)
+            return
+
+        self._send(operation.status, self.state.body_for(operation, path_values), headers)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = _handle
+
+
+class MockEtsyServer:
+    """Threaded mock server; ``port=0`` picks a free port."""
+
+    def __init__(
+        self,
+        spec_path: Path = DEFAULT_SPEC,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        **state_options: Any,
+    ) -> None:
+        self.state = MockEtsyState(load_json(Path(spec_path)), **state_options)
+        self.httpd = ThreadingHTTPServer((host, port), MockEtsyHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = self.state  # type: ignore[attr-defined]
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_url(self) -> str:
+        return f"{self.url}/v3/application"
+
+    @property
+    def token_url(self) -> str:
+        return f"{self.url}{TOKEN_PATH}"
+
+    def start(self) -> "MockEtsyServer":
+        self.thread = threading.Thread(
+            target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread is not None:
+            self.thread.join()
+
+    def __enter__(self) -> "MockEtsyServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a mock Etsy API from the OAS spec")
+    parser.add_argument("--spec", default=str(DEFAULT_SPEC), help="Path to the OAS spec")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fixed latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra uniform random latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of calls that fail")
+    parser.add_argument(
+        "--error-status",
+        type=int,
+        action="append",
+        help="Status codes to inject (repeatable, default 500 and 503)",
+    )
+    parser.add_argument(
+        "--operation-error-rate",
+        action="append",
+        default=[],
+        metavar="OPERATION_ID=RATE",
+        help="Per-operation error rate override, e.g. getShopReceipts=0.5",
+    )
+    parser.add_argument("--limit-per-second", type=int, default=10)
+    parser.add_argument("--limit-per-day", type=int, default=10000)
+    parser.add_argument("--array-items", type=int, default=1, help="Items per generated array")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--no-gzip", action="store_true", help="Never compress responses"
+    )
+    args = parser.parse_args()
+
+    overrides = {}
+    for item in args.operation_error_rate:
+        operation_id, _, rate = item.partition("=")
+        overrides[operation_id] = float(rate)
+
+    server = MockEtsyServer(
+        Path(args.spec),
+        host=args.host,
+        port=args.port,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        error_statuses=args.error_status or (500, 503),
+        operation_error_rates=overrides,
+        limit_per_second=args.limit_per_second,
+        limit_per_day=args.limit_per_day,
+        array_items=args.array_items,
+        seed=args.seed,
+        gzip_min_size=None if args.no_gzip else GZIP_MIN_SIZE,
+    )
+    print(f"Mock Etsy API listening on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Profile the SDK's start-up cost: import time, peak RSS and import fan-out.
+
+Each scenario runs in a fresh interpreter under ``python -X importtime``:
+
+    package            import etsy_python
+    resources.<Name>   import etsy_python.v3.resources.<Name> (one per resource)
+    first_request      import a resource, build an EtsyClient and make one call
+                       against scripts/mock_server.py
+
+For every scenario the report lists the import time (sum of the top-level
+``-X importtime`` entries), wall time, peak RSS, the number of modules loaded
+(total and ``etsy_python.*``) and the slowest imports by self time.
+
+Usage:
+    python scripts/profile_startup.py
+    python scripts/profile_startup.py --scenario package --scenario first_request
+    python scripts/profile_startup.py --json startup.json --check benchmarks/startup_budget.json
+
+With ``--check`` the run fails (exit code 1) when a scenario exceeds its
+budget. Budgets are keyed by scenario name or an fnmatch pattern
+(``resources.*``) and may set ``import_ms``, ``peak_rss_mb``, ``modules`` and
+``sdk_modules``.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+RESOURCES_DIR = ROOT / "etsy_python" / "v3" / "resources"
+NOT_RESOURCES = {"__init__", "Session", "Response"}
+MARKER = "--- profile_startup ---"
+
+# Runs inside the child interpreter. The marker separates the probe's own
+# imports from the ones being measured in the -X importtime output.
+PROBE = """
+import json, sys, time
+try:
+    import resource
+except ImportError:
+    resource = None
+
+def _rss_kb():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+before = set(sys.modules)
+rss_before = _rss_kb()
+sys.stderr.write(%(marker)r + "\\n")
+sys.stderr.flush()
+start = time.perf_counter()
+exec(compile(%(statement)r, "<scenario>", "exec"))
+wall = time.perf_counter() - start
+loaded = sorted(set(sys.modules) - before)
+print(json.dumps({
+    "wall_ms": wall * 1000,
+    "rss_before_kb": rss_before,
+    "peak_rss_kb": _rss_kb(),
+    "loaded": loaded,
+}))
+"""
+
+FIRST_REQUEST = """
+from datetime import datetime
+from etsy_python.v3.resources.Listing import ListingResource
+from etsy_python.v3.resources.Session import EtsyClient
+
+client = EtsyClient("profile-key", "1.profile-token", "profile-refresh", expiry=datetime(2999, 1, 1))
+ListingResource(session=client).get_listing(1)
+"""
+
+
+def resource_modules() -> List[str]:
+    return sorted(
+        path.stem for path in RESOURCES_DIR.glob("*.py") if path.stem not in NOT_RESOURCES
+    )
+
+
+def scenarios() -> Dict[str, str]:
+    result = {"package": "import etsy_python"}
+    for name in resource_modules():
+        result[f"resources.{name}"] = f"import etsy_python.v3.resources.{name}"
+    result["first_request"] = FIRST_REQUEST
+    return result
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """Parse ``-X importtime`` lines after the marker.
+
+    Returns ``(module, self_us, cumulative_us, depth)`` tuples; ``depth`` is 0
+    for imports made directly by the measured statement.
+    """
+    entries = []
+    _, found, measured = stderr.partition(MARKER)
+    for line in (measured if found else stderr).splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        name = fields[2].rstrip()
+        stripped = name.lstrip(" ")
+        depth = (len(name) - len(stripped) - 1) // 2
+        entries.append((stripped, int(fields[0]), int(fields[1]), depth))
+    return entries
+
+
+def run_scenario(statement: str, env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Run ``statement`` once in a fresh interpreter and collect its figures."""
+    probe = PROBE % {"marker": MARKER, "statement": statement}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True,
+        text=True,
+        cwd=str(ROOT),
+        env=env,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"scenario failed:\n{completed.stderr[-2000:]}")
+    data = json.loads(completed.stdout.strip().splitlines()[-1])
+    entries = parse_importtime(completed.stderr)
+    loaded = data.pop("loaded")
+    data["import_ms"] = sum(cumulative for _, _, cumulative, depth in entries if depth == 0) / 1000
+    data["modules"] = len(loaded)
+    data["sdk_modules"] = sum(1 for name in loaded if name.split(".")[0] == "etsy_python")
+    data["slowest"] = [
+        [name, self_us / 1000] for name, self_us, _, _ in sorted(entries, key=lambda e: -e[1])[:5]
+    ]
+    return data
+
+
+def profile(
+    names: List[str], repeat: int = 5, env: Optional[Dict[str, str]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Run each scenario ``repeat`` times; times are medians, RSS the maximum."""
+    available = scenarios()
+    results = {}
+    for name in names:
+        runs = [run_scenario(available[name], env) for _ in range(repeat)]
+        rss = [run["peak_rss_kb"] for run in runs if run["peak_rss_kb"] is not None]
+        results[name] = {
+            "import_ms": round(statistics.median(run["import_ms"] for run in runs), 2),
+            "wall_ms": round(statistics.median(run["wall_ms"] for run in runs), 2),
+            "peak_rss_mb": round(max(rss) / 1024, 1) if rss else None,
+            "modules": runs[0]["modules"],
+            "sdk_modules": runs[0]["sdk_modules"],
+            "slowest": runs[0]["slowest"],
+        }
+    return results
+
+
+def check_budget(
+    results: Dict[str, Dict[str, Any]], budget: Dict[str, Dict[str, float]]
+) -> List[str]:
+    """Return one message per figure that exceeds its budget."""
+    violations = []
+    for name, figures in results.items():
+        for pattern, limits in budget.items():
+            if not fnmatch.fnmatchcase(name, pattern):
+                continue
+            for metric, limit in limits.items():
+                value = figures.get(metric)
+                if value is not None and value > limit:
+                    violations.append(f"{name}: {metric} {value} > {limit} ({pattern})")
+    return violations
+
+
+def format_report(results: Dict[str, Dict[str, Any]]) -> str:
+    lines = [
+        "| Scenario | Import ms | Wall ms | Peak RSS MB | Modules | SDK modules | Slowest import |",
+        "|---|---:|---:|---:|---:|---:|---|",
+    ]
+    for name, figures in results.items():
+        slowest = figures["slowest"][0] if figures["slowest"] else ["-", 0]
+        lines.append(
+            f"| {name} | {figures['import_ms']:.1f} | {figures['wall_ms']:.1f} "
+            f"| {figures['peak_rss_mb']} | {figures['modules']} | {figures['sdk_modules']} "
+            f"| {slowest[0]} ({slowest[1]:.1f} ms) |"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Profile SDK import time, RSS and fan-out")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        help="Scenario to run (repeatable, fnmatch patterns allowed; default: all)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per scenario")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    parser.add_argument("--check", help="Budget JSON file; exit 1 when it is exceeded")
+    args = parser.parse_args()
+
+    available = list(scenarios())
+    names = available
+    if args.scenario:
+        names = [
+            name for name in available
+            if any(fnmatch.fnmatchcase(name, pattern) for pattern in args.scenario)
+        ]
+        if not names:
+            parser.error(f"no scenario matches {args.scenario}")
+
+    # first_request needs the mock server; import it lazily so the import-only
+    # scenarios do not pay for the spec load.
+    server = None
+    env = None
+    if "first_request" in names:
+        sys.path.insert(0, str(Path(__file__).resolve().parent))
+        from mock_server import MockEtsyServer
+
+        server = MockEtsyServer(limit_per_second=10**9, limit_per_day=10**9).start()
+        env = dict(os.environ, ETSY_ENV="LOCAL", ETSY_LOCAL_URL=server.url)
+    try:
+        results = profile(names, repeat=args.repeat, env=env)
+    finally:
+        if server is not None:
+            server.stop()
+
+    print(format_report(results))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.check:
+        with open(args.check, "r", encoding="utf-8") as f:
+            violations = check_budget(results, json.load(f))
+        if violations:
+            print("\nStart-up budget exceeded:", file=sys.stderr)
+            for violation in violations:
+                print(f"  - {violation}", file=sys.stderr)
+            sys.exit(1)
+        print(f"\nAll {len(results)} scenarios within budget.")
+
+
+if __name__ == "__main__":
+    main()
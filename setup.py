@@ -33,6 +33,15 @@ setup(
     packages=find_packages(exclude=["tests", "tests.*"]),
     python_requires=">=3.10",
     install_requires=["requests", "requests-oauthlib"],
+    extras_require={
+        "parquet": ["pyarrow"],
+        "tracing": ["opentelemetry-api"],
+        "http2": ["httpx[http2]"],
+        "brotli": ["brotli"],
+    },
+    entry_points={
+        "console_scripts": ["etsy-export=etsy_python.v3.bulk.Export:main"],
+    },
     keywords=["python", "etsy", "api"],
     classifiers=[
         "Intended Audience :: Developers",
@@ -0,0 +1,125 @@
+import pytest
+
+from etsy_python.v3.bulk.Update import BulkListingUpdater, diff_listing, partial_update
+from etsy_python.v3.enums.Listing import Includes, Type, WhoMade
+from etsy_python.v3.exceptions.RequestException import RequestException
+from etsy_python.v3.models.Listing import UpdateListingRequest
+from etsy_python.v3.resources.Response import Response
+from etsy_python.v3.resources.enums.Request import Method
+
+from tests.conftest import MOCK_SHOP_ID
+
+
+def _listing(listing_id, **overrides):
+    listing = {
+        "listing_id": listing_id,
+        "title": "Mug",
+        "description": "A mug",
+        "tags": ["mug", "coffee"],
+        "materials": [],
+        "who_made": "i_did",
+        "listing_type": "physical",
+        "item_weight": 0.5,
+        "images": [
+            {"listing_image_id": 2, "rank": 2},
+            {"listing_image_id": 1, "rank": 1},
+        ],
+    }
+    listing.update(overrides)
+    return listing
+
+
+class TestDiff:
+    def test_unchanged(self):
+        desired = UpdateListingRequest(
+            title="Mug", tags=["mug", "coffee"], who_made=WhoMade.I_DID, item_weight=0.5
+        )
+        assert diff_listing(_listing(1), desired) == {}
+
+    def test_changed_fields_only(self):
+        desired = UpdateListingRequest(title="Big Mug", tags=["mug", "coffee"])
+        assert diff_listing(_listing(1), desired) == {"title": ("Mug", "Big Mug")}
+
+    def test_renamed_and_derived_fields(self):
+        desired = UpdateListingRequest(listing_type=Type.DOWNLOAD, image_ids=[1, 2])
+        assert diff_listing(_listing(1), desired) == {"type": ("physical", "download")}
+
+    def test_cleared_field_equal_to_empty(self):
+        desired = UpdateListingRequest(materials=[], tags=[])
+        assert diff_listing(_listing(1), desired) == {"tags": (["mug", "coffee"], None)}
+
+    def test_write_only_fields_always_sent(self):
+        desired = UpdateListingRequest(production_partner_ids=[5])
+        assert "production_partner_ids" in diff_listing(_listing(1), desired)
+
+    def test_partial_update_payload(self):
+        desired = UpdateListingRequest(
+            title="Big Mug", description="A mug", listing_type=Type.DOWNLOAD, tags=[]
+        )
+        payload = partial_update(desired, ["title", "type", "tags"]).get_dict()
+        assert payload == {"title": "Big Mug", "type": "download", "tags": None}
+
+
+@pytest.fixture
+def routed(mock_session):
+    listings = {i: _listing(i) for i in range(1, 151)}
+    calls = []
+
+    def make_request(path, method=Method.GET, payload=None, query_params=None):
+        calls.append((method, path, payload, query_params))
+        if method == Method.GET:
+            ids = [int(i) for i in query_params["listing_ids"].split(",")]
+            return Response(
+                200, {"count": len(ids), "results": [listings[i] for i in ids if i in listings]}
+            )
+        if path.endswith("/13"):
+            raise RequestException(400, "bad")
+        return Response(200, {"listing_id": int(path.rsplit("/", 1)[1])})
+
+    mock_session.make_request.side_effect = make_request
+    return calls
+
+
+class TestBulkListingUpdater:
+    def test_batches_and_patches_only_changed(self, mock_session, routed):
+        desired = {i: UpdateListingRequest(title="Mug") for i in range(1, 151)}
+        desired[7] = UpdateListingRequest(title="Mug v2", tags=["mug", "coffee"])
+        desired[120] = UpdateListingRequest(description="Better mug")
+
+        results = BulkListingUpdater(mock_session, MOCK_SHOP_ID).update(desired)
+
+        gets = [c for c in routed if c[0] == Method.GET]
+        assert [len(c[3]["listing_ids"].split(",")) for c in gets] == [100, 50]
+        assert all(c[3]["includes"] is None for c in gets)
+        patches = {c[1]: c[2].get_dict() for c in routed if c[0] == Method.PATCH}
+        assert patches == {
+            f"/shops/{MOCK_SHOP_ID}/listings/7": {"title": "Mug v2"},
+            f"/shops/{MOCK_SHOP_ID}/listings/120": {"description": "Better mug"},
+        }
+        assert sum(r.skipped for r in results) == 148
+        assert [r.listing_id for r in results] == list(range(1, 151))
+
+    def test_images_included_when_needed(self, mock_session, routed):
+        BulkListingUpdater(mock_session, MOCK_SHOP_ID).update(
+            {1: UpdateListingRequest(image_ids=[2, 1])}
+        )
+        get = next(c for c in routed if c[0] == Method.GET)
+        assert get[3]["includes"] == Includes.IMAGES.value
+
+    def test_errors_and_missing_listings(self, mock_session, routed):
+        results = BulkListingUpdater(mock_session, MOCK_SHOP_ID).update(
+            {13: UpdateListingRequest(title="x"), 999: UpdateListingRequest(title="y")}
+        )
+        assert results[0].error.code == 400
+        assert results[1].error.code == 404
+
+    def test_dry_run(self, mock_session, routed):
+        (result,) = BulkListingUpdater(mock_session, MOCK_SHOP_ID).update(
+            {1: UpdateListingRequest(title="New")}, dry_run=True
+        )
+        assert result.changes == {"title": ("Mug", "New")}
+        assert not any(c[0] == Method.PATCH for c in routed)
+
+    def test_batch_size_bounds(self, mock_session):
+        with pytest.raises(ValueError):
+            BulkListingUpdater(mock_session, MOCK_SHOP_ID, batch_size=101)
@@ -0,0 +1,220 @@
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from etsy_python.v3.common.Cassette import (
+    REDACTED,
+    TOKEN_EXCHANGE_FIELDS,
+    CassetteRecorder,
+    ReplayTransport,
+    iter_paced,
+    load_cassette,
+    redact,
+)
+from etsy_python.v3.common.Hedging import HedgePolicy
+from etsy_python.v3.common.Hooks import RequestHook
+from etsy_python.v3.models.Listing import UpdateListingRequest
+from etsy_python.v3.resources.Listing import ListingResource
+from etsy_python.v3.resources.Session import EtsyClient
+
+from tests.conftest import (
+    MOCK_ACCESS_TOKEN,
+    MOCK_KEYSTRING,
+    MOCK_LISTING_ID,
+    MOCK_REFRESH_TOKEN,
+    MOCK_SHOP_ID,
+)
+
+# scripts/ is not a package; put it on the path so we can import the server.
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import mock_server  # noqa: E402
+
+
+def _client(expiry=None, **kwargs):
+    return EtsyClient(
+        MOCK_KEYSTRING,
+        MOCK_ACCESS_TOKEN,
+        MOCK_REFRESH_TOKEN,
+        expiry=expiry or datetime.now(tz=timezone.utc) + timedelta(hours=1),
+        tracing=False,
+        **kwargs,
+    )
+
+
+def _traffic(client):
+    resource = ListingResource(session=client)
+    return [
+        resource.get_listing(MOCK_LISTING_ID).message,
+        resource.get_listings_by_shop(MOCK_SHOP_ID, limit=100).message,
+        resource.update_listing(
+            MOCK_SHOP_ID, MOCK_LISTING_ID, UpdateListingRequest(title="Mug")
+        ).message,
+    ]
+
+
+@pytest.fixture
+def recorded(tmp_path):
+    path = tmp_path / "day.cassette"
+    with mock_server.MockEtsyServer(
+        limit_per_second=10**9, limit_per_day=10**9, gzip_min_size=0
+    ) as server:
+        with patch("etsy_python.v3.resources.Session.environment") as env:
+            env.request_url = server.request_url
+            env.token_url = server.token_url
+            with CassetteRecorder(path) as recorder:
+                client = _client(
+                    expiry=datetime.now(tz=timezone.utc) - timedelta(seconds=1),
+                    recorder=recorder,
+                )
+                messages = _traffic(client)
+    return path, messages
+
+
+class TestRecorder:
+    def test_one_compact_line_per_exchange(self, recorded):
+        path, _ = recorded
+        lines = path.read_text().splitlines()
+        records = [json.loads(line) for line in lines]
+
+        assert [record["m"] for record in records] == ["POST", "GET", "GET", "PATCH"]
+        assert records[1]["u"] == f"/v3/application/listings/{MOCK_LISTING_ID}"
+        assert "limit=100" in records[2]["u"]
+        assert records[3]["q"] == {"title": "Mug"}
+        assert lines[1] == json.dumps(records[1], separators=(",", ":"))
+        assert all(record["d"] >= 0 for record in records)
+
+    def test_credentials_never_written(self, recorded):
+        path, _ = recorded
+        text = path.read_text()
+        assert MOCK_REFRESH_TOKEN not in text
+        assert MOCK_KEYSTRING not in text
+        assert "mock-access-token" not in text
+        refresh = load_cassette(path)[0]
+        assert refresh["q"]["refresh_token"] == REDACTED
+        assert refresh["b"]["access_token"] == REDACTED
+
+    def test_bodies_stored_decoded(self, recorded):
+        path, messages = recorded
+        record = load_cassette(path)[1]
+        assert record["k"] == "j" and record["b"] == messages[0]
+        assert "Content-Encoding" not in record["h"]
+        assert "X-Remaining-Today" in record["h"]
+
+    def test_appends_across_runs(self, tmp_path):
+        path = tmp_path / "c"
+        response = requests.Response()
+        response.status_code = 204
+        for _ in range(2):
+            with CassetteRecorder(path) as recorder:
+                recorder.record("DELETE", "https://x/v3/a", None, response, 1.0)
+        assert len(load_cassette(path)) == 2
+
+
+def test_redact_nested():
+    body = {"a": [{"code": "x", "b": 1}], "client_id": "k", "refresh_token": "r"}
+    assert redact(body) == {
+        "a": [{"code": "x", "b": 1}],
+        "client_id": "k",
+        "refresh_token": REDACTED,
+    }
+    assert redact(body, TOKEN_EXCHANGE_FIELDS) == {
+        "a": [{"code": REDACTED, "b": 1}],
+        "client_id": REDACTED,
+        "refresh_token": REDACTED,
+    }
+
+
+def test_code_fields_kept_outside_token_exchange(tmp_path):
+    path = tmp_path / "c"
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'{"code": "USD", "status": {"code": "paid"}}'
+    with CassetteRecorder(path) as recorder:
+        recorder.record("GET", "https://x/v3/application/shops/1", None, response, 1.0)
+        recorder.record(
+            "POST", "https://x/v3/public/oauth/token", {"code": "c"}, response, 2.0
+        )
+
+    data, token = load_cassette(path)
+    assert data["b"] == {"code": "USD", "status": {"code": "paid"}}
+    assert token["q"]["code"] == REDACTED and token["b"]["code"] == REDACTED
+
+
+def test_hedged_call_recorded_once(tmp_path):
+    path = tmp_path / "c"
+    with mock_server.MockEtsyServer(
+        limit_per_second=10**9, limit_per_day=10**9
+    ) as server, patch("etsy_python.v3.resources.Session.environment") as env:
+        env.request_url = server.request_url
+        env.token_url = server.token_url
+        with CassetteRecorder(path) as recorder:
+            # initial_delay=0 hedges every call, so both attempts go out.
+            policy = HedgePolicy(initial_delay=0, min_delay=0, max_hedge_ratio=1.0)
+            client = _client(recorder=recorder, hedging=policy)
+            ListingResource(session=client).get_listing(MOCK_LISTING_ID)
+            policy.shutdown()
+
+    assert policy.stats()["hedges"] == 1
+    assert [record["m"] for record in load_cassette(path)] == ["GET"]
+
+
+def test_torn_final_line_skipped(tmp_path):
+    path = tmp_path / "c"
+    path.write_text('{"at":1,"m":"GET","u":"/a","s":200,"h":{}}\n{"at":2,"m":"G')
+    assert len(load_cassette(path)) == 1
+
+
+class TestReplayTransport:
+    def test_replays_same_results_offline(self, recorded):
+        path, messages = recorded
+        events = []
+        hook = RequestHook()
+        hook.after_response = events.append
+        transport = ReplayTransport(path, speed=None)
+        client = _client(
+            expiry=datetime.now(tz=timezone.utc) - timedelta(seconds=1),
+            transport=transport,
+            hooks=[hook],
+        )
+
+        assert _traffic(client) == messages
+        assert transport.remaining == 0
+        assert [event.operation for event in events] == [
+            "getListing",
+            "getListingsByShop",
+            "updateListing",
+        ]
+        assert events[0].rate_limits.remaining_today is not None
+        assert events[2].bytes_sent == len(b'{"title": "Mug"}')
+
+    def test_unrecorded_request_is_a_connection_error(self, recorded):
+        path, _ = recorded
+        client = _client(transport=ReplayTransport(path, speed=None))
+        with pytest.raises(requests.ConnectionError, match="/listings/999"):
+            client.make_request("/listings/999")
+
+    def test_latency_scaled_by_speed(self):
+        records = [{"at": 0, "m": "GET", "u": "/a", "s": 204, "h": {}, "d": 0.5}]
+        transport = ReplayTransport(records, speed=10.0)
+        with patch("etsy_python.v3.common.Cassette.time.sleep") as sleep:
+            response = transport.get("https://api.etsy.com/a")
+        sleep.assert_called_once_with(pytest.approx(0.05))
+        assert response.status_code == 204
+        assert response.elapsed == timedelta(seconds=0.05)
+
+
+def test_iter_paced_keeps_traffic_shape():
+    records = [{"at": 100.0}, {"at": 101.0}, {"at": 104.0}]
+    with patch("etsy_python.v3.common.Cassette.time.monotonic", return_value=0.0), patch(
+        "etsy_python.v3.common.Cassette.time.sleep"
+    ) as sleep:
+        assert list(iter_paced(records, speed=2.0)) == records
+    assert [call.args[0] for call in sleep.call_args_list] == [0.5, 2.0]
@@ -0,0 +1,170 @@
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from etsy_python.v3.common.CircuitBreaker import (
+    CircuitBreaker,
+    CircuitState,
+    endpoint_family,
+)
+from etsy_python.v3.exceptions import CircuitOpenException, RequestException
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(min_calls=4, failure_rate=0.5, reset_timeout=10, clock=clock)
+
+
+def _fail(breaker, path="/shops/1/receipts", error=None):
+    circuit = breaker.before_call(path)
+    breaker.after_call(circuit, 0.1, error=error or RequestException(503))
+
+
+def _succeed(breaker, path="/shops/1/receipts", duration=0.1):
+    circuit = breaker.before_call(path)
+    breaker.after_call(circuit, duration, status=200)
+
+
+class TestEndpointFamily:
+    @pytest.mark.parametrize(
+        "path, family",
+        [
+            ("/shops/1/receipts", "receipts"),
+            ("/shops/1/receipts/22", "receipts"),
+            ("/shops/1/receipts/22/transactions", "receipts"),
+            ("/shops/1/listings/active", "listings"),
+            ("/shops/1/listings/5/images/6", "listings"),
+            ("/listings/active", "listings"),
+            ("/listings/5", "listings"),
+            ("/listings/5/images/6", "listings"),
+            ("/listings/batch", "listings"),
+            ("/shops/1", "shops"),
+            ("/shops", "shops"),
+            ("/users/me", "users"),
+            ("/users/7/addresses", "addresses"),
+            ("/seller-taxonomy/nodes/3/properties", "seller-taxonomy"),
+            ("/", "/"),
+        ],
+    )
+    def test_family(self, path, family):
+        assert endpoint_family(path) == family
+
+
+class TestStateMachine:
+    def test_opens_at_failure_rate(self, breaker):
+        _succeed(breaker)
+        _succeed(breaker)
+        _fail(breaker)
+        assert breaker.states()["receipts"] is CircuitState.CLOSED
+        _fail(breaker)
+        assert breaker.states()["receipts"] is CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenException) as exc:
+            breaker.before_call("/shops/1/receipts/9")
+        assert isinstance(exc.value, RequestException)
+        assert exc.value.endpoint == "receipts"
+        assert exc.value.retry_after == pytest.approx(10)
+
+    def test_families_are_independent(self, breaker):
+        for _ in range(4):
+            _fail(breaker)
+        _succeed(breaker, "/listings/1")
+
+    def test_client_errors_do_not_count(self, breaker):
+        for _ in range(4):
+            _fail(breaker, error=RequestException(404))
+        assert breaker.states()["receipts"] is CircuitState.CLOSED
+
+    def test_transport_errors_and_slow_calls_count(self, clock):
+        breaker = CircuitBreaker(min_calls=2, slow_call_duration=1.0, clock=clock)
+        _fail(breaker, error=requests.Timeout())
+        _succeed(breaker, duration=2.0)
+        assert breaker.states()["receipts"] is CircuitState.OPEN
+
+    def test_half_open_probe_closes(self, breaker, clock):
+        for _ in range(4):
+            _fail(breaker)
+        clock.now += 10
+
+        probe = breaker.before_call("/shops/1/receipts")
+        assert breaker.states()["receipts"] is CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenException):
+            breaker.before_call("/shops/1/receipts")
+        breaker.after_call(probe, 0.1, status=200)
+
+        assert breaker.states()["receipts"] is CircuitState.CLOSED
+
+    def test_unreported_probe_expires(self, breaker, clock):
+        for _ in range(4):
+            _fail(breaker)
+        clock.now += 10
+        breaker.before_call("/shops/1/receipts")  # never reports back
+
+        clock.now += 9
+        with pytest.raises(CircuitOpenException) as info:
+            breaker.before_call("/shops/1/receipts")
+        assert info.value.retry_after == pytest.approx(1)
+        clock.now += 1
+        breaker.before_call("/shops/1/receipts")
+
+    def test_half_open_probe_failure_reopens(self, breaker, clock):
+        for _ in range(4):
+            _fail(breaker)
+        clock.now += 10
+        _fail(breaker)
+        assert breaker.states()["receipts"] is CircuitState.OPEN
+
+    def test_failures_outside_window_forgotten(self, clock):
+        breaker = CircuitBreaker(min_calls=2, window=5, clock=clock)
+        _fail(breaker)
+        clock.now += 6
+        _succeed(breaker)
+        assert breaker.states()["receipts"] is CircuitState.CLOSED
+
+
+class TestClientIntegration:
+    def test_open_circuit_fails_fast(self, real_etsy_client):
+        real_etsy_client.circuit_breaker = CircuitBreaker(min_calls=2)
+        resp = MagicMock()
+        resp.status_code = 503
+        resp.headers = {}
+        resp.json.return_value = {"error": "unavailable"}
+        http = real_etsy_client._mock_http_session
+        http.get.return_value = resp
+
+        for _ in range(2):
+            with pytest.raises(RequestException):
+                real_etsy_client.make_request("/shops/1/receipts")
+        with pytest.raises(CircuitOpenException):
+            real_etsy_client.make_request("/shops/1/receipts")
+
+        assert http.get.call_count == 2
+
+    def test_probe_released_when_acquire_fails(self, real_etsy_client):
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_calls=1, reset_timeout=10, clock=clock)
+        _fail(breaker)
+        clock.now += 10
+        real_etsy_client.circuit_breaker = breaker
+        real_etsy_client.rate_limiter = MagicMock()
+        real_etsy_client.rate_limiter.acquire.side_effect = ValueError("unknown lane")
+
+        with pytest.raises(ValueError):
+            real_etsy_client.make_request("/shops/1/receipts")
+
+        assert breaker.states()["receipts"] is CircuitState.HALF_OPEN
+        breaker.before_call("/shops/1/receipts")  # the probe slot is free again
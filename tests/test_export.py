@@ -0,0 +1,171 @@
+import csv
+import io
+import json
+
+import pytest
+
+from etsy_python.v3.bulk.Export import (
+    CsvExportWriter,
+    ExportFormat,
+    JsonlExportWriter,
+    export_ledger_entries,
+    export_receipts,
+    flatten_record,
+    iterate_receipt_pages,
+    main,
+    month_bounds,
+    write_pages,
+)
+from etsy_python.v3.resources.Response import Response
+
+from tests.conftest import MOCK_SHOP_ID
+
+
+def _paged(rows):
+    def make_request(endpoint, query_params=None, **_):
+        start = query_params["offset"]
+        page = rows[start : start + query_params["limit"]]
+        return Response(200, {"count": len(rows), "results": page})
+
+    return make_request
+
+
+class TestFlattenRecord:
+    def test_nested_money(self):
+        row = flatten_record({"id": 1, "grandtotal": {"amount": 100, "divisor": 100}})
+        assert row == {"id": 1, "grandtotal_amount": 100, "grandtotal_divisor": 100}
+
+    def test_lists_json_encoded(self):
+        row = flatten_record({"transactions": [{"transaction_id": 1}]})
+        assert json.loads(row["transactions"]) == [{"transaction_id": 1}]
+
+
+class TestWriters:
+    def test_csv_header_fixed_by_first_row(self):
+        stream = io.StringIO()
+        writer = CsvExportWriter(stream)
+        writer.write_rows([{"a": 1, "b": 2}])
+        writer.write_rows([{"a": 3, "c": 4}])
+
+        rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+        assert rows == [{"a": "1", "b": "2"}, {"a": "3", "b": ""}]
+        assert writer.rows_written == 2
+
+    def test_jsonl_respects_columns(self):
+        stream = io.StringIO()
+        JsonlExportWriter(stream, columns=["a"]).write_rows([{"a": 1, "b": 2}])
+        assert stream.getvalue() == '{"a": 1}\n'
+
+    def test_pages_written_as_they_arrive(self):
+        stream = io.StringIO()
+        writer = JsonlExportWriter(stream)
+        seen = []
+
+        def pages():
+            for n in range(3):
+                yield [{"n": n}]
+                seen.append(stream.getvalue().count("\n"))
+
+        assert write_pages(pages(), writer) == 3
+        assert seen == [1, 2, 3]
+
+
+class TestExportReceipts:
+    def test_writes_all_pages_to_csv(self, mock_session, tmp_path):
+        receipts = [{"receipt_id": i, "grandtotal": {"amount": i}} for i in range(5)]
+        mock_session.make_request.side_effect = _paged(receipts)
+        path = tmp_path / "receipts.csv"
+
+        count = export_receipts(mock_session, MOCK_SHOP_ID, str(path))
+
+        assert count == 5
+        rows = list(csv.DictReader(path.open()))
+        assert [r["receipt_id"] for r in rows] == ["0", "1", "2", "3", "4"]
+        assert rows[0]["grandtotal_amount"] == "0"
+
+    def test_receipts_read_oldest_first(self, mock_session):
+        mock_session.make_request.side_effect = _paged([])
+        list(iterate_receipt_pages(mock_session, MOCK_SHOP_ID, min_created=1, max_created=2))
+
+        qp = mock_session.make_request.call_args[1]["query_params"]
+        assert qp["sort_on"] == "created"
+        assert qp["sort_order"] == "asc"
+        assert qp["min_created"] == 1
+
+
+class TestExportLedgerEntries:
+    def test_writes_jsonl(self, mock_session, tmp_path):
+        entries = [{"entry_id": i, "amount": i * 10} for i in range(3)]
+        mock_session.make_request.side_effect = _paged(entries)
+        path = tmp_path / "ledger.jsonl"
+
+        count = export_ledger_entries(
+            mock_session, MOCK_SHOP_ID, str(path), 1, 2, ExportFormat.JSONL
+        )
+
+        assert count == 3
+        lines = path.read_text().splitlines()
+        assert json.loads(lines[2]) == {"entry_id": 2, "amount": 20}
+
+
+class TestParquet:
+    def test_batches_into_row_groups(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        from etsy_python.v3.bulk.Export import ParquetExportWriter
+
+        path = tmp_path / "out.parquet"
+        with path.open("wb") as stream:
+            writer = ParquetExportWriter(stream, batch_size=2)
+            write_pages([[{"a": 1}, {"a": 2}], [{"a": 3}]], writer)
+
+        table = pq.read_table(str(path))
+        assert table.column("a").to_pylist() == [1, 2, 3]
+
+
+    def test_column_empty_in_first_batch(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        from etsy_python.v3.bulk.Export import ParquetExportWriter
+
+        path = tmp_path / "out.parquet"
+        with path.open("wb") as stream:
+            writer = ParquetExportWriter(stream, batch_size=2)
+            write_pages(
+                [
+                    [{"a": 1, "note": None}, {"a": 2, "note": None}],
+                    [{"a": 3, "note": "gift"}, {"a": 4, "note": 7}],
+                ],
+                writer,
+            )
+
+        table = pq.read_table(str(path))
+        assert table.column("note").to_pylist() == [None, None, "gift", "7"]
+
+    def test_explicit_schema(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        from etsy_python.v3.bulk.Export import ParquetExportWriter
+
+        schema = pa.schema([("a", pa.int64()), ("shipped", pa.int64())])
+        path = tmp_path / "out.parquet"
+        with path.open("wb") as stream:
+            writer = ParquetExportWriter(stream, batch_size=1, schema=schema)
+            write_pages([[{"a": 1, "shipped": None}], [{"a": 2, "shipped": 99}]], writer)
+
+        table = pq.read_table(str(path))
+        assert table.schema == schema
+        assert table.column("shipped").to_pylist() == [None, 99]
+
+
+class TestMonthBounds:
+    def test_regular_month(self):
+        assert month_bounds("2026-09") == (1788220800, 1790812799)
+
+    def test_december_rolls_year(self):
+        start, end = month_bounds("2025-12")
+        assert end - start == 31 * 86400 - 1
+
+
+class TestMain:
+    def test_ledger_requires_range(self):
+        with pytest.raises(SystemExit):
+            main(["ledger-entries", "--shop-id", "1", "--output", "x.csv"])
@@ -0,0 +1,251 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from etsy_python.v3.common.Hedging import HedgePolicy
+from etsy_python.v3.common.Hooks import RequestHook
+from etsy_python.v3.common.RateLimiter import RateLimiter
+from etsy_python.v3.common.Timing import set_connect_time
+
+
+class SlowFirst:
+    """The first call blocks until released; later calls answer at once."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = 0
+        self.responses = []
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            number = self.calls
+        response = MagicMock(name=f"response-{number}")
+        self.responses.append(response)
+        if number == 1:
+            self.release.wait(5)
+        return response
+
+
+@pytest.fixture
+def policy():
+    policy = HedgePolicy(initial_delay=0.02, max_hedge_ratio=1.0)
+    yield policy
+    policy.shutdown()
+
+
+class TestHedgePolicy:
+    def test_fast_reply_not_hedged(self, policy):
+        send = MagicMock(return_value="ok")
+        assert policy.run("/listings/{id}", send, lambda: True) == "ok"
+        assert send.call_count == 1
+        assert policy.stats()["hedges"] == 0
+
+    def test_slow_reply_hedged_and_loser_closed(self, policy):
+        send = SlowFirst()
+        result = policy.run("/listings/{id}", send, lambda: True)
+
+        assert send.calls == 2
+        assert result is send.responses[1]
+        assert policy.stats() == {"requests": 1, "hedges": 1, "hedge_wins": 1}
+
+        send.release.set()
+        deadline = time.time() + 2
+        while not send.responses[0].close.called and time.time() < deadline:
+            time.sleep(0.005)
+        send.responses[0].close.assert_called_once()
+
+    def test_unstarted_loser_cancelled(self, policy):
+        class QueuedHedge(ThreadPoolExecutor):
+            """Runs the primary; leaves the hedge queued as a busy pool would."""
+
+            def submit(self, fn, *args, **kwargs):
+                if not hasattr(self, "queued"):
+                    self.queued = None
+                    return super().submit(fn, *args, **kwargs)
+                self.queued = Future()
+                return self.queued
+
+        policy._executor = QueuedHedge(max_workers=1)
+        send = SlowFirst()
+        threading.Timer(0.05, send.release.set).start()
+
+        assert policy.run("/listings/{id}", send, lambda: True) is send.responses[0]
+        assert policy._executor.queued.cancelled()
+        assert send.calls == 1
+
+    def test_budget_denies_hedge(self, policy):
+        send = SlowFirst()
+        threading.Timer(0.05, send.release.set).start()
+        result = policy.run("/listings/{id}", send, lambda: False)
+        assert result is send.responses[0]
+        assert send.calls == 1
+
+    def test_hedge_ratio_cap(self):
+        policy = HedgePolicy(initial_delay=0.01, max_hedge_ratio=0.1)
+        send = SlowFirst()
+        threading.Timer(0.05, send.release.set).start()
+        policy.run("/listings/{id}", send, lambda: True)
+        assert policy.stats()["hedges"] == 0
+        policy.shutdown()
+
+    def test_failed_primary_falls_back_to_hedge(self, policy):
+        attempts = []
+
+        def send():
+            attempts.append(1)
+            if len(attempts) == 1:
+                time.sleep(0.05)
+                raise ConnectionError("reset")
+            return "hedged"
+
+        assert policy.run("/listings/{id}", send, lambda: True) == "hedged"
+
+    def test_saturated_pool_sends_on_caller_thread_unhedged(self):
+        policy = HedgePolicy(initial_delay=0.01, max_hedge_ratio=1.0, max_workers=1)
+        busy = SlowFirst()
+        worker = threading.Thread(
+            target=policy.run, args=("/listings/{id}", busy, lambda: False)
+        )
+        worker.start()
+        while busy.calls == 0:
+            time.sleep(0.001)
+        threads = []
+
+        def send():
+            threads.append(threading.current_thread())
+            time.sleep(0.05)
+            return "ok"
+
+        assert policy.run("/listings/{id}", send, lambda: True) == "ok"
+        assert threads == [threading.current_thread()]
+        assert policy.stats()["hedges"] == 0
+        busy.release.set()
+        worker.join()
+        policy.shutdown()
+
+    def test_delay_counts_from_primary_start(self, policy):
+        class SlowStart(ThreadPoolExecutor):
+            """Starts work late, as a pool busy with other callers would."""
+
+            def submit(self, fn, *args, **kwargs):
+                def queued():
+                    time.sleep(0.1)
+                    return fn(*args, **kwargs)
+
+                return super().submit(queued)
+
+        policy._executor = SlowStart(max_workers=2)
+        send = MagicMock(return_value="ok")
+
+        assert policy.run("/listings/{id}", send, lambda: True) == "ok"
+        assert send.call_count == 1
+        assert policy.delay_for("/listings/{id}") == policy.initial_delay
+        assert policy._latencies["/listings/{id}"][0] < 0.05
+
+    def test_delay_tracks_percentile(self):
+        policy = HedgePolicy(percentile=90, min_samples=10)
+        for i in range(1, 11):
+            policy.observe("/listings/{id}", i / 100)
+        assert policy.delay_for("/listings/{id}") == pytest.approx(0.10)
+        assert policy.delay_for("/listings/batch") == policy.initial_delay
+        policy.shutdown()
+
+    def test_operations_filter(self):
+        policy = HedgePolicy(operations={"/listings/{id}"})
+        assert policy.applies("/listings/{id}")
+        assert not policy.applies("/shops/{id}/receipts")
+        policy.shutdown()
+
+
+class TestClientIntegration:
+    def _response(self):
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.headers = {}
+        resp.json.return_value = {"listing_id": 1}
+        return resp
+
+    def test_get_routed_through_policy(self, real_etsy_client, policy):
+        real_etsy_client.hedging = policy
+        real_etsy_client._mock_http_session.get.return_value = self._response()
+
+        assert real_etsy_client.make_request("/listings/1").code == 200
+        assert policy.stats()["requests"] == 1
+
+    def test_hedge_reported_as_retry(self, real_etsy_client, policy):
+        class Retries(RequestHook):
+            def after_response(self, event):
+                self.retries = event.retries
+
+        hook = Retries()
+        real_etsy_client.hooks = [hook]
+        real_etsy_client.hedging = policy
+        release = threading.Event()
+        responses = [self._response(), self._response()]
+
+        def get(url):
+            response = responses.pop()
+            if not responses:
+                return response
+            release.wait(5)
+            return response
+
+        real_etsy_client._mock_http_session.get.side_effect = get
+
+        assert real_etsy_client.make_request("/listings/1").code == 200
+        release.set()
+        assert hook.retries == 1
+
+    def test_losing_attempt_observed_and_closed(self, real_etsy_client, policy):
+        class Events(RequestHook):
+            def __init__(self):
+                self.events = []
+
+            def after_response(self, event):
+                self.events.append(event)
+
+        hook = Events()
+        real_etsy_client.hooks = [hook, real_etsy_client.quota]
+        real_etsy_client.hedging = policy
+        release = threading.Event()
+        responses = [self._response(), self._response()]
+        slow = responses[1]  # popped first, by the primary
+
+        def get(url):
+            response = responses.pop()
+            if responses:
+                set_connect_time(0.5)
+                release.wait(5)
+            else:
+                set_connect_time(0.25)
+            return response
+
+        real_etsy_client._mock_http_session.get.side_effect = get
+
+        real_etsy_client.make_request("/listings/1")
+        assert hook.events[0].timings.connect == 0.25
+        release.set()
+        deadline = time.time() + 2
+        while len(hook.events) < 2 and time.time() < deadline:
+            time.sleep(0.005)
+
+        duplicate = hook.events[1]
+        assert duplicate.status == 200 and duplicate.timings.connect == 0.5
+        assert duplicate.operation == hook.events[0].operation
+        rates = real_etsy_client.quota.snapshot().operation_rates
+        assert rates == {"getListing": 7200.0}  # both attempts used quota
+        slow.close.assert_called_once()
+
+    def test_hedge_needs_rate_limit_slot(self, real_etsy_client, policy):
+        real_etsy_client.hedging = policy
+        limiter = MagicMock(spec=RateLimiter)
+        limiter.try_acquire.return_value = False
+        real_etsy_client.rate_limiter = limiter
+
+        assert real_etsy_client._can_hedge() is False
+        limiter.try_acquire.assert_called_once_with()
@@ -0,0 +1,192 @@
+import logging
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from etsy_python.v3.common.Hooks import (
+    HistogramHook,
+    LoggingHook,
+    RequestEvent,
+    RequestHook,
+    RequestTimings,
+    uri_template,
+)
+from etsy_python.v3.exceptions.RequestException import RequestException
+from etsy_python.v3.models.Request import Request
+from etsy_python.v3.resources.enums.Request import Method
+
+
+class RecordingHook(RequestHook):
+    def __init__(self):
+        self.calls = []
+
+    def before_send(self, event):
+        self.calls.append(("before_send", event.status))
+
+    def after_response(self, event):
+        self.calls.append(("after_response", event.status))
+
+    def on_error(self, event):
+        self.calls.append(("on_error", event.status))
+
+
+def _response(status_code=200, json_data=None, content=b'{"ok": true}', body=None):
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.headers = {}
+    resp.json.return_value = json_data if json_data is not None else {"ok": True}
+    resp.content = content
+    resp.elapsed = timedelta(milliseconds=12)
+    resp.request.body = body
+    return resp
+
+
+def _event(**overrides):
+    data = dict(
+        operation="GET /listings/{id}",
+        uri_template="/listings/{id}",
+        method="GET",
+        url="https://example/listings/1",
+        status=200,
+        timings=RequestTimings(total=0.03),
+    )
+    data.update(overrides)
+    return RequestEvent(**data)
+
+
+class TestUriTemplate:
+    def test_numeric_segments_collapsed(self):
+        assert uri_template("/shops/1/receipts/22/transactions") == (
+            "/shops/{id}/receipts/{id}/transactions"
+        )
+
+    def test_literal_segments_kept(self):
+        assert uri_template("/listings/batch") == "/listings/batch"
+
+
+class TestClientDispatch:
+    def test_success_sequence(self, real_etsy_client):
+        hook = RecordingHook()
+        real_etsy_client.hooks = [hook]
+        real_etsy_client._mock_http_session.get.return_value = _response()
+
+        real_etsy_client.make_request("/listings/1")
+
+        assert hook.calls == [("before_send", None), ("after_response", 200)]
+
+    def test_error_status_reaches_both_stages(self, real_etsy_client):
+        hook = RecordingHook()
+        real_etsy_client.hooks = [hook]
+        real_etsy_client._mock_http_session.get.return_value = _response(
+            404, {"error": "missing"}
+        )
+
+        with pytest.raises(RequestException):
+            real_etsy_client.make_request("/listings/1")
+
+        assert hook.calls[1:] == [("after_response", 404), ("on_error", 404)]
+
+    def test_transport_error(self, real_etsy_client):
+        hook = RecordingHook()
+        real_etsy_client.hooks = [hook]
+        real_etsy_client._mock_http_session.get.side_effect = requests.ConnectionError()
+
+        with pytest.raises(requests.ConnectionError):
+            real_etsy_client.make_request("/listings/1")
+
+        assert hook.calls[1:] == [("on_error", None)]
+
+    def test_event_fields(self, real_etsy_client):
+        events = []
+        hook = RequestHook()
+        hook.after_response = events.append
+        real_etsy_client.hooks = [hook]
+        real_etsy_client._mock_http_session.post.return_value = _response(
+            201, content=b"x" * 40, body=b"y" * 10
+        )
+        payload = MagicMock(spec=Request)
+        payload.get_dict.return_value = {}
+
+        real_etsy_client.make_request("/shops/5/listings", method=Method.POST, payload=payload)
+
+        event = events[0]
+        assert event.operation == "createDraftListing"
+        assert event.uri_template == "/shops/{id}/listings"
+        assert event.bytes_received == 40
+        assert event.bytes_sent == 10
+        assert event.timings.ttfb == pytest.approx(0.012)
+        assert event.timings.total is not None
+
+    def test_unknown_path_falls_back_to_template(self, real_etsy_client):
+        events = []
+        hook = RequestHook()
+        hook.after_response = events.append
+        real_etsy_client.hooks = [hook]
+        real_etsy_client._mock_http_session.get.return_value = _response()
+
+        real_etsy_client.make_request("/not-in-spec/7")
+
+        assert events[0].operation == "GET /not-in-spec/{id}"
+
+    def test_failing_hook_does_not_break_request(self, real_etsy_client):
+        hook = RequestHook()
+        hook.before_send = MagicMock(side_effect=RuntimeError("boom"))
+        real_etsy_client.hooks = [hook]
+        real_etsy_client._mock_http_session.get.return_value = _response()
+
+        assert real_etsy_client.make_request("/listings/1").code == 200
+
+
+class TestLoggingHook:
+    def test_logs_response(self, caplog):
+        hook = LoggingHook()
+        with caplog.at_level(logging.INFO, logger="etsy_python.requests"):
+            hook.after_response(_event())
+        assert "GET /listings/{id} -> 200" in caplog.text
+
+
+class TestHistogramHook:
+    def test_cumulative_buckets(self):
+        hook = HistogramHook(buckets=(0.01, 0.05, 0.1))
+        hook.after_response(_event(timings=RequestTimings(total=0.03)))
+        hook.after_response(_event(timings=RequestTimings(total=0.2)))
+
+        series = hook.snapshot()[("GET /listings/{id}", "GET", "200")]
+        assert series["buckets"] == [0, 1, 1]
+        assert series["count"] == 2
+
+    def test_transport_errors_observed_once(self):
+        hook = HistogramHook()
+        event = _event(status=404)
+        hook.after_response(event)
+        hook.on_error(event)
+        hook.on_error(_event(status=None))
+
+        snapshot = hook.snapshot()
+        assert snapshot[("GET /listings/{id}", "GET", "404")]["count"] == 1
+        assert snapshot[("GET /listings/{id}", "GET", "error")]["count"] == 1
+
+    def test_render_exposition(self):
+        hook = HistogramHook(buckets=(0.1,))
+        hook.after_response(_event(bytes_received=100))
+        text = hook.render()
+        assert (
+            'etsy_request_duration_seconds_bucket{operation="GET /listings/{id}",'
+            'method="GET",status="200",le="0.1"} 1'
+        ) in text
+        assert 'etsy_request_bytes_received_total{operation="GET /listings/{id}"' in text
+
+    def test_wire_bytes_counter(self):
+        hook = HistogramHook()
+        hook.after_response(_event(bytes_received=1000, wire_bytes_received=200))
+        hook.after_response(_event(bytes_received=50))
+
+        series = hook.snapshot()[("GET /listings/{id}", "GET", "200")]
+        assert series["bytes_received"] == 1050
+        assert series["wire_bytes_received"] == 250
+        assert (
+            'etsy_request_wire_bytes_received_total{operation="GET /listings/{id}",'
+            'method="GET",status="200"} 250'
+        ) in hook.render()
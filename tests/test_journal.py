@@ -0,0 +1,236 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from etsy_python.v3.common.Journal import DONE, FAILED, PENDING, RequestJournal
+from etsy_python.v3.enums.Listing import WhenMade, WhoMade
+from etsy_python.v3.exceptions.RequestException import RequestException
+from etsy_python.v3.models.FileRequest import FileRequest
+from etsy_python.v3.models.Listing import (
+    CreateDraftListingRequest,
+    UpdateListingRequest,
+)
+from etsy_python.v3.resources.Listing import ListingResource
+from etsy_python.v3.resources.Response import Response
+from etsy_python.v3.resources.enums.Request import Method
+
+from tests.conftest import MOCK_LISTING_ID, MOCK_SHOP_ID
+
+
+def _response(status_code=200, json_data=None):
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.headers = {}
+    resp.json.return_value = json_data if json_data is not None else {"listing_id": 1}
+    return resp
+
+
+def _update(client, listing_id, title="Mug"):
+    return ListingResource(session=client).update_listing(
+        MOCK_SHOP_ID, listing_id, UpdateListingRequest(title=title)
+    )
+
+
+@pytest.fixture
+def journaled(real_etsy_client, tmp_path):
+    path = tmp_path / "writes.journal"
+    real_etsy_client.journal = RequestJournal(path, fsync=False)
+    real_etsy_client._mock_http_session.patch.return_value = _response()
+    yield real_etsy_client, path
+    real_etsy_client.journal.close()
+
+
+def _records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestRequestJournal:
+    def test_pending_then_done(self, journaled):
+        client, path = journaled
+
+        _update(client, 1)
+
+        pending, done = _records(path)
+        assert pending["s"] == PENDING and done["s"] == DONE
+        assert pending["k"] == done["k"]
+        assert pending["m"] == "PATCH"
+        assert pending["u"] == f"/shops/{MOCK_SHOP_ID}/listings/1"
+        assert pending["b"] == {"title": "Mug"}
+        assert done["c"] == 200 and done["r"] == {"listing_id": 1}
+
+    def test_reads_not_journaled(self, journaled):
+        client, path = journaled
+        client._mock_http_session.get.return_value = _response()
+
+        ListingResource(session=client).get_listing(MOCK_LISTING_ID)
+
+        assert path.read_text() == ""
+
+    def test_repeated_calls_all_sent(self, journaled):
+        client, _ = journaled
+        patch = client._mock_http_session.patch
+        patch.side_effect = [
+            _response(json_data={"state": state})
+            for state in ("inactive", "active", "inactive")
+        ]
+        resource = ListingResource(session=client)
+
+        results = [
+            resource.update_listing(
+                MOCK_SHOP_ID, 1, UpdateListingRequest(state=state)
+            )
+            for state in ("inactive", "active", "inactive")
+        ]
+
+        assert patch.call_count == 3
+        assert results[-1].message == {"state": "inactive"}
+        assert len({e.key for e in client.journal.entries()}) == 3
+
+    def test_identical_creates_both_sent(self, journaled):
+        client, _ = journaled
+        post = client._mock_http_session.post
+        post.side_effect = [
+            _response(201, {"listing_id": 1}),
+            _response(201, {"listing_id": 2}),
+        ]
+
+        listing = CreateDraftListingRequest(
+            quantity=10,
+            title="Mug",
+            description="A mug",
+            price=25.00,
+            who_made=WhoMade.I_DID,
+            when_made=WhenMade.TWENTY_TWENTIES,
+            taxonomy_id=30303,
+        )
+        resource = ListingResource(session=client)
+
+        first = resource.create_draft_listing(MOCK_SHOP_ID, listing)
+        second = resource.create_draft_listing(MOCK_SHOP_ID, listing)
+
+        assert post.call_count == 2
+        assert (first.message, second.message) == ({"listing_id": 1}, {"listing_id": 2})
+
+    def test_resumed_run_skips_completed_calls(self, journaled):
+        client, path = journaled
+        patch = client._mock_http_session.patch
+        patch.side_effect = [
+            _response(),
+            _response(),
+            requests.ConnectionError("reset"),
+        ]
+        _update(client, 1)
+        _update(client, 1)
+        with pytest.raises(requests.ConnectionError):
+            _update(client, 1)
+        run_id = client.journal.run_id
+        client.journal.close()
+        client.journal = RequestJournal(path, run_id=run_id, fsync=False)
+        patch.side_effect = None
+        patch.return_value = _response(json_data={"listing_id": 9})
+
+        results = [_update(client, 1) for _ in range(4)]
+
+        # The first two were done; the crashed third and a new fourth are sent.
+        assert patch.call_count == 5
+        assert [r.message for r in results] == [
+            {"listing_id": 1},
+            {"listing_id": 1},
+            {"listing_id": 9},
+            {"listing_id": 9},
+        ]
+        assert client.journal.pending() == []
+
+    def test_new_run_skips_nothing(self, journaled):
+        client, path = journaled
+        _update(client, 1)
+        client.journal.close()
+        client.journal = RequestJournal(path, fsync=False)
+
+        _update(client, 1)
+
+        assert client._mock_http_session.patch.call_count == 2
+
+    def test_crash_leaves_pending_and_replay_finishes_it(self, journaled):
+        client, path = journaled
+        client._mock_http_session.patch.side_effect = [
+            _response(),
+            requests.ConnectionError("reset"),
+        ]
+        _update(client, 1)
+        with pytest.raises(requests.ConnectionError):
+            _update(client, 2)
+        client.journal.close()
+
+        # A new process: only listing 2 is unfinished.
+        client.journal = RequestJournal(path, fsync=False)
+        assert [e.uri_path for e in client.journal.pending()] == [
+            f"/shops/{MOCK_SHOP_ID}/listings/2"
+        ]
+        client._mock_http_session.patch.side_effect = None
+
+        replayed = client.journal.replay(client)
+
+        assert [e.state for e in replayed] == [DONE] and replayed[0].error is None
+        assert client._mock_http_session.patch.call_args.kwargs["json"] == {"title": "Mug"}
+        assert client.journal.pending() == []
+        assert client.journal.replay(client) == []
+
+    def test_rejected_calls_marked_failed(self, journaled):
+        client, path = journaled
+        client._mock_http_session.patch.return_value = _response(
+            400, {"error": "bad listing"}
+        )
+
+        with pytest.raises(RequestException):
+            _update(client, 1)
+
+        assert _records(path)[-1] == {"k": _records(path)[0]["k"], "s": FAILED, "c": 400}
+        assert client.journal.pending() == []
+
+    def test_server_errors_stay_pending(self, journaled):
+        client, _ = journaled
+        client._mock_http_session.patch.return_value = _response(503, {"error": "down"})
+
+        with pytest.raises(RequestException):
+            _update(client, 1)
+
+        assert len(client.journal.pending()) == 1
+
+    def test_file_uploads_not_journaled(self, journaled):
+        client, path = journaled
+        client._mock_http_session.post.return_value = _response(201)
+        payload = MagicMock(spec=FileRequest)
+        payload.file = {"image": b"x"}
+        payload.data = {}
+
+        client.make_request(
+            f"/shops/{MOCK_SHOP_ID}/listings/1/images", method=Method.POST, payload=payload
+        )
+
+        assert path.read_text() == ""
+
+    def test_torn_line_and_compact(self, journaled):
+        client, path = journaled
+        _update(client, 1)
+        _update(client, 1, title="Big Mug")
+        client.journal.close()
+        with open(path, "a") as f:
+            f.write('{"k":"abc","s":"pen')
+
+        client.journal = RequestJournal(path, fsync=False)
+        assert [e.state for e in client.journal.entries()] == [DONE, DONE]
+        _update(client, 3)
+        client.journal.compact()
+        client.journal.close()
+
+        client.journal = RequestJournal(path, fsync=False)
+        assert [(e.state, e.body) for e in client.journal.entries()] == [
+            (DONE, {"title": "Mug"}),
+            (DONE, {"title": "Big Mug"}),
+            (DONE, {"title": "Mug"}),
+        ]
+        assert len(_records(path)) == 6
+
@@ -0,0 +1,90 @@
+import subprocess
+import sys
+
+import pytest
+
+import etsy_python.v3.bulk as bulk
+import etsy_python.v3.models as models
+import etsy_python.v3.resources as resources
+
+
+def _loaded_after(statement, *modules):
+    """Which of ``modules`` a fresh interpreter has loaded after ``statement``."""
+    probe = f"{statement}\nimport sys\nprint(','.join(m for m in {modules!r} if m in sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+    ).stdout.strip()
+    return set(filter(None, output.split(",")))
+
+
+class TestLazyPackages:
+    def test_single_resource_does_not_load_others(self):
+        loaded = _loaded_after(
+            "from etsy_python.v3.resources import ListingResource",
+            "etsy_python.v3.resources.Listing",
+            "etsy_python.v3.resources.Receipt",
+            "etsy_python.v3.resources.ShippingProfile",
+            "requests_oauthlib",
+        )
+        assert loaded == {"etsy_python.v3.resources.Listing"}
+
+    def test_client_dependencies_deferred(self):
+        loaded = _loaded_after(
+            "import etsy_python.v3.resources.Listing",
+            "requests",
+            "urllib3",
+            "etsy_python.v3.common.Hooks",
+            "etsy_python.v3.common.Operations",
+            "etsy_python.v3.common.OperationTable",
+            "etsy_python.v3.common.Quota",
+            "etsy_python.v3.common.Timing",
+            "etsy_python.v3.common.Tracing",
+        )
+        assert loaded == set()
+
+    def test_models_package_is_lazy(self):
+        loaded = _loaded_after(
+            "import etsy_python.v3.models",
+            "etsy_python.v3.models.Listing",
+            "etsy_python.v3.models.ShippingProfile",
+        )
+        assert loaded == set()
+
+    def test_bulk_helpers_load_on_first_use(self):
+        loaded = _loaded_after(
+            "import etsy_python.v3.bulk.Update",
+            "etsy_python.v3.bulk.Mirror",
+            "etsy_python.v3.bulk.Publish",
+            "sqlite3",
+        )
+        assert loaded == set()
+
+    def test_oauth_dependency_deferred(self):
+        assert _loaded_after(
+            "from etsy_python.v3.auth import EtsyOAuth", "requests_oauthlib"
+        ) == set()
+
+    def test_opt_in_features_not_imported_by_client(self):
+        loaded = _loaded_after(
+            "from etsy_python.v3.resources.Session import EtsyClient",
+            "etsy_python.v3.common.Hedging",
+            "etsy_python.v3.common.CircuitBreaker",
+            "etsy_python.v3.common.Scheduler",
+            "etsy_python.v3.common.Transport",
+            "etsy_python.v3.common.Cassette",
+            "etsy_python.v3.common.Validation",
+            "etsy_python.v3.common.Journal",
+            "httpx",
+            "sqlite3",
+        )
+        assert loaded == set()
+
+    @pytest.mark.parametrize("package", [resources, models, bulk])
+    def test_every_exported_name_resolves(self, package):
+        for name in package.__all__:
+            assert getattr(package, name).__name__ == name
+        assert set(package.__all__) <= set(dir(package))
+
+    def test_unknown_name(self):
+        with pytest.raises(AttributeError):
+            resources.NotAResource
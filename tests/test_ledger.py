@@ -0,0 +1,101 @@
+import threading
+
+import pytest
+
+from etsy_python.v3.bulk.Ledger import LedgerPaymentResolver
+from etsy_python.v3.exceptions.RequestException import RequestException
+from etsy_python.v3.resources.Response import Response
+
+from tests.conftest import MOCK_SHOP_ID
+
+ENTRIES = 250
+
+
+def _entry(entry_id):
+    # Every third entry is a fee with no payment behind it.
+    if entry_id % 3 == 0:
+        return {"entry_id": entry_id, "reference_type": "fee", "reference_id": None}
+    if entry_id % 3 == 1:
+        reference_type, reference_id = "receipt", entry_id + 500
+    else:
+        reference_type, reference_id = "payment", entry_id + 900
+    return {
+        "entry_id": entry_id,
+        "reference_type": reference_type,
+        "reference_id": str(reference_id),
+    }
+
+
+def _payment(entry_id):
+    if entry_id % 3 == 1:
+        return {"payment_id": 1, "receipt_id": entry_id + 500}
+    return {"payment_id": entry_id + 900, "receipt_id": 2}
+
+
+@pytest.fixture
+def routed(mock_session):
+    calls = []
+    lock = threading.Lock()
+
+    def make_request(path, method=None, payload=None, query_params=None):
+        with lock:
+            calls.append((path, query_params))
+        if path.endswith("/ledger-entries"):
+            offset, limit = query_params["offset"], query_params["limit"]
+            ids = range(offset + 1, min(offset + limit, ENTRIES) + 1)
+            return Response(200, {"count": ENTRIES, "results": [_entry(i) for i in ids]})
+        ids = [int(i) for i in query_params["ledger_entry_ids"].split(",")]
+        if 201 in ids:
+            raise RequestException(503, "unavailable")
+        found = [_payment(i) for i in ids if i % 3]
+        return Response(200, {"count": len(found), "results": found})
+
+    mock_session.make_request.side_effect = make_request
+    return calls
+
+
+def _batches(calls):
+    return [
+        [int(i) for i in q["ledger_entry_ids"].split(",")]
+        for path, q in calls
+        if path.endswith("/payments")
+    ]
+
+
+class TestLedgerPaymentResolver:
+    def test_streams_and_joins_in_order(self, mock_session, routed):
+        resolver = LedgerPaymentResolver(mock_session, MOCK_SHOP_ID, max_workers=2)
+
+        joined = list(resolver.iterate(1_700_000_000, 1_702_000_000))
+
+        assert [record.entry["entry_id"] for record in joined] == list(range(1, ENTRIES + 1))
+        for record in joined[:200]:
+            entry_id = record.entry["entry_id"]
+            expected = _payment(entry_id) if entry_id % 3 else None
+            assert record.payment == expected and record.error is None
+
+    def test_batches_to_api_maximum(self, mock_session, routed):
+        list(LedgerPaymentResolver(mock_session, MOCK_SHOP_ID).iterate(1, 2))
+
+        batches = sorted(_batches(routed))
+        assert [len(batch) for batch in batches] == [100, 100, 50]
+        assert batches[0] == list(range(1, 101))
+
+    def test_failed_batch_marks_its_entries(self, mock_session, routed):
+        joined = list(LedgerPaymentResolver(mock_session, MOCK_SHOP_ID).iterate(1, 2))
+
+        failed = [record for record in joined if record.error is not None]
+        assert [record.entry["entry_id"] for record in failed] == list(range(201, 251))
+        assert all(record.payment is None for record in failed)
+
+    def test_resolve_any_iterable(self, mock_session, routed):
+        resolver = LedgerPaymentResolver(mock_session, MOCK_SHOP_ID, batch_size=2)
+
+        joined = list(resolver.resolve(_entry(i) for i in (1, 2, 2)))
+
+        assert _batches(routed) == [[1, 2], [2]]
+        assert [record.payment for record in joined] == [_payment(1), _payment(2), _payment(2)]
+
+    def test_batch_size_bounds(self, mock_session):
+        with pytest.raises(ValueError):
+            LedgerPaymentResolver(mock_session, MOCK_SHOP_ID, batch_size=0)
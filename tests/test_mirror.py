@@ -0,0 +1,216 @@
+from etsy_python.v3.bulk.Mirror import ShopMirror
+from etsy_python.v3.enums.Listing import State
+from etsy_python.v3.resources.Response import Response
+
+from tests.conftest import MOCK_SHOP_ID
+
+
+def _listing(listing_id, updated, state="active", products=()):
+    return {
+        "listing_id": listing_id,
+        "state": state,
+        "title": f"Listing {listing_id}",
+        "quantity": 5,
+        "price": {"amount": 1500, "divisor": 100, "currency_code": "USD"},
+        "created_timestamp": 1609459200,
+        "updated_timestamp": updated,
+        "inventory": {
+            "products": [
+                {
+                    "product_id": product_id,
+                    "sku": sku,
+                    "is_deleted": False,
+                    "offerings": [
+                        {
+                            "quantity": 3,
+                            "price": {"amount": 1500, "divisor": 100},
+                        }
+                    ],
+                }
+                for product_id, sku in products
+            ]
+        },
+    }
+
+
+def _receipt(receipt_id, created, updated, transactions=()):
+    return {
+        "receipt_id": receipt_id,
+        "buyer_user_id": 1,
+        "status": "paid",
+        "is_paid": True,
+        "is_shipped": False,
+        "grandtotal": {"amount": 3000, "divisor": 100, "currency_code": "USD"},
+        "created_timestamp": created,
+        "updated_timestamp": updated,
+        "transactions": [
+            {
+                "transaction_id": transaction_id,
+                "receipt_id": receipt_id,
+                "listing_id": listing_id,
+                "product_id": None,
+                "sku": None,
+                "quantity": 2,
+                "price": {"amount": 1500, "divisor": 100},
+                "created_timestamp": created,
+            }
+            for transaction_id, listing_id in transactions
+        ],
+    }
+
+
+def _route(listings, receipts):
+    """make_request side effect serving canned listings/receipts by endpoint."""
+
+    def make_request(endpoint, query_params=None, **_):
+        if endpoint.endswith("/listings"):
+            rows = listings.get(query_params["state"], [])
+        else:
+            since = query_params.get("min_last_modified") or 0
+            rows = sorted(
+                (r for r in receipts if r["updated_timestamp"] >= since),
+                key=lambda r: r["updated_timestamp"],
+            )
+        start = query_params["offset"]
+        page = rows[start : start + query_params["limit"]]
+        return Response(200, {"count": len(rows), "results": page})
+
+    return make_request
+
+
+class TestInitialSync:
+    def test_loads_all_tables(self, mock_session):
+        mock_session.make_request.side_effect = _route(
+            {"active": [_listing(1, 200, products=[(10, "SKU-A")])]},
+            [_receipt(7, 100, 150, transactions=[(70, 1), (71, 1)])],
+        )
+        mirror = ShopMirror(mock_session, MOCK_SHOP_ID, listing_states=[State.ACTIVE])
+
+        counts = mirror.sync()
+
+        assert counts == {"listings": 1, "inventory": 1, "receipts": 1, "transactions": 2}
+        assert mirror.get_listing(1)["title"] == "Listing 1"
+        assert mirror.find_products_by_sku("SKU-A")[0]["listing_id"] == 1
+        assert len(mirror.get_transactions(receipt_id=7)) == 2
+
+    def test_inventory_requested_inline(self, mock_session):
+        mock_session.make_request.side_effect = _route({}, [])
+        mirror = ShopMirror(mock_session, MOCK_SHOP_ID, listing_states=[State.ACTIVE])
+
+        mirror.sync()
+
+        qp = mock_session.make_request.call_args_list[0][1]["query_params"]
+        assert qp["includes"] == "Inventory"
+        assert qp["sort_on"] == "updated"
+
+    def test_paginates(self, mock_session):
+        listings = [_listing(i, 1000 - i) for i in range(1, 6)]
+        mock_session.make_request.side_effect = _route({"active": listings}, [])
+        mirror = ShopMirror(
+            mock_session, MOCK_SHOP_ID, listing_states=[State.ACTIVE], page_limit=2
+        )
+
+        mirror.sync_listings()
+
+        assert len(mirror.get_listings()) == 5
+
+
+class TestIncrementalSync:
+    def test_receipts_use_watermark(self, mock_session):
+        mock_session.make_request.side_effect = _route({}, [_receipt(7, 100, 1700000000)])
+        mirror = ShopMirror(mock_session, MOCK_SHOP_ID, listing_states=[])
+        mirror.sync_receipts()
+        mock_session.make_request.reset_mock()
+
+        mirror.sync_receipts()
+
+        qp = mock_session.make_request.call_args[1]["query_params"]
+        assert qp["min_last_modified"] == 1700000000
+
+    def test_receipt_updated_mid_sync_not_skipped(self, mock_session):
+        receipts = [_receipt(i, 100, 100 + i) for i in range(1, 6)]
+        route = _route({}, receipts)
+
+        def make_request(endpoint, query_params=None, **kwargs):
+            response = route(endpoint, query_params=query_params, **kwargs)
+            if mock_session.make_request.call_count == 1:
+                receipts[0]["updated_timestamp"] = 999  # moves to the tail
+            return response
+
+        mock_session.make_request.side_effect = make_request
+        mirror = ShopMirror(mock_session, MOCK_SHOP_ID, listing_states=[], page_limit=2)
+
+        mirror.sync_receipts()
+
+        assert [r["receipt_id"] for r in mirror.get_receipts()] == [1, 2, 3, 4, 5]
+        assert mirror.get_watermark("receipts") == 999
+
+    def test_receipt_ties_span_pages(self, mock_session):
+        mock_session.make_request.side_effect = _route(
+            {}, [_receipt(i, 100, 500) for i in range(1, 6)]
+        )
+        mirror = ShopMirror(mock_session, MOCK_SHOP_ID, listing_states=[], page_limit=2)
+
+        receipts, _ = mirror.sync_receipts()
+
+        assert receipts == 5 and len(mirror.get_receipts()) == 5
+
+    def test_full_sync_drops_deleted_listings(self, mock_session):
+        listings = {"active": [_listing(1, 500, products=[(10, "A")]), _listing(2, 400)]}
+        mock_session.make_request.side_effect = _route(listings, [])
+        mirror = ShopMirror(mock_session, MOCK_SHOP_ID, listing_states=[State.ACTIVE])
+        mirror.sync_listings()
+
+        listings["active"] = [_listing(2, 400)]
+        mirror.sync_listings()
+        assert mirror.get_listing(1) is not None
+        mirror.sync_listings(full=True)
+
+        assert [l["listing_id"] for l in mirror.get_listings()] == [2]
+        assert mirror.get_inventory(1) == []
+
+    def test_listings_stop_at_watermark(self, mock_session):
+        listings = {"active": [_listing(1, 500)]}
+        mock_session.make_request.side_effect = _route(listings, [])
+        mirror = ShopMirror(mock_session, MOCK_SHOP_ID, listing_states=[State.ACTIVE])
+        mirror.sync_listings()
+
+        listings["active"] = [_listing(2, 600), _listing(1, 500), _listing(3, 400)]
+        written, _ = mirror.sync_listings()
+
+        assert written == 2
+        assert mirror.get_listing(3) is None
+        assert mirror.get_watermark("listings") == 600
+
+    def test_inventory_replaced_on_update(self, mock_session):
+        listings = {"active": [_listing(1, 500, products=[(10, "OLD")])]}
+        mock_session.make_request.side_effect = _route(listings, [])
+        mirror = ShopMirror(mock_session, MOCK_SHOP_ID, listing_states=[State.ACTIVE])
+        mirror.sync_listings()
+
+        listings["active"] = [_listing(1, 600, products=[(11, "NEW")])]
+        mirror.sync_listings()
+
+        assert [p["sku"] for p in mirror.get_inventory(1)] == ["NEW"]
+
+
+class TestQueries:
+    def test_sales_by_listing(self, mock_session):
+        mock_session.make_request.side_effect = _route(
+            {}, [_receipt(7, 100, 150, transactions=[(70, 1), (71, 2), (72, 1)])]
+        )
+        mirror = ShopMirror(mock_session, MOCK_SHOP_ID, listing_states=[])
+        mirror.sync()
+
+        sales = mirror.get_sales_by_listing()
+
+        assert sales[0] == {"listing_id": 1, "quantity": 4, "revenue": 60.0}
+
+    def test_receipts_filtered_by_created(self, mock_session):
+        mock_session.make_request.side_effect = _route(
+            {}, [_receipt(1, 100, 100), _receipt(2, 200, 200)]
+        )
+        mirror = ShopMirror(mock_session, MOCK_SHOP_ID, listing_states=[])
+        mirror.sync()
+
+        assert [r["receipt_id"] for r in mirror.get_receipts(min_created=150)] == [2]
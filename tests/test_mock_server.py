@@ -0,0 +1,194 @@
+"""Tests for the spec-driven mock server in ``scripts/mock_server.py``."""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import requests
+
+# scripts/ is not a package; put it on the path so we can import the server.
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import mock_server  # noqa: E402
+
+from etsy_python.v3.common.Hooks import RequestHook  # noqa: E402
+from etsy_python.v3.exceptions.RequestException import RequestException  # noqa: E402
+from etsy_python.v3.resources.Listing import ListingResource  # noqa: E402
+from etsy_python.v3.resources.Session import EtsyClient  # noqa: E402
+
+from tests.conftest import MOCK_ACCESS_TOKEN, MOCK_KEYSTRING, MOCK_REFRESH_TOKEN  # noqa: E402
+
+SPEC = mock_server.load_json(mock_server.DEFAULT_SPEC)
+_TYPES = {
+    "integer": int,
+    "number": (int, float),
+    "string": str,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+
+def _conforms(sampler, schema, value):
+    schema, _ = sampler.resolve(schema)
+    for combinator in ("oneOf", "anyOf"):
+        if schema.get(combinator):
+            return any(_conforms(sampler, option, value) for option in schema[combinator])
+    if value is None:
+        return schema.get("nullable", False) or "type" not in schema
+    expected = _TYPES.get(schema.get("type"))
+    if expected is not None and not isinstance(value, expected):
+        return False
+    if "enum" in schema and value not in schema["enum"]:
+        return False
+    if "minimum" in schema and isinstance(value, (int, float)) and value < schema["minimum"]:
+        return False
+    if isinstance(value, dict):
+        props = schema.get("properties", {})
+        return all(_conforms(sampler, props[k], v) for k, v in value.items() if k in props)
+    if isinstance(value, list):
+        return all(_conforms(sampler, schema.get("items", {}), v) for v in value)
+    return True
+
+
+def _client(server):
+    with patch("etsy_python.v3.resources.Session.environment") as env:
+        env.request_url = server.request_url
+        env.token_url = server.token_url
+        yield EtsyClient(
+            MOCK_KEYSTRING, MOCK_ACCESS_TOKEN, MOCK_REFRESH_TOKEN, expiry=datetime(2999, 1, 1)
+        )
+
+
+@pytest.fixture
+def server():
+    with mock_server.MockEtsyServer(limit_per_second=1000) as running:
+        yield running
+
+
+@pytest.fixture
+def client(server):
+    yield from _client(server)
+
+
+class TestSchemaSampler:
+    def test_every_operation_body_conforms_to_schema(self):
+        state = mock_server.MockEtsyState(SPEC)
+        operations = [op for ops in state.operations.values() for op in ops]
+        assert len(operations) > 100
+        for operation in operations:
+            if operation.schema is None:
+                continue
+            body = state.sampler.sample(operation.schema)
+            assert _conforms(state.sampler, operation.schema, body), operation.operation_id
+
+    def test_recursive_schema_terminates(self):
+        state = mock_server.MockEtsyState(SPEC)
+        operation, _ = state.match("GET", "/v3/application/seller-taxonomy/nodes")
+        body = state.body_for(operation, {})
+        assert body["results"][0]["children"] == []
+
+    def test_literal_path_preferred_over_placeholder(self):
+        state = mock_server.MockEtsyState(SPEC)
+        operation, _ = state.match("GET", "/v3/application/listings/batch")
+        assert operation.operation_id == "getListingsByListingIds"
+
+    def test_path_ids_echoed(self):
+        state = mock_server.MockEtsyState(SPEC)
+        operation, values = state.match("GET", "/v3/application/listings/42")
+        assert state.body_for(operation, values)["listing_id"] == 42
+
+
+class TestServer:
+    def test_client_round_trip(self, client, server):
+        response = ListingResource(session=client).get_listing(42)
+
+        assert response.code == 200
+        assert response.message["listing_id"] == 42
+        assert response.rate_limits.limit_per_day == "10000"
+        assert server.state.calls["getListing"] == 1
+
+    def test_collection_count_matches_results(self, server):
+        body = requests.get(f"{server.request_url}/shops/1/receipts").json()
+        assert body["count"] == len(body["results"]) == 1
+
+    def test_unknown_route_404(self, server):
+        assert requests.get(f"{server.url}/nope").status_code == 404
+
+    def test_token_refresh(self, client):
+        access_token, refresh_token, _ = client.update_token()
+        assert access_token == "12345678.mock-access-token"
+
+    def test_rate_limit_headers_count_down(self, server):
+        first = requests.get(f"{server.request_url}/openapi-ping")
+        second = requests.get(f"{server.request_url}/openapi-ping")
+        assert int(second.headers["X-Remaining-Today"]) == (
+            int(first.headers["X-Remaining-Today"]) - 1
+        )
+
+
+class TestCompression:
+    def test_large_bodies_gzipped_when_accepted(self, server):
+        response = requests.get(f"{server.request_url}/shops/1/receipts")
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.raw.tell() < len(response.content)
+
+    def test_identity_when_not_accepted(self, server):
+        response = requests.get(
+            f"{server.request_url}/shops/1/receipts", headers={"Accept-Encoding": "identity"}
+        )
+        assert "Content-Encoding" not in response.headers
+
+    def test_small_bodies_not_compressed(self, server):
+        assert "Content-Encoding" not in requests.get(f"{server.request_url}/users/me").headers
+
+    def test_client_records_wire_and_decoded_sizes(self, server):
+        events = []
+        hook = RequestHook()
+        hook.after_response = events.append
+        with patch("etsy_python.v3.resources.Session.environment") as env:
+            env.request_url = server.request_url
+            client = EtsyClient(
+                MOCK_KEYSTRING,
+                MOCK_ACCESS_TOKEN,
+                MOCK_REFRESH_TOKEN,
+                expiry=datetime(2999, 1, 1),
+                hooks=[hook],
+            )
+            client.make_request("/shops/1/receipts")
+            client.make_request("/users/me")
+
+        receipts, me = events
+        assert receipts.content_encoding == "gzip"
+        assert 0 < receipts.wire_bytes_received < receipts.bytes_received
+        assert me.content_encoding is None
+        assert me.wire_bytes_received == me.bytes_received
+
+
+class TestInjection:
+    def test_per_second_limit_returns_429(self):
+        with mock_server.MockEtsyServer(limit_per_second=1) as server:
+            requests.get(f"{server.request_url}/openapi-ping")
+            response = requests.get(f"{server.request_url}/openapi-ping")
+        assert response.status_code == 429
+        assert response.headers["X-Remaining-This-Second"] == "0"
+
+    def test_error_injection_raises(self):
+        with mock_server.MockEtsyServer(
+            operation_error_rates={"getListing": 1.0}, error_statuses=[503]
+        ) as server:
+            for client in _client(server):
+                with pytest.raises(RequestException) as exc:
+                    ListingResource(session=client).get_listing(1)
+        assert exc.value.code == 503
+
+    def test_latency(self):
+        with mock_server.MockEtsyServer(latency=0.05) as server:
+            response = requests.get(f"{server.request_url}/openapi-ping")
+        assert response.elapsed.total_seconds() >= 0.05
+        assert json.loads(response.content)
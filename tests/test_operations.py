@@ -0,0 +1,97 @@
+"""Tests for the operation registry generated from the OAS spec."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from etsy_python.v3.common.OperationTable import OPERATION_TABLE
+from etsy_python.v3.common.Operations import REGISTRY, Operation, OperationRegistry
+
+# scripts/ is not a package; put it on the path so we can import the generator.
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import generate_operations  # noqa: E402
+
+
+def test_table_matches_baseline_spec():
+    spec = generate_operations.load_json(generate_operations.DEFAULT_SPEC)
+    assert generate_operations.DEFAULT_OUTPUT.read_text(
+        encoding="utf-8"
+    ) == generate_operations.render(spec), "run scripts/generate_operations.py"
+    assert len(REGISTRY) == len(OPERATION_TABLE) > 100
+
+
+class TestOperation:
+    def test_lookup(self):
+        operation = REGISTRY["getShopReceipts"]
+        assert operation.method == "GET"
+        assert operation.path == "/shops/{shop_id}/receipts"
+        assert operation.path_params == ("shop_id",)
+        assert "was_paid" in operation.query_params
+        assert "getShopReceipts" in REGISTRY
+        assert REGISTRY.get("nope") is None
+
+    @pytest.mark.parametrize(
+        "operation_id, idempotent",
+        [
+            ("getListing", True),
+            ("updateShop", True),
+            ("deleteListing", True),
+            ("createDraftListing", False),
+            ("updateListing", False),
+        ],
+    )
+    def test_idempotent(self, operation_id, idempotent):
+        assert REGISTRY[operation_id].idempotent is idempotent
+
+    def test_format_path(self):
+        operation = REGISTRY["updateListing"]
+        assert operation.format_path(5, 7) == "/shops/5/listings/7"
+        assert operation.format_path(shop_id=5, listing_id=7) == "/shops/5/listings/7"
+        assert operation.format_path(5, listing_id=7) == "/shops/5/listings/7"
+
+    def test_format_path_arity(self):
+        operation = REGISTRY["updateListing"]
+        with pytest.raises(TypeError):
+            operation.format_path(5)
+        with pytest.raises(TypeError):
+            operation.format_path(shop_id=5)
+
+    def test_query_rejects_unknown_params(self):
+        operation = REGISTRY["getListingsByShop"]
+        assert operation.query(limit=10, state="active") == {"limit": 10, "state": "active"}
+        with pytest.raises(TypeError, match="legacy"):
+            operation.query(legacy=True)
+
+
+class TestResolve:
+    @pytest.mark.parametrize(
+        "method, path, operation_id",
+        [
+            ("GET", "/listings/42", "getListing"),
+            ("GET", "/listings/batch", "getListingsByListingIds"),
+            ("GET", "/listings/active", "findAllListingsActive"),
+            ("GET", "/users/me", "getMe"),
+            ("GET", "/users/9", "getUser"),
+            ("PATCH", "/shops/1/listings/2", "updateListing"),
+            ("PUT", "/shops/1/listings/2/translations/de", "updateListingTranslation"),
+        ],
+    )
+    def test_resolves_concrete_paths(self, method, path, operation_id):
+        assert REGISTRY.resolve(method, path).operation_id == operation_id
+
+    def test_unknown(self):
+        assert REGISTRY.resolve("GET", "/nope/1") is None
+        assert REGISTRY.resolve("POST", "/listings/1") is None
+
+    def test_every_operation_round_trips(self):
+        for operation in REGISTRY:
+            path = operation.format_path(*range(1, len(operation.path_params) + 1))
+            assert REGISTRY.resolve(operation.method, path) is operation, operation.operation_id
+
+    def test_custom_registry(self):
+        registry = OperationRegistry([Operation("getThing", "GET", "/things/{thing_id}", ("thing_id",))])
+        assert registry.resolve("GET", "/things/3").operation_id == "getThing"
@@ -0,0 +1,114 @@
+import threading
+
+import pytest
+
+from etsy_python.v3.bulk.Orders import OrderHydrator
+from etsy_python.v3.exceptions.RequestException import RequestException
+from etsy_python.v3.resources.Response import Response
+
+from tests.conftest import MOCK_SHOP_ID
+
+
+def _receipt(receipt_id, embedded=True):
+    receipt = {"receipt_id": receipt_id}
+    if embedded:
+        receipt["transactions"] = [{"transaction_id": receipt_id * 10}]
+    return receipt
+
+
+def _payment(receipt_id):
+    return {"payment_id": receipt_id + 1000, "receipt_id": receipt_id}
+
+
+@pytest.fixture
+def routed(mock_session):
+    calls = []
+    lock = threading.Lock()
+
+    def make_request(path, method=None, payload=None, query_params=None):
+        with lock:
+            calls.append((path, query_params))
+        parts = path.split("/")
+        if path.endswith("/payments") and "receipts" in parts:
+            receipt_id = int(parts[-2])
+            if receipt_id == 13:
+                raise RequestException(500, "boom")
+            return Response(200, {"count": 1, "results": [_payment(receipt_id)]})
+        if path.endswith("/transactions"):
+            receipt_id = int(parts[-2])
+            return Response(200, {"count": 1, "results": [{"transaction_id": receipt_id}]})
+        if path.endswith("/payments"):
+            ids = [int(i) for i in query_params["payment_ids"].split(",")]
+            # Payment 1007 is stale and no longer returned.
+            found = [_payment(i - 1000) for i in ids if i != 1007]
+            return Response(200, {"count": len(found), "results": found})
+        if path.endswith("/receipts"):
+            offset = query_params["offset"]
+            results = [_receipt(i) for i in range(offset + 1, min(offset + 100, 150) + 1)]
+            return Response(200, {"count": 150, "results": results})
+        raise AssertionError(path)
+
+    mock_session.make_request.side_effect = make_request
+    return calls
+
+
+def _paths(calls, suffix):
+    return [path for path, _ in calls if path.endswith(suffix)]
+
+
+class TestOrderHydrator:
+    def test_embedded_transactions_reused(self, mock_session, routed):
+        orders = OrderHydrator(mock_session, MOCK_SHOP_ID).hydrate(
+            [_receipt(1), _receipt(2, embedded=False)]
+        )
+
+        assert orders[0].transactions == [{"transaction_id": 10}]
+        assert orders[1].transactions == [{"transaction_id": 2}]
+        assert _paths(routed, "/transactions") == [
+            f"/shops/{MOCK_SHOP_ID}/receipts/2/transactions"
+        ]
+
+    def test_known_payment_ids_batched(self, mock_session, routed):
+        receipts = [_receipt(i) for i in range(1, 251)]
+        payment_ids = {i: i + 1000 for i in range(1, 251)}
+
+        orders = OrderHydrator(mock_session, MOCK_SHOP_ID).hydrate(receipts, payment_ids)
+
+        batches = [q["payment_ids"].count(",") + 1 for _, q in routed if q]
+        assert sorted(batches) == [50, 100, 100]
+        assert all(order.payments == [_payment(order.receipt_id)] for order in orders)
+        # Only the stale payment ID needs a per-receipt lookup.
+        assert _paths(routed, "/receipts/7/payments") and len(routed) == 4
+
+    def test_missing_payments_fan_out_per_receipt(self, mock_session, routed):
+        receipts = [_receipt(i) for i in (5, 6, 7)]
+
+        orders = OrderHydrator(mock_session, MOCK_SHOP_ID).hydrate(
+            receipts, payment_ids={6: 1006, 7: 1007}
+        )
+
+        assert sorted(_paths(routed, "/payments")) == [
+            f"/shops/{MOCK_SHOP_ID}/payments",
+            f"/shops/{MOCK_SHOP_ID}/receipts/5/payments",
+            f"/shops/{MOCK_SHOP_ID}/receipts/7/payments",
+        ]
+        assert [order.payments for order in orders] == [[_payment(i)] for i in (5, 6, 7)]
+
+    def test_errors_kept_per_order(self, mock_session, routed):
+        orders = OrderHydrator(mock_session, MOCK_SHOP_ID).hydrate(
+            [_receipt(12), _receipt(13)]
+        )
+        assert orders[0].error is None
+        assert isinstance(orders[1].error, RequestException)
+        assert orders[1].transactions == [{"transaction_id": 130}]
+
+    def test_iterate_orders_pages_receipts(self, mock_session, routed):
+        orders = list(OrderHydrator(mock_session, MOCK_SHOP_ID).iterate_orders())
+
+        assert [order.receipt_id for order in orders] == list(range(1, 151))
+        assert len(_paths(routed, "/receipts")) == 2
+        assert not _paths(routed, "/transactions")
+
+    def test_batch_size_bounds(self, mock_session):
+        with pytest.raises(ValueError):
+            OrderHydrator(mock_session, MOCK_SHOP_ID, batch_size=101)
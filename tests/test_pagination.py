@@ -0,0 +1,37 @@
+from unittest.mock import MagicMock
+
+from etsy_python.v3.common.Pagination import iterate_pages, iterate_results
+from etsy_python.v3.resources.Response import Response
+
+
+def _pager(total):
+    def fetch(*_, limit, offset, **__):
+        rows = list(range(offset, min(offset + limit, total)))
+        return Response(200, {"count": total, "results": rows})
+
+    return MagicMock(side_effect=fetch)
+
+
+class TestIteratePages:
+    def test_yields_each_page(self):
+        fetch = _pager(5)
+        assert list(iterate_pages(fetch, limit=2)) == [[0, 1], [2, 3], [4]]
+        assert fetch.call_count == 3
+
+    def test_stops_at_count_on_full_page(self):
+        fetch = _pager(4)
+        assert list(iterate_pages(fetch, limit=2)) == [[0, 1], [2, 3]]
+        assert fetch.call_count == 2
+
+    def test_empty_collection(self):
+        assert list(iterate_pages(_pager(0), limit=2)) == []
+
+    def test_forwards_arguments(self):
+        fetch = _pager(1)
+        list(iterate_pages(fetch, 123, limit=10, offset=0, was_paid=True))
+        fetch.assert_called_once_with(123, limit=10, offset=0, was_paid=True)
+
+
+class TestIterateResults:
+    def test_flattens(self):
+        assert list(iterate_results(_pager(5), limit=2)) == [0, 1, 2, 3, 4]
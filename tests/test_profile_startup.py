@@ -0,0 +1,81 @@
+"""Tests for the start-up profiler in ``scripts/profile_startup.py``."""
+
+import os
+import sys
+from pathlib import Path
+
+# scripts/ is not a package; put it on the path so we can import the profiler.
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import mock_server  # noqa: E402
+import profile_startup  # noqa: E402
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 | encodings
+--- profile_startup ---
+import time:        50 |         50 |     charset_normalizer
+import time:       300 |        350 |   requests
+import time:        40 |        390 | etsy_python.v3.resources.Listing
+import time:        10 |         10 | json
+"""
+
+
+class TestParseImporttime:
+    def test_only_lines_after_marker(self):
+        entries = profile_startup.parse_importtime(IMPORTTIME)
+        assert [name for name, *_ in entries] == [
+            "charset_normalizer",
+            "requests",
+            "etsy_python.v3.resources.Listing",
+            "json",
+        ]
+
+    def test_depth_and_times(self):
+        entries = profile_startup.parse_importtime(IMPORTTIME)
+        assert entries[0] == ("charset_normalizer", 50, 50, 2)
+        assert entries[2] == ("etsy_python.v3.resources.Listing", 40, 390, 0)
+
+
+class TestCheckBudget:
+    RESULTS = {
+        "package": {"import_ms": 1.0, "modules": 2, "sdk_modules": 2},
+        "resources.Listing": {"import_ms": 120.0, "modules": 225, "sdk_modules": 29},
+        "resources.Shop": {"import_ms": 90.0, "modules": 223, "sdk_modules": 27},
+    }
+
+    def test_within_budget(self):
+        budget = {"package": {"modules": 10}, "resources.*": {"sdk_modules": 30}}
+        assert profile_startup.check_budget(self.RESULTS, budget) == []
+
+    def test_pattern_violations(self):
+        budget = {"resources.*": {"import_ms": 100, "sdk_modules": 28}}
+        assert profile_startup.check_budget(self.RESULTS, budget) == [
+            "resources.Listing: import_ms 120.0 > 100 (resources.*)",
+            "resources.Listing: sdk_modules 29 > 28 (resources.*)",
+        ]
+
+
+def test_every_resource_module_is_a_scenario():
+    names = profile_startup.scenarios()
+    assert "package" in names and "first_request" in names
+    assert "resources.Listing" in names
+    assert "resources.Session" not in names
+
+
+def test_profiles_package_import():
+    results = profile_startup.profile(["package"], repeat=1)
+    figures = results["package"]
+    assert 0 < figures["sdk_modules"] <= figures["modules"]
+    assert figures["import_ms"] >= 0
+
+
+def test_profiles_first_request_against_stub():
+    with mock_server.MockEtsyServer(limit_per_second=10**9, limit_per_day=10**9) as server:
+        env = dict(os.environ, ETSY_ENV="LOCAL", ETSY_LOCAL_URL=server.url)
+        results = profile_startup.profile(["first_request"], repeat=1, env=env)
+    figures = results["first_request"]
+    assert figures["modules"] > figures["sdk_modules"] > 0
+    assert figures["wall_ms"] > 0 and figures["import_ms"] > 0
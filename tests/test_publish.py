@@ -0,0 +1,175 @@
+import json
+import re
+import threading
+
+import pytest
+
+from etsy_python.v3.bulk.Publish import BulkPublisher, ListingSpec, PublishCheckpoint
+from etsy_python.v3.enums.Listing import State, WhenMade, WhoMade
+from etsy_python.v3.exceptions.RequestException import RequestException
+from etsy_python.v3.models.Listing import (
+    CreateDraftListingRequest,
+    UpdateListingInventoryRequest,
+    UpdateListingPropertyRequest,
+    UploadListingImageRequest,
+)
+from etsy_python.v3.models.Product import Product
+from etsy_python.v3.resources.Response import Response
+from etsy_python.v3.resources.enums.Request import Method
+
+from tests.conftest import MOCK_SHOP_ID
+
+
+class FakeEtsy:
+    """Routes make_request calls and records them in order."""
+
+    def __init__(self, fail=None):
+        self.calls = []
+        self.fail = fail or (lambda method, path: False)
+        self._next_id = 1000
+        self._lock = threading.Lock()
+
+    def __call__(self, path, method=Method.GET, payload=None, query_params=None):
+        with self._lock:
+            self.calls.append((method, path, payload))
+        if self.fail(method, path):
+            raise RequestException(500, "boom")
+        if method == Method.POST and path == f"/shops/{MOCK_SHOP_ID}/listings":
+            with self._lock:
+                self._next_id += 1
+                listing_id = self._next_id
+            return Response(201, {"listing_id": listing_id})
+        return Response(200, {})
+
+    def paths(self, method):
+        return [path for m, path, _ in self.calls if m == method]
+
+
+def _spec(key, images=2, with_properties=True):
+    return ListingSpec(
+        key=key,
+        draft=CreateDraftListingRequest(
+            quantity=1,
+            title=f"Listing {key}",
+            description="A thing",
+            price=10.0,
+            who_made=WhoMade.I_DID,
+            when_made=WhenMade.MADE_TO_ORDER,
+            taxonomy_id=1,
+        ),
+        images=[UploadListingImageRequest(b"img", rank=i + 1) for i in range(images)],
+        inventory=UpdateListingInventoryRequest(
+            products=[Product(sku=key, property_values=[], offerings=[])]
+        ),
+        properties={513: UpdateListingPropertyRequest(value_ids=[1], values=["Red"])}
+        if with_properties
+        else {},
+    )
+
+
+@pytest.fixture
+def fake(mock_session):
+    fake = FakeEtsy()
+    mock_session.make_request.side_effect = fake
+    return fake
+
+
+class TestPublish:
+    def test_steps_follow_dependency_graph(self, mock_session, fake):
+        results = BulkPublisher(mock_session, MOCK_SHOP_ID).publish(
+            [_spec("a"), _spec("b")]
+        )
+
+        assert all(result.ok for result in results)
+        assert {result.listing_id for result in results} == {1001, 1002}
+        for result in results:
+            listing_id = result.listing_id
+            paths = [path for _, path, _ in fake.calls]
+            activate = paths.index(f"/shops/{MOCK_SHOP_ID}/listings/{listing_id}")
+            uploads = [
+                i for i, p in enumerate(paths)
+                if p == f"/shops/{MOCK_SHOP_ID}/listings/{listing_id}/images"
+            ]
+            assert len(uploads) == 2
+            assert max(uploads) < activate
+            assert paths.index(f"/listings/{listing_id}/inventory") < activate
+            assert sorted(result.completed) == sorted(
+                ["draft", "image:0", "image:1", "inventory", "property:513", "activate"]
+            )
+
+        activations = [
+            payload for m, _, payload in fake.calls if m == Method.PATCH
+        ]
+        assert all(p.state == State.ACTIVE for p in activations)
+
+    def test_failure_skips_dependents_only(self, mock_session):
+        fake = FakeEtsy(
+            fail=lambda method, path: method == Method.PUT
+            and path == "/listings/1001/inventory"
+        )
+        mock_session.make_request.side_effect = fake
+
+        results = BulkPublisher(mock_session, MOCK_SHOP_ID, max_workers=1).publish(
+            [_spec("a"), _spec("b")]
+        )
+
+        assert not results[0].ok
+        assert results[0].failed_step == "inventory"
+        assert "activate" not in results[0].completed
+        assert results[1].ok
+        assert f"/shops/{MOCK_SHOP_ID}/listings/1001" not in fake.paths(Method.PATCH)
+
+    def test_duplicate_keys_rejected(self, mock_session, fake):
+        with pytest.raises(ValueError):
+            BulkPublisher(mock_session, MOCK_SHOP_ID).publish([_spec("a"), _spec("a")])
+
+    def test_scheduling_work_linear_in_steps(self, mock_session, fake):
+        publisher = BulkPublisher(mock_session, MOCK_SHOP_ID)
+        checks = []
+        is_done = publisher.checkpoint.is_done
+
+        def counted(key, step):
+            checks.append((key, step))
+            return is_done(key, step)
+
+        publisher.checkpoint.is_done = counted
+
+        results = publisher.publish([_spec(str(i)) for i in range(200)])
+
+        assert all(result.ok for result in results)
+        # 6 steps and 9 dependency edges per listing, each checked once.
+        assert len(checks) == 200 * (6 + 9)
+
+
+class TestResume:
+    def test_resume_skips_finished_steps(self, mock_session, tmp_path):
+        checkpoint = str(tmp_path / "publish.jsonl")
+        failing = FakeEtsy(
+            fail=lambda method, path: re.fullmatch(r"/shops/\d+/listings/\d+/images", path)
+            is not None
+        )
+        mock_session.make_request.side_effect = failing
+        first = BulkPublisher(mock_session, MOCK_SHOP_ID, checkpoint_path=checkpoint)
+        (result,) = first.publish([_spec("a", with_properties=False)])
+        assert not result.ok
+
+        resumed = FakeEtsy()
+        mock_session.make_request.side_effect = resumed
+        second = BulkPublisher(mock_session, MOCK_SHOP_ID, checkpoint_path=checkpoint)
+        (result,) = second.publish([_spec("a", with_properties=False)])
+
+        assert result.ok
+        assert result.listing_id == 1001
+        # No second draft, and the inventory update is not repeated.
+        assert f"/shops/{MOCK_SHOP_ID}/listings" not in resumed.paths(Method.POST)
+        assert "/listings/1001/inventory" not in resumed.paths(Method.PUT)
+        assert resumed.paths(Method.PATCH) == [f"/shops/{MOCK_SHOP_ID}/listings/1001"]
+
+    def test_torn_line_ignored(self, tmp_path):
+        path = tmp_path / "publish.jsonl"
+        path.write_text(
+            json.dumps({"key": "a", "step": "draft", "listing_id": 5}) + "\n" + '{"key": "a", "st'
+        )
+        checkpoint = PublishCheckpoint(str(path))
+        assert checkpoint.is_done("a", "draft")
+        assert checkpoint.listing_ids == {"a": 5}
@@ -0,0 +1,113 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from etsy_python.v3.common.Quota import QuotaTracker
+from etsy_python.v3.resources.enums.RateLimit import RateLimit
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _limits(remaining_today, remaining_this_second="9"):
+    return RateLimit("10", remaining_this_second, "10000", str(remaining_today))
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def tracker(clock):
+    return QuotaTracker(clock=clock)
+
+
+class TestObserve:
+    def test_unknown_until_headers_seen(self, tracker):
+        tracker.observe("GET /listings/{id}")
+        snapshot = tracker.snapshot()
+        assert snapshot.remaining_today is None
+        assert snapshot.seconds_until_exhausted is None
+        assert tracker.can_afford(10_000)
+
+    def test_headers_parsed(self, tracker):
+        tracker.observe("GET /listings/{id}", _limits(9000))
+        snapshot = tracker.snapshot()
+        assert snapshot.limit_per_day == 10000
+        assert snapshot.limit_per_second == 10
+        assert snapshot.remaining_today == 9000
+
+    def test_calls_without_headers_decrement_estimate(self, tracker):
+        tracker.observe("GET /listings/{id}", _limits(9000))
+        tracker.observe("GET /listings/{id}")
+        tracker.observe("GET /listings/{id}")
+        assert tracker.snapshot().remaining_today == 8998
+
+
+class TestForecast:
+    def test_rates_per_operation(self, tracker, clock):
+        for _ in range(3):
+            tracker.observe("GET /listings/{id}", _limits(9000))
+            clock.now += 60
+        tracker.observe("PUT /listings/{id}/inventory", _limits(8996))
+        clock.now += 60
+
+        snapshot = tracker.snapshot()
+        # Four calls in four minutes.
+        assert snapshot.calls_per_hour == pytest.approx(60.0)
+        assert snapshot.operation_rates["GET /listings/{id}"] == pytest.approx(45.0)
+        assert snapshot.seconds_until_exhausted == pytest.approx(8996 * 60.0)
+        assert snapshot.exhausted_at is not None
+
+    def test_old_calls_leave_window(self, clock):
+        tracker = QuotaTracker(window=600, clock=clock)
+        tracker.observe("GET /listings/{id}", _limits(9000))
+        clock.now += 3600
+        tracker.observe("GET /listings/{id}", _limits(8999))
+        assert tracker.snapshot().calls_per_hour == pytest.approx(6.0)
+
+
+class TestCanAfford:
+    def test_daily_budget_with_reserve(self, tracker, clock):
+        tracker.observe("GET /listings/{id}", _limits(100))
+        clock.now += 5
+        assert tracker.can_afford(100)
+        assert not tracker.can_afford(100, reserve=1)
+        assert tracker.can_afford(50, reserve=50)
+
+    def test_fresh_per_second_budget(self, tracker, clock):
+        tracker.observe("GET /listings/{id}", _limits(9000, remaining_this_second="0"))
+        assert not tracker.can_afford(1)
+        clock.now += 1
+        assert tracker.can_afford(1)
+
+    def test_large_batch_only_needs_one_second_of_room(self, tracker):
+        tracker.observe("GET /listings/{id}", _limits(9000, remaining_this_second="10"))
+        assert tracker.can_afford(500)
+
+
+class TestClientIntegration:
+    def test_client_tracks_responses(self, real_etsy_client):
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.json.return_value = {"listing_id": 1}
+        resp.headers = {
+            "X-Limit-Per-Second": "10",
+            "X-Remaining-This-Second": "9",
+            "X-Limit-Per-Day": "10000",
+            "X-Remaining-Today": "9876",
+        }
+        real_etsy_client._mock_http_session.get.return_value = resp
+
+        result = real_etsy_client.make_request("/listings/1")
+
+        assert result.rate_limits.limit_per_second == "10"
+        snapshot = real_etsy_client.quota.snapshot()
+        assert snapshot.remaining_today == 9876
+        assert "getListing" in snapshot.operation_rates
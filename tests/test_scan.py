@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+
+from etsy_python.v3.bulk.Scan import WindowScanner, split_window
+from etsy_python.v3.exceptions.RequestException import RequestException
+from etsy_python.v3.resources.Response import Response
+
+from tests.conftest import MOCK_SHOP_ID
+
+START, END = 1_700_000_000, 1_700_099_999
+
+
+def _records(id_key):
+    # 100 records a day apart, plus a burst of 900 in one hour.
+    created = [START + i * 1000 for i in range(100)]
+    created += [START + 50_000 + i * 4 for i in range(900)]
+    return sorted(
+        ({id_key: i + 1, "created_timestamp": ts} for i, ts in enumerate(created)),
+        key=lambda r: r["created_timestamp"],
+    )
+
+
+@pytest.fixture
+def routed(mock_session):
+    calls = []
+    lock = threading.Lock()
+
+    def make_request(path, method=None, payload=None, query_params=None):
+        id_key = "entry_id" if "ledger" in path else "receipt_id"
+        lo, hi = query_params["min_created"], query_params["max_created"]
+        with lock:
+            calls.append((path, query_params))
+        matching = [r for r in _records(id_key) if lo <= r["created_timestamp"] <= hi]
+        offset, limit = query_params["offset"], query_params["limit"]
+        if offset > 300:
+            raise RequestException(400, "deep offset")
+        return Response(
+            200, {"count": len(matching), "results": matching[offset : offset + limit]}
+        )
+
+    mock_session.make_request.side_effect = make_request
+    return calls
+
+
+class TestSplitWindow:
+    def test_contiguous_inclusive(self):
+        assert split_window((0, 9), 3) == [(0, 2), (3, 6), (7, 9)]
+
+    def test_never_narrower_than_a_second(self):
+        assert split_window((5, 6), 4) == [(5, 5), (6, 6)]
+
+
+class TestWindowScanner:
+    def test_receipts_complete_and_unique(self, mock_session, routed):
+        scanner = WindowScanner(mock_session, MOCK_SHOP_ID, max_window_count=200)
+
+        records = list(scanner.scan_receipts(START, END, was_paid=True))
+
+        assert sorted(r["receipt_id"] for r in records) == list(range(1, 1001))
+        assert all(q["offset"] < 200 for _, q in routed)
+        assert all(q["sort_order"] == "asc" and q["was_paid"] for _, q in routed)
+
+    def test_dense_windows_split_further(self, mock_session, routed):
+        scanner = WindowScanner(
+            mock_session, MOCK_SHOP_ID, max_window_count=200, initial_windows=2
+        )
+
+        list(scanner.scan_ledger_entries(START, END))
+
+        widths = {q["max_created"] - q["min_created"] + 1 for _, q in routed}
+        # Quiet stretches keep wide windows; the burst is cut narrow.
+        assert max(widths) >= 25_000 and min(widths) <= 2_000
+        assert scanner.windows_scanned > 2
+
+    def test_duplicates_across_windows_dropped(self, mock_session):
+        pages = {
+            0: Response(200, {"count": 2, "results": [{"entry_id": 1}, {"entry_id": 2}]}),
+        }
+
+        def make_request(path, method=None, payload=None, query_params=None):
+            return pages[query_params["offset"]]
+
+        mock_session.make_request.side_effect = make_request
+        scanner = WindowScanner(mock_session, MOCK_SHOP_ID, initial_windows=3)
+
+        assert sorted(r["entry_id"] for r in scanner.scan_ledger_entries(0, 299)) == [1, 2]
+
+    def test_errors_propagate(self, mock_session):
+        mock_session.make_request.side_effect = RequestException(500, "boom")
+        with pytest.raises(RequestException):
+            list(WindowScanner(mock_session, MOCK_SHOP_ID).scan_receipts(START, END))
+
+    def test_window_count_bounds(self, mock_session):
+        with pytest.raises(ValueError):
+            WindowScanner(mock_session, MOCK_SHOP_ID, max_window_count=50)
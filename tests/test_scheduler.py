@@ -0,0 +1,99 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from etsy_python.v3.common.RateLimiter import RateLimiter
+from etsy_python.v3.common.Scheduler import Lane, RequestScheduler
+
+
+class GatedLimiter:
+    """Blocks the first acquire until released and records grant order."""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.order = []
+        self._first = True
+
+    def acquire(self):
+        if self._first:
+            self._first = False
+            self.gate.wait(5)
+        self.order.append(threading.current_thread().name)
+        return 0.0
+
+
+def _run(scheduler, lanes):
+    """Hold the limiter with one call, queue ``lanes`` behind it, then release."""
+    limiter = scheduler.rate_limiter
+    blocker = threading.Thread(target=scheduler.acquire, name="blocker")
+    blocker.start()
+    while not scheduler._dispatching:
+        time.sleep(0.001)
+
+    threads = []
+    for i, lane in enumerate(lanes):
+        thread = threading.Thread(
+            target=scheduler.acquire, args=(lane,), name=f"{lane}-{i}"
+        )
+        thread.start()
+        threads.append(thread)
+        # Enqueue in a known order so ties resolve deterministically.
+        while sum(scheduler.pending().values()) <= i:
+            time.sleep(0.001)
+
+    limiter.gate.set()
+    for thread in [blocker, *threads]:
+        thread.join(5)
+    return [name.split("-")[0] for name in limiter.order[1:]]
+
+
+class TestOrdering:
+    def test_priority_lane_jumps_queue(self):
+        scheduler = RequestScheduler(rate_limiter=GatedLimiter())
+        order = _run(scheduler, ["bulk", "bulk", "interactive", "default", "bulk"])
+        assert order == ["interactive", "default", "bulk", "bulk", "bulk"]
+
+    def test_weighted_fair_queuing_within_priority(self):
+        scheduler = RequestScheduler(
+            rate_limiter=GatedLimiter(),
+            lanes={"a": Lane(weight=3), "b": Lane(weight=1), "default": Lane()},
+        )
+        order = _run(scheduler, ["b"] * 4 + ["a"] * 6)
+        assert order[:4].count("a") == 3
+        assert order.count("a") == 6
+
+    def test_lane_context(self):
+        limiter = MagicMock(spec=RateLimiter)
+        limiter.acquire.return_value = 0.0
+        scheduler = RequestScheduler(rate_limiter=limiter)
+        with scheduler.lane("bulk"):
+            scheduler.acquire()
+        assert scheduler._finish["bulk"] == 1.0
+        assert scheduler._finish["default"] == 0.0
+
+    def test_unknown_lane(self):
+        scheduler = RequestScheduler(rate_limiter=MagicMock(spec=RateLimiter))
+        with pytest.raises(ValueError):
+            scheduler.acquire("urgent")
+        with pytest.raises(ValueError):
+            with scheduler.lane("urgent"):
+                pass
+
+
+class TestClientIntegration:
+    def test_scheduler_takes_precedence(self, real_etsy_client):
+        scheduler = MagicMock(spec=RequestScheduler)
+        real_etsy_client.scheduler = scheduler
+        real_etsy_client.rate_limiter = MagicMock(spec=RateLimiter)
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.headers = {}
+        resp.json.return_value = {}
+        real_etsy_client._mock_http_session.get.return_value = resp
+
+        real_etsy_client.make_request("/listings/1")
+
+        scheduler.acquire.assert_called_once_with()
+        real_etsy_client.rate_limiter.acquire.assert_not_called()
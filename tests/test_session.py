@@ -2,6 +2,7 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
+from urllib3.util.request import ACCEPT_ENCODING
 
 from etsy_python.v3.common.Env import environment
 from etsy_python.v3.exceptions.RequestException import RequestException
@@ -36,6 +37,11 @@ class TestInit:
     def test_refresh_token_stored(self, real_etsy_client):
         assert real_etsy_client.refresh_token == MOCK_REFRESH_TOKEN
 
+    def test_compression_negotiated(self, real_etsy_client):
+        headers = real_etsy_client._mock_http_session.headers
+        assert headers["Accept-Encoding"] == ACCEPT_ENCODING
+        assert "gzip" in headers["Accept-Encoding"]
+
 
 class TestEnsureUtc:
     def test_naive_datetime_gets_utc(self):
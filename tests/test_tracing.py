@@ -0,0 +1,149 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from etsy_python.v3.common.Hedging import HedgePolicy
+from etsy_python.v3.exceptions.RequestException import RequestException
+from etsy_python.v3.resources.Session import EtsyClient
+
+from tests.conftest import MOCK_ACCESS_TOKEN, MOCK_KEYSTRING, MOCK_REFRESH_TOKEN
+
+sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import SpanKind, StatusCode  # noqa: E402
+
+
+def _response(status_code=200, json_data=None, headers=None):
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.headers = headers or {}
+    resp.json.return_value = json_data if json_data is not None else {"ok": True}
+    resp.content = b"{}"
+    return resp
+
+
+@pytest.fixture
+def traced():
+    exporter = InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    with patch("etsy_python.v3.resources.Session.Session") as session_cls:
+        http = MagicMock()
+        http.headers = {}
+        session_cls.return_value = http
+        client = EtsyClient(
+            MOCK_KEYSTRING,
+            MOCK_ACCESS_TOKEN,
+            MOCK_REFRESH_TOKEN,
+            expiry=datetime.now(tz=timezone.utc) + timedelta(hours=1),
+            tracer_provider=provider,
+        )
+        yield client, http, exporter
+
+
+class TestRequestSpans:
+    def test_span_attributes(self, traced):
+        client, http, exporter = traced
+        http.get.return_value = _response(
+            headers={
+                "X-Limit-Per-Second": "10",
+                "X-Remaining-This-Second": "9",
+                "X-Limit-Per-Day": "10000",
+                "X-Remaining-Today": "9876",
+            }
+        )
+
+        client.make_request("/listings/1")
+
+        (span,) = exporter.get_finished_spans()
+        assert span.name == "getListing"
+        assert span.attributes["url.template"] == "/listings/{id}"
+        assert span.kind == SpanKind.CLIENT
+        assert span.attributes["http.request.method"] == "GET"
+        assert span.attributes["http.response.status_code"] == 200
+        assert span.attributes["server.address"] == "openapi.etsy.com"
+        assert span.attributes["etsy.rate_limit.remaining_today"] == 9876
+
+    def test_error_status_marks_span(self, traced):
+        client, http, exporter = traced
+        http.get.return_value = _response(404, {"error": "missing"})
+
+        with pytest.raises(RequestException):
+            client.make_request("/listings/1")
+
+        (span,) = exporter.get_finished_spans()
+        assert span.status.status_code == StatusCode.ERROR
+        assert span.attributes["error.type"] == "404"
+        assert span.events[0].name == "exception"
+
+    def test_transport_error_marks_span(self, traced):
+        client, http, exporter = traced
+        http.get.side_effect = requests.ConnectionError("down")
+
+        with pytest.raises(requests.ConnectionError):
+            client.make_request("/listings/1")
+
+        (span,) = exporter.get_finished_spans()
+        assert span.attributes["error.type"] == "ConnectionError"
+
+    def test_hedged_resend_adds_retry_event(self, traced):
+        client, http, exporter = traced
+        client.hedging = HedgePolicy(initial_delay=0.02, max_hedge_ratio=1.0)
+        release = threading.Event()
+        responses = [_response(), _response()]
+
+        def get(url):
+            response = responses.pop()
+            if responses:
+                release.wait(5)
+            return response
+
+        http.get.side_effect = get
+
+        client.make_request("/listings/1")
+        release.set()
+        client.hedging.shutdown()
+
+        (span,) = exporter.get_finished_spans()
+        assert [e.name for e in span.events] == ["retry"]
+        assert span.events[0].attributes["http.request.resend_count"] == 1
+        assert span.attributes["http.request.resend_count"] == 1
+
+
+class TestTokenRefreshSpan:
+    def test_refresh_traced(self, traced):
+        client, http, exporter = traced
+        http.post.return_value = _response(
+            json_data={"access_token": "a.b", "refresh_token": "r", "expires_in": 3600}
+        )
+
+        client.update_token()
+
+        (span,) = exporter.get_finished_spans()
+        assert span.name == "etsy.oauth.refresh_token"
+
+
+class TestWithoutOpenTelemetry:
+    def test_no_hook_installed(self):
+        with patch("etsy_python.v3.common.Tracing.OTEL_AVAILABLE", False), patch(
+            "etsy_python.v3.resources.Session.Session"
+        ):
+            client = EtsyClient(
+                MOCK_KEYSTRING, MOCK_ACCESS_TOKEN, MOCK_REFRESH_TOKEN, datetime(2999, 1, 1)
+            )
+        assert client.tracing_hook is None
+        assert client.hooks == [client.quota]
+
+    def test_tracing_opt_out(self):
+        with patch("etsy_python.v3.resources.Session.Session"):
+            client = EtsyClient(
+                MOCK_KEYSTRING, MOCK_ACCESS_TOKEN, MOCK_REFRESH_TOKEN,
+                datetime(2999, 1, 1), tracing=False,
+            )
+        assert client.tracing_hook is None
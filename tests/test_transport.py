@@ -0,0 +1,159 @@
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from etsy_python.v3.common.Hooks import RequestHook
+from etsy_python.v3.common.Transport import HTTPXTransport
+from etsy_python.v3.models.Listing import UpdateListingRequest
+from etsy_python.v3.resources.Listing import ListingResource
+from etsy_python.v3.resources.Session import EtsyClient
+from etsy_python.v3.resources.enums.Request import Method
+
+from tests.conftest import (
+    MOCK_ACCESS_TOKEN,
+    MOCK_KEYSTRING,
+    MOCK_LISTING_ID,
+    MOCK_REFRESH_TOKEN,
+    MOCK_SHOP_ID,
+)
+
+# scripts/ is not a package; put it on the path so we can import the server.
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import mock_server  # noqa: E402
+
+
+def _client(transport, **kwargs):
+    return EtsyClient(
+        MOCK_KEYSTRING,
+        MOCK_ACCESS_TOKEN,
+        MOCK_REFRESH_TOKEN,
+        expiry=datetime.now(tz=timezone.utc) + timedelta(hours=1),
+        transport=transport,
+        **kwargs,
+    )
+
+
+class TestPluggableTransport:
+    def test_requests_session_is_default(self):
+        client = _client(None)
+        assert isinstance(client.session, requests.Session)
+        assert client.session.headers["x-api-key"] == MOCK_KEYSTRING
+
+    def test_missing_httpx_has_install_hint(self):
+        with patch.dict(sys.modules, {"httpx": None}):
+            with pytest.raises(ImportError, match=r"etsy-python\[http2\]"):
+                HTTPXTransport()
+
+
+httpx = pytest.importorskip("httpx")
+
+
+@pytest.fixture
+def routed():
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        if request.url.path.endswith("/boom"):
+            raise httpx.ConnectError("refused", request=request)
+        if request.url.path.endswith("/slow"):
+            raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(
+            200,
+            json={"listing_id": MOCK_LISTING_ID},
+            headers={
+                "X-Limit-Per-Second": "10",
+                "X-Remaining-This-Second": "9",
+                "X-Limit-Per-Day": "10000",
+                "X-Remaining-Today": "9000",
+            },
+        )
+
+    transport = HTTPXTransport(client=httpx.Client(transport=httpx.MockTransport(handler)))
+    return transport, requests_seen
+
+
+class TestHTTPXTransport:
+    def test_get_through_client(self, routed):
+        transport, seen = routed
+        client = _client(transport)
+
+        result = ListingResource(session=client).get_listing(MOCK_LISTING_ID)
+
+        assert result.code == 200
+        assert result.message == {"listing_id": MOCK_LISTING_ID}
+        assert result.rate_limits.remaining_today == "9000"
+        assert seen[0].headers["x-api-key"] == MOCK_KEYSTRING
+        assert seen[0].headers["authorization"] == f"Bearer {MOCK_ACCESS_TOKEN}"
+
+    def test_json_payload_and_event_sizes(self, routed):
+        transport, seen = routed
+        events = []
+        hook = RequestHook()
+        hook.after_response = events.append
+        client = _client(transport, hooks=[hook], tracing=False)
+
+        ListingResource(session=client).update_listing(
+            MOCK_SHOP_ID, MOCK_LISTING_ID, UpdateListingRequest(title="Mug")
+        )
+
+        assert seen[0].method == "PATCH"
+        assert json.loads(seen[0].content) == {"title": "Mug"}
+        assert events[0].operation == "updateListing"
+        assert events[0].bytes_sent == len(seen[0].content)
+        assert events[0].bytes_received > 0
+
+    @pytest.mark.parametrize(
+        "path, error", [("/boom", requests.ConnectionError), ("/slow", requests.Timeout)]
+    )
+    def test_errors_map_to_requests(self, routed, path, error):
+        transport, _ = routed
+        client = _client(transport)
+        with pytest.raises(error):
+            client.make_request(path, method=Method.GET)
+
+    def test_token_refresh_uses_transport(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            if request.url.path.endswith("/token"):
+                return httpx.Response(
+                    200,
+                    json={"access_token": "1.new", "refresh_token": "r2", "expires_in": 3600},
+                )
+            return httpx.Response(200, json={"ok": True})
+
+        transport = HTTPXTransport(client=httpx.Client(transport=httpx.MockTransport(handler)))
+        client = _client(transport)
+        client.expiry = datetime.now(tz=timezone.utc) - timedelta(seconds=1)
+
+        client.make_request("/listings/1")
+
+        assert seen[0].url.path.endswith("/token")
+        assert "authorization" not in seen[0].headers
+        assert seen[1].headers["authorization"] == "Bearer 1.new"
+
+    def test_connect_time_against_server(self):
+        events = []
+        hook = RequestHook()
+        hook.after_response = events.append
+        with mock_server.MockEtsyServer(limit_per_second=10**9, limit_per_day=10**9) as server:
+            with patch("etsy_python.v3.resources.Session.environment") as env:
+                env.request_url = server.request_url
+                with HTTPXTransport() as transport:
+                    client = _client(transport, hooks=[hook], tracing=False)
+                    client.make_request(f"/listings/{MOCK_LISTING_ID}")
+                    client.make_request(f"/listings/{MOCK_LISTING_ID}")
+
+        assert events[0].timings.connect > 0
+        assert events[1].timings.connect == 0.0
+        assert events[0].timings.ttfb is not None
@@ -1,10 +1,12 @@
 from enum import Enum
 
 from etsy_python.v3.common.Utils import (
+    encode_query,
     generate_bytes_from_file,
     generate_get_uri,
     todict,
 )
+from etsy_python.v3.enums.Listing import Includes, SortOn
 
 
 class TestGenerateGetUri:
@@ -44,6 +46,31 @@ class TestGenerateGetUri:
         result = generate_get_uri("/shops/123", {"was_paid": False})
         assert result == "/shops/123?was_paid=false"
 
+    def test_reserved_characters_encoded(self):
+        result = generate_get_uri("/listings/active", {"keywords": "mugs & cups #1"})
+        assert result == "/listings/active?keywords=mugs%20%26%20cups%20%231"
+
+    def test_non_ascii_encoded(self):
+        assert encode_query({"keywords": "café=ok"}) == "keywords=caf%C3%A9%3Dok"
+
+    def test_comma_joined_ids_unchanged(self):
+        assert encode_query({"listing_ids": "1,2,3"}) == "listing_ids=1,2,3"
+
+    def test_enum_sent_by_value(self):
+        assert encode_query({"sort_on": SortOn.UPDATED}) == "sort_on=updated"
+
+    def test_list_values_joined(self):
+        query = encode_query(
+            {"listing_ids": [1, 2, 3], "includes": [Includes.IMAGES, Includes.SHOP]}
+        )
+        assert query == "listing_ids=1,2,3&includes=Images,Shop"
+
+    def test_cached_pairs_are_per_parameter(self):
+        assert encode_query({"is_safe": True}) == "is_safe=true"
+        assert encode_query({"was_paid": True}) == "was_paid=true"
+        assert encode_query({"includes": [Includes.IMAGES]}) == "includes=Images"
+        assert encode_query({"includes": [Includes.SHOP]}) == "includes=Shop"
+
 
 class SampleEnum(Enum):
     VALUE_A = "alpha"
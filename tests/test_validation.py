@@ -0,0 +1,227 @@
+"""Tests for request-body validation generated from the OAS spec."""
+
+import enum
+import inspect
+import sys
+import typing
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from etsy_python.v3.common.Validation import compile_validator, get_validator, validate_body
+from etsy_python.v3.enums.Listing import State, WhenMade, WhoMade
+from etsy_python.v3.exceptions import RequestException, ValidationException
+from etsy_python.v3.models.FileRequest import FileRequest
+from etsy_python.v3.models.Request import Request
+from etsy_python.v3 import resources
+from etsy_python.v3.models.Listing import CreateDraftListingRequest, UpdateListingRequest
+from etsy_python.v3.resources.Listing import ListingResource
+from etsy_python.v3.resources.Session import EtsyClient
+from etsy_python.v3.resources.enums.Request import Method
+
+from tests.conftest import MOCK_LISTING_ID, MOCK_SHOP_ID
+
+# scripts/ is not a package; put it on the path so we can import the generator.
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import generate_validators  # noqa: E402
+
+
+def test_table_matches_baseline_spec():
+    spec = generate_validators.load_json(generate_validators.DEFAULT_SPEC)
+    assert generate_validators.DEFAULT_OUTPUT.read_text(
+        encoding="utf-8"
+    ) == generate_validators.render(spec), "run scripts/generate_validators.py"
+
+
+def _draft(**overrides):
+    fields = dict(
+        quantity=1,
+        title="Mug",
+        description="A mug",
+        price=10.0,
+        who_made=WhoMade.I_DID,
+        when_made=WhenMade.MADE_TO_ORDER,
+        taxonomy_id=1,
+    )
+    fields.update(overrides)
+    return CreateDraftListingRequest(**fields).get_dict()
+
+
+class TestListingRules:
+    def test_valid_draft(self):
+        validate_body("createDraftListing", _draft(tags=["mug"] * 13))
+
+    @pytest.mark.parametrize(
+        "overrides, message",
+        [
+            ({"title": "x" * 141}, "title: must be at most 140 characters"),
+            ({"tags": ["mug"] * 14}, "tags: allows at most 13 items"),
+            ({"tags": ["x" * 21]}, "tags: item 0 ('xxxxxxxxxxxxxxxxxxxxx') must be at most 20"),
+            ({"styles": ["a", "b", "c"]}, "styles: allows at most 2 items"),
+            ({"taxonomy_id": 0}, "taxonomy_id: must be >= 1"),
+            ({"price": 0}, "price: must be > 0"),
+            ({"quantity": "3"}, "quantity: must be of type integer"),
+        ],
+    )
+    def test_violations(self, overrides, message):
+        with pytest.raises(ValidationException) as info:
+            validate_body("createDraftListing", _draft(**overrides))
+        assert info.value.errors[0].startswith(message)
+        assert info.value.code == 400 and info.value.operation == "createDraftListing"
+
+    def test_enum(self):
+        body = UpdateListingRequest(state=State.DRAFT).get_dict()
+        with pytest.raises(ValidationException, match="state: must be one of 'active', 'inactive'"):
+            validate_body("updateListing", body)
+
+    def test_all_errors_reported(self):
+        with pytest.raises(ValidationException) as info:
+            validate_body("updateListing", {"title": "x" * 141, "taxonomy_id": -1})
+        assert len(info.value.errors) == 2
+
+    def test_nulls_and_unknown_fields(self):
+        validate_body("updateListing", {"tags": None, "not_in_spec": object()})
+        with pytest.raises(ValidationException, match="title: must not be null"):
+            validate_body("updateListing", {"title": None})
+        validate_body("updateListing", {"title": None}, nullable=["title"])
+
+
+def test_compiled_once_and_unknown_operations_pass():
+    assert get_validator("updateListing") is get_validator("updateListing")
+    assert get_validator("getListing") is None
+    validate_body("getListing", {"anything": 1})
+
+
+def test_compile_validator_generic():
+    validate = compile_validator(
+        {"codes": {"type": "array", "items": {"enum": ["a", "b"]}, "minItems": 1}}
+    )
+    assert validate({"codes": ["a"]}) == []
+    assert validate({"codes": []}) == ["codes: needs at least 1 items"]
+    assert validate({"codes": [["a"]]}) == ["codes: item 0 (['a']) must be one of 'a', 'b'"]
+
+
+class TestClientValidation:
+    def test_invalid_payload_never_sent(self, real_etsy_client):
+        request = UpdateListingRequest(title="x" * 141)
+
+        with pytest.raises(RequestException):
+            ListingResource(session=real_etsy_client).update_listing(
+                MOCK_SHOP_ID, MOCK_LISTING_ID, request
+            )
+
+        real_etsy_client._mock_http_session.patch.assert_not_called()
+
+    def test_opt_out(self, real_etsy_client):
+        real_etsy_client.validate = False
+        real_etsy_client._mock_http_session.patch.return_value.status_code = 200
+        real_etsy_client._mock_http_session.patch.return_value.headers = {}
+        real_etsy_client._mock_http_session.patch.return_value.json.return_value = {}
+
+        real_etsy_client.make_request(
+            f"/shops/{MOCK_SHOP_ID}/listings/{MOCK_LISTING_ID}",
+            method=Method.PATCH,
+            payload=UpdateListingRequest(title="x" * 141),
+        )
+
+        real_etsy_client._mock_http_session.patch.assert_called_once()
+
+    def test_body_serialized_once(self, real_etsy_client):
+        http = real_etsy_client._mock_http_session
+        http.patch.return_value.status_code = 200
+        http.patch.return_value.headers = {}
+        http.patch.return_value.json.return_value = {}
+        request = UpdateListingRequest(title="Mug")
+
+        with patch.object(request, "get_dict", wraps=request.get_dict) as get_dict:
+            ListingResource(session=real_etsy_client).update_listing(
+                MOCK_SHOP_ID, MOCK_LISTING_ID, request
+            )
+
+        get_dict.assert_called_once_with()
+        assert http.patch.call_args.kwargs["json"] == {"title": "Mug"}
+
+
+def _base(hint):
+    if typing.get_origin(hint) is typing.Union:
+        return _base(next(a for a in typing.get_args(hint) if a is not type(None)))
+    return hint
+
+
+def _sample(hint):
+    kind = _base(hint)
+    if typing.get_origin(kind) is list:
+        return []
+    if isinstance(kind, type) and issubclass(kind, enum.Enum):
+        return next(iter(kind), 1)
+    return {str: "x", float: 1.0, bool: True}.get(kind, 1)
+
+
+def _clear(hint):
+    kind = _base(hint)
+    return [] if typing.get_origin(kind) is list else "" if kind is str else 0
+
+
+# Constructor parameters stored under another attribute name.
+_ATTRIBUTES = {"profile_type": "_type"}
+
+
+def _model(model, clear):
+    """``model`` with its defaults, only mandatory fields filled in; with
+    ``clear``, every nullable field gets the value that clears it."""
+    hints = typing.get_type_hints(model.__init__)
+    kwargs = {}
+    for param in list(inspect.signature(model.__init__).parameters.values())[1:]:
+        attribute = _ATTRIBUTES.get(param.name, param.name)
+        if param.default is inspect.Parameter.empty or (
+            param.default is None and attribute in model.mandatory
+        ):
+            kwargs[param.name] = _sample(hints.get(param.name))
+        if clear and attribute in model.nullable:
+            kwargs[param.name] = _clear(hints.get(param.name))
+    return model(**kwargs)
+
+
+def _model_calls():
+    """(resource, method, its Request parameter, the model) for every model."""
+    calls = []
+    for name in resources._LAZY:
+        if not name.endswith("Resource"):
+            continue
+        resource = getattr(resources, name)
+        for _, method in inspect.getmembers(resource, inspect.isfunction):
+            for param, hint in typing.get_type_hints(method).items():
+                model = _base(hint)
+                if (
+                    isinstance(model, type)
+                    and issubclass(model, Request)
+                    and not issubclass(model, FileRequest)
+                ):
+                    calls.append(
+                        pytest.param(resource, method, param, model, id=model.__name__)
+                    )
+    return calls
+
+
+@pytest.mark.parametrize("clear", [False, True], ids=["defaults", "cleared"])
+@pytest.mark.parametrize("resource, method, param, model", _model_calls())
+def test_sdk_models_pass_validation(resource, method, param, model, clear):
+    session = MagicMock()
+    hints = typing.get_type_hints(method)
+    kwargs = {
+        p.name: _sample(hints.get(p.name))
+        for p in list(inspect.signature(method).parameters.values())[1:]
+        if p.default is inspect.Parameter.empty
+    }
+    kwargs[param] = _model(model, clear)
+    method(resource(session), **kwargs)
+    call = session.make_request.call_args
+    payload = call.kwargs["payload"]
+
+    EtsyClient._validate(
+        call.kwargs["method"], call.args[0], payload.get_dict(), payload.get_nulled()
+    )